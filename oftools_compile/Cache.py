@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to handle the incremental build cache of the compile sections.
+
+Typical usage example:
+  key = Cache().get_key(section_no_filter, shell_command, file_context,
+                        file_name_in, profile)
+  if Cache().restore(key, file_context.current_workdir) is False:
+      snapshot = Cache().snapshot(file_context.current_workdir)
+      Cache().store(key, file_context.current_workdir, snapshot)
+"""
+
+# Generic/Built-in modules
+import fnmatch
+import glob
+import hashlib
+import os
+import shutil
+import threading
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context, SingletonMeta
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .handlers.ShellHandler import ShellHandler
+from .Log import Log
+
+
+class Cache(metaclass=SingletonMeta):
+    """A class used to store the outputs of the compile sections and restore
+    them when the same compilation is requested again.
+
+    Each entry of the cache is a directory named after a SHA-256 key computed
+    from the input file content, the compiler command with its environment
+    variables expanded, the environment variables of the file processing and
+    the identity of the compiler binary. Entries are stored in the cache
+    directory of the root working directory, so they persist across
+    executions.
+
+    The files read by the compiler besides the input file, such as copybooks
+    and includes, are not known. They are only part of the key if they match
+    the cache_files option of the setup section, and the inherited
+    environment variables only if they match the cache_env option, which is
+    why the cache is only used with the cache option.
+
+    Attributes:
+        _excluded_prefix {string} -- Prefix of the files of the working
+            directory never stored in the cache, such as the log file and the
+            output files of the commands.
+        _default_env {string} -- Patterns of the environment variables read
+            by the compilers, used without the cache_env option.
+        _dependencies {dictionary} -- Identity of the dependency files of each
+            list of patterns, computed once per execution.
+
+    Methods:
+        _get_cache_directory() -- Gets the absolute path of the cache
+            directory.
+        _get_entry_directory(key) -- Gets the absolute path of the directory
+            of a cache entry.
+        _hash_file(path, digest) -- Updates the digest with the content of the
+            file.
+        _hash_environment(patterns, file_context, digest) -- Updates the
+            digest with the environment variables read by the compiler.
+        _hash_dependencies(patterns, file_context, digest) -- Updates the
+            digest with the identity of the dependency files.
+        get_key(section_no_filter, shell_command, file_context, file_name_in,
+            profile) -- Computes the key of the compilation.
+        snapshot(working_directory) -- Lists the files of the working
+            directory with their size and modification time.
+        restore(key, working_directory) -- Copies the files of the cache entry
+            to the working directory.
+        store(key, working_directory, snapshot) -- Copies the files created or
+            modified since the snapshot to a new cache entry.
+        clear() -- Forgets the dependency files listed during the execution.
+    """
+
+    def __init__(self):
+        """Initializes all attributes of the class.
+        """
+        self._excluded_prefix = "oftools_compile."
+        self._default_env = "COB*:OF*:OPENFRAME_HOME:LD_LIBRARY_PATH"
+        self._dependencies = {}
+
+    @staticmethod
+    def _get_cache_directory():
+        """Gets the absolute path of the cache directory.
+
+        Returns:
+            string -- Absolute path of the cache directory.
+        """
+        return os.path.join(Context().root_workdir, "cache")
+
+    def _get_entry_directory(self, key):
+        """Gets the absolute path of the directory of a cache entry.
+
+        The entries are spread in sub-directories named after the first two
+        characters of their key, to keep the directories small.
+
+        Arguments:
+            key {string} -- Key of the cache entry.
+
+        Returns:
+            string -- Absolute path of the directory of the cache entry.
+        """
+        return os.path.join(self._get_cache_directory(), key[:2], key)
+
+    @staticmethod
+    def _hash_file(path, digest):
+        """Updates the digest with the content of the file.
+
+        Arguments:
+            path {string} -- Absolute path of the file.
+            digest {hashlib object} -- Digest being computed.
+        """
+        with open(path, "rb") as fd:
+            for chunk in iter(lambda: fd.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+    @staticmethod
+    def _hash_environment(patterns, file_context, digest):
+        """Updates the digest with the environment variables read by the
+        compiler.
+
+        The variables of the file processing are left out, as they are
+        already part of the key.
+
+        Arguments:
+            patterns {string} -- Colon-separated list of names or patterns of
+                the environment variables.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+            digest {hashlib object} -- Digest being computed.
+        """
+        patterns = [pattern for pattern in patterns.split(":") if pattern]
+
+        for key, value in sorted(file_context.env.items()):
+            if key in file_context.variables:
+                continue
+            if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns):
+                digest.update(("%s=%s" % (key, value)).encode("utf_8") + b"\0")
+
+    def _hash_dependencies(self, patterns, file_context, digest):
+        """Updates the digest with the identity of the dependency files.
+
+        The files are identified by their path, size and modification time,
+        like the compiler binary, and only listed once per execution for each
+        list of patterns.
+
+        Arguments:
+            patterns {string} -- Colon-separated list of glob patterns of the
+                dependency files, with environment variables.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+            digest {hashlib object} -- Digest being computed.
+
+        Raises:
+            OSError -- Exception raised if a dependency file cannot be read.
+        """
+        patterns = file_context.expandvars(patterns)
+
+        if patterns not in self._dependencies:
+            dependencies = hashlib.sha256()
+            for pattern in patterns.split(":"):
+                for path in sorted(glob.glob(pattern)):
+                    stat = os.stat(path)
+                    dependencies.update(
+                        ("%s:%d:%d" % (path, stat.st_size,
+                                       stat.st_mtime_ns)).encode("utf_8") +
+                        b"\0")
+            self._dependencies[patterns] = dependencies.hexdigest()
+
+        digest.update(self._dependencies[patterns].encode("utf_8") + b"\0")
+
+    def get_key(self, section_no_filter, shell_command, file_context,
+                file_name_in, profile):
+        """Computes the key of the compilation.
+
+        Arguments:
+            section_no_filter {string} -- Name of the compile section without
+                filter, which is also the name of the compiler.
+            shell_command {string} -- Compiler command with its environment
+                variables expanded.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+            file_name_in {string} -- Name of the input file of the section.
+            profile {Profile} -- Profile object of the current source, with
+                the cache_env and cache_files options of the setup section.
+
+        Returns:
+            string -- Key of the compilation, or None if it cannot be computed.
+
+        Raises:
+            OSError -- Exception raised if the input file or the compiler
+                cannot be read.
+        """
+        digest = hashlib.sha256()
+
+        try:
+            # Content of the input file
+            if file_name_in.startswith("\\"):
+                file_name_in = file_name_in[1:]
+            self._hash_file(
+                os.path.join(file_context.current_workdir, file_name_in),
+                digest)
+
+            # Resolved compiler command
+            digest.update(section_no_filter.encode("utf_8") + b"\0")
+            digest.update(shell_command.encode("utf_8") + b"\0")
+
+            # Environment variables of the file processing, except the path of
+            # the source file which does not change the compilation
+            for key, value in sorted(file_context.variables.items()):
+                if key != "OF_COMPILE_SOURCE":
+                    digest.update(("%s=%s" % (key, value)).encode("utf_8") +
+                                  b"\0")
+
+            # Inherited environment variables and dependency files
+            setup = profile.data["setup"]
+            self._hash_environment(
+                setup.get("cache_env", self._default_env), file_context,
+                digest)
+            self._hash_dependencies(setup.get("cache_files", ""),
+                                    file_context, digest)
+
+            # Identity of the compiler binary
+            compiler = ShellHandler().resolve_command(section_no_filter,
+                                                      file_context.env)
+            if compiler is None:
+                return None
+            compiler = os.path.realpath(compiler)
+            stat = os.stat(compiler)
+            digest.update(("%s:%d:%d" % (compiler, stat.st_size,
+                                         stat.st_mtime_ns)).encode("utf_8"))
+        except OSError as error:
+            Log().logger.debug(ErrorMessage.OS_CACHE.value % error)
+            return None
+
+        return digest.hexdigest()
+
+    def snapshot(self, working_directory):
+        """Lists the files of the working directory with their size and
+        modification time.
+
+        Arguments:
+            working_directory {string} -- Absolute path of the working
+                directory.
+
+        Returns:
+            dictionary -- File names and their size and modification time.
+        """
+        files = {}
+
+        with os.scandir(working_directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith(
+                        self._excluded_prefix):
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+
+        return files
+
+    def restore(self, key, working_directory):
+        """Copies the files of the cache entry to the working directory.
+
+        Arguments:
+            key {string} -- Key of the cache entry.
+            working_directory {string} -- Absolute path of the working
+                directory.
+
+        Returns:
+            boolean -- True if the cache entry has been restored, and False
+                otherwise.
+
+        Raises:
+            OSError -- Exception raised if the cache entry cannot be copied.
+        """
+        if key is None:
+            return False
+
+        entry_directory = self._get_entry_directory(key)
+        if not os.path.isdir(entry_directory):
+            return False
+
+        try:
+            with os.scandir(entry_directory) as entries:
+                for entry in entries:
+                    shutil.copy2(entry.path,
+                                 os.path.join(working_directory, entry.name))
+        except OSError as error:
+            Log().logger.warning(ErrorMessage.OS_CACHE.value % error)
+            return False
+
+        Log().logger.debug(LogMessage.CACHE_RESTORE.value %
+                           (key, entry_directory))
+        return True
+
+    def store(self, key, working_directory, snapshot):
+        """Copies the files created or modified since the snapshot to a new
+        cache entry.
+
+        The entry is first written in a temporary directory then renamed, so
+        that a concurrent execution never restores an incomplete entry. The
+        temporary directory is unique to the process and the thread.
+
+        Arguments:
+            key {string} -- Key of the cache entry.
+            working_directory {string} -- Absolute path of the working
+                directory.
+            snapshot {dictionary} -- Files of the working directory before the
+                compilation.
+
+        Raises:
+            OSError -- Exception raised if the cache entry cannot be written.
+        """
+        if key is None:
+            return
+
+        entry_directory = self._get_entry_directory(key)
+        temp_directory = os.path.join(
+            os.path.dirname(entry_directory),
+            ".%s.%d.%d" % (key, os.getpid(), threading.get_ident()))
+
+        try:
+            os.makedirs(temp_directory)
+            for name, status in self.snapshot(working_directory).items():
+                if snapshot.get(name) != status:
+                    shutil.copy2(os.path.join(working_directory, name),
+                                 os.path.join(temp_directory, name))
+            os.rename(temp_directory, entry_directory)
+        except OSError as error:
+            # Entry already stored by a concurrent execution, or write failure
+            if not os.path.isdir(entry_directory):
+                Log().logger.warning(ErrorMessage.OS_CACHE.value % error)
+            shutil.rmtree(temp_directory, ignore_errors=True)
+        else:
+            Log().logger.debug(LogMessage.CACHE_STORE.value %
+                               (key, entry_directory))
+
+    def clear(self):
+        """Forgets the dependency files listed during the execution, so that
+        the next execution lists them again.
+        """
+        self._dependencies = {}
@@ -6,7 +6,7 @@ check only of the compilation process is running fine.
   Typical usage example:
 
   clear = Clear()
-  clear.run()
+  clear.run(file_name_in, file_context)
 """
 
 # Generic/Built-in modules
@@ -14,8 +14,7 @@ check only of the compilation process is running fine.
 # Third-party modules
 
 # Owned modules
-from .Context import Context
-from .handlers.FileHandler import FileHandler
+from .Trash import Trash
 
 
 class Clear():
@@ -23,7 +22,8 @@ class Clear():
 
     Methods:
         __init__() -- Initializes the class with all the attributes.
-        run() -- General run method to execute the clear option.
+        run(file_name_in, file_context) -- General run method to execute the
+            clear option.
     """
 
     def __init__(self):
@@ -37,16 +37,27 @@ class Clear():
         """
         return self._file_name_out
 
-    def run(self, file_name_in):
+    @property
+    def section_name(self):
+        """Name of the section in the history of the processing.
+        """
+        return "clear"
+
+    def run(self, file_name_in, file_context):
         """General run method to execute the clear option.
 
         Removes the current working directory created during the given
-        execution.
+        execution, in the background through the trash.
+
+        Arguments:
+            file_name_in {string} -- Name of the input file.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
 
         Returns:
             integer -- Return code of the method.
         """
         self._file_name_out = file_name_in
-        return_code = FileHandler().delete_directory(Context().current_workdir)
+        return_code = Trash().discard(file_context.current_workdir)
 
         return return_code
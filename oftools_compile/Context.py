@@ -4,19 +4,19 @@
 
 Typical usage example:
   Context().tag = args.tag
-  Context().clear()
+  Context().clear_all()
 """
 
 # Generic/Built-in modules
 import datetime
+import itertools
 import os
-import sys
+import re
+import zlib
 
 # Third-party modules
 
 # Owned modules
-from .enums.ErrorEnum import ErrorMessage
-from .Log import Log
 from .handlers.ShellHandler import ShellHandler
 
 
@@ -40,21 +40,21 @@ class Context(metaclass=SingletonMeta):
     """A class used to store a set of variables and parameters across all
     modules for the execution of the program.
 
+    The variables and parameters specific to the processing of one source file
+    are stored in the FileContext instead.
+
     Attributes:
-        _init_env {dictionary} -- Output of the os.environ.copy method.
-        _env {dictionary} -- All the environment variables for the current
-            execution of the program.
+        _env {dictionary} -- Output of the os.environ.copy method, environment
+            variables shared by all the file processings.
 
         _root_workdir {string} -- Absolute path of the root working directory.
         _exec_working_dir {string} -- Absolute path of the working directory
             where new working directories are created and files processed.
-        _current_workdir {string} -- Absolute path of the current working
-            directory.
-
-        _last_section {string} -- Name of the last section being executed,
-            whether it succeeds or fails.
-
-        _filters {dictionary} -- Filter names and their respective values.
+        _tmpfs {string} -- Absolute path of the tmpfs directory where the
+            working directories are created with the clear option, empty if
+            not used.
+        _layout {string} -- Layout of the working directories, either flat,
+            hash or date.
 
         _report_file_path {string} -- Absolute path of the report file of the
             compilation.
@@ -62,6 +62,14 @@ class Context(metaclass=SingletonMeta):
         _grouping {boolean} -- Flag used to group all working directories into
             one group directory.
         _force {boolean} -- Flag used to force source files if not found or not.
+        _cache {boolean} -- Flag used to restore the outputs of the compile
+            sections from the cache when possible.
+        _deploy_mode {string} -- Mode of the deploy sections, either inline
+            or batch.
+        _redeploy {boolean} -- Flag used to deploy the modules even if they
+            are unchanged since their last deployment.
+        _history {boolean} -- Flag used to record the execution in the history
+            database.
 
         _skip {string} -- Keyword to define section to skip.
 
@@ -69,39 +77,35 @@ class Context(metaclass=SingletonMeta):
 
         _time_stamp {Datetime} -- Date and time for working directories and
             report identification purposes.
+        _sequence {count} -- Sequence number of the working directories
+            created during the execution.
 
-        _init_pwd {string} -- Absolute path of the initial directory where the
-            command has been executed.
+        _interrupt {boolean} -- Flag set when the user press Ctrl + \\ to
+            interrupt the entire program execution.
 
     Methods:
         __init__() -- Initializes all attributes of the class.
-        add_env_variable(key, value) -- Adds a variable to the environment.
-        add_filter(key, value) -- Adds a filter function to the list of filters.
-        get_filter_function(key) -- Retrieves the expression of the filter
-            function from theContext.
-
-        clear() -- Clears context after each file processing.
         clear_all() -- Clears context completely at the end of the program
             execution.
+        next_workdir_id() -- Gets a unique identifier for a new working
+            directory.
+        get_bucket(key) -- Gets the name of the bucket directory of a working
+            directory.
+        is_bucket(name) -- Checks if the directory is a bucket directory.
+        is_skip(section_name_no_filter) -- Checks if the section is skipped.
     """
 
     def __init__(self):
         """Initializes all attributes of the class.
         """
         # Environment
-        self._init_env = os.environ.copy()
-        self._env = self._init_env
+        self._env = os.environ.copy()
 
         # Directories
         self._root_workdir = ""
         self._exec_working_dir = ""
-        self._current_workdir = ""
-
-        # Profile sections
-        self._last_section = ""
-
-        # Filter variables
-        self._filters = {}
+        self._tmpfs = ""
+        self._layout = "flat"
 
         # Report
         self._report_file_path = ""
@@ -109,6 +113,10 @@ class Context(metaclass=SingletonMeta):
         # Argument flags
         self._grouping = False
         self._force = False
+        self._cache = False
+        self._deploy_mode = "inline"
+        self._redeploy = False
+        self._history = False
         self._skip = ""
 
         # Tag
@@ -116,9 +124,10 @@ class Context(metaclass=SingletonMeta):
 
         # Timestamp
         self._time_stamp = datetime.datetime.now()
+        self._sequence = itertools.count(1)
 
         # Other
-        self._init_pwd = os.getcwd()
+        self._interrupt = False
 
     @property
     def env(self):
@@ -151,34 +160,28 @@ class Context(metaclass=SingletonMeta):
         self._exec_working_dir = os.path.expandvars(working_dir)
 
     @property
-    def current_workdir(self):
-        """Getter method for the attribute _current_workdir.
+    def tmpfs(self):
+        """Getter method for the attribute _tmpfs.
         """
-        return self._current_workdir
+        return self._tmpfs
 
-    @current_workdir.setter
-    def current_workdir(self, working_dir):
-        """Setter method for the attribute _current_workdir.
+    @tmpfs.setter
+    def tmpfs(self, tmpfs):
+        """Setter method for the attribute _tmpfs.
         """
-        self._current_workdir = working_dir
+        self._tmpfs = os.path.expandvars(tmpfs)
 
     @property
-    def last_section(self):
-        """Getter method for the attribute _last_section.
-        """
-        return self._last_section
-
-    @last_section.setter
-    def last_section(self, section):
-        """Setter method for the attribute _last_section.
+    def layout(self):
+        """Getter method for the attribute _layout.
         """
-        self._last_section = section
+        return self._layout
 
-    @property
-    def filters(self):
-        """Getter method for the attribute _filters.
+    @layout.setter
+    def layout(self, layout):
+        """Setter method for the attribute _layout.
         """
-        return self._filters
+        self._layout = layout
 
     @property
     def report_file_path(self):
@@ -218,6 +221,58 @@ class Context(metaclass=SingletonMeta):
         if force is not None:
             self._force = force
 
+    @property
+    def cache(self):
+        """Getter method for the attribute _cache.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        """Setter method for the attribute _cache.
+        """
+        if cache is not None:
+            self._cache = cache
+
+    @property
+    def deploy_mode(self):
+        """Getter method for the attribute _deploy_mode.
+        """
+        return self._deploy_mode
+
+    @deploy_mode.setter
+    def deploy_mode(self, deploy_mode):
+        """Setter method for the attribute _deploy_mode.
+        """
+        if deploy_mode is not None:
+            self._deploy_mode = deploy_mode
+
+    @property
+    def redeploy(self):
+        """Getter method for the attribute _redeploy.
+        """
+        return self._redeploy
+
+    @redeploy.setter
+    def redeploy(self, redeploy):
+        """Setter method for the attribute _redeploy.
+        """
+        if redeploy is not None:
+            self._redeploy = redeploy
+
+    @property
+    def history(self):
+        """Getter method for the attribute _history.
+        """
+        return self._history
+
+    @history.setter
+    def history(self, history):
+        """Setter method for the attribute _history.
+        """
+        if history is not None:
+            self._history = history
+
     @property
     def skip(self):
         """Getter method for the attribute _skip.
@@ -254,104 +309,78 @@ class Context(metaclass=SingletonMeta):
         """
         return self._time_stamp.strftime("_%Y%m%d_%H%M%S")
 
-    @time_stamp.setter
-    def time_stamp(self, update):
-        """Setter method for the attribute _time_stamp.
-
-        Arguments:
-            update {integer} -- Number of seconds needed to update the time
-                stamp.
+    @property
+    def interrupt(self):
+        """Getter method for the attribute _interrupt.
         """
-        time_update = datetime.timedelta(seconds=update)
-        self._time_stamp += time_update
-
-    def add_env_variable(self, key, value):
-        """Adds a variable to the environment.
+        return self._interrupt
 
-        Arguments:
-            key {string} -- Name of the environment variable.
-            value {string} -- Value of the environment variable.
+    @interrupt.setter
+    def interrupt(self, interrupt):
+        """Setter method for the attribute _interrupt.
         """
-        if not value.startswith("$(") and not value.startswith("`"):
-            self._env[key[1:]] = os.path.expandvars(value)
-        else:
-            if value.startswith("$(") and value.endswith(")"):
-                value = value[2:-1]
-            elif value.startswith("`") and value.endswith("`"):
-                value = value[1:-1]
-            out, _, _ = ShellHandler().execute_command(value, "env_variable",
-                                                       self._env)
-            value = out.rstrip()
-            # Write to env dictionary without dollar sign
-            self._env[key[1:]] = value
-
-        os.environ.update(self._env)
-
-    def add_filter(self, key, value):
-        """Adds a filter function to the list of filters.
+        self._interrupt = interrupt
 
-        Arguments:
-            key {string} -- Name of the filter function.
-            value {string} -- Expression of the filter function.
+    def clear_all(self):
+        """Clears context completely at the end of the program execution.
         """
-        # Remove question mark from filter function name
-        self._filters[key[1:]] = value
+        self._root_workdir = ""
+        self._exec_working_dir = ""
+        self._tmpfs = ""
+        self._layout = "flat"
+
+        self._report_file_path = ""
+        self._tag = ""
+        self._time_stamp = datetime.datetime.now()
+        self._sequence = itertools.count(1)
 
-    def get_filter_function(self, key):
-        """Retrieves the expression of the filter function from the Context.
+    def next_workdir_id(self):
+        """Gets a unique identifier for a new working directory.
 
-        Arguments:
-            key {string} -- Name of the filter function.
+        The identifier is made of the process id and of a sequence number of
+        the execution, so that the working directories created during the
+        same second, by the same execution or by concurrent ones, never get
+        the same name.
 
         Returns:
-            string -- Expression of the filter function.
-
-        Raises:
-            KeyError -- Exception raised if a filter function is used in the
-                profile before being defined.
+            string -- Identifier appended to the name of the working
+                directory.
         """
-        try:
-            if key == "":
-                filter_function = ""
-            else:
-                filter_function = self.filters[key]
-        except KeyError:
-            Log().logger.error(ErrorMessage.KEY_FILTER.value % key)
-            self.clear_all()
-            sys.exit(-1)
+        return "_%d_%d" % (os.getpid(), next(self._sequence))
 
-        return filter_function
+    def get_bucket(self, key):
+        """Gets the name of the bucket directory of a working directory.
 
-    def clear(self, profile):
-        """Clears context after each file processing.
+        With the hash layout, the working directories are spread over 256
+        buckets based on the name of the source file, so that all the working
+        directories of a source file are in the same bucket. With the date
+        layout, the bucket is the date of the execution.
 
         Arguments:
-            profile {Profile object} -- From the Profile module.
+            key {string} -- Name of the source file, or of the group directory.
+
+        Returns:
+            string -- Name of the bucket directory, empty with the flat layout.
         """
-        self._env = self._init_env
-        os.environ.update(self._init_env)
+        if self._layout == "hash":
+            return "%02x" % (zlib.crc32(key.encode("utf_8")) & 0xff)
+        if self._layout == "date":
+            return self._time_stamp.strftime("%Y%m%d")
 
-        self._current_workdir = ""
+        return ""
 
-        self._filters.clear()
-        for key in profile.sections_complete.keys():
-            profile.sections_complete[key] = Context().is_skip(key)
+    @staticmethod
+    def is_bucket(name):
+        """Checks if the directory is a bucket directory, whatever the layout
+        of the current execution.
 
-        os.chdir(self._init_pwd)
+        Arguments:
+            name {string} -- Name of the directory.
 
-    def clear_all(self):
-        """Clears context completely at the end of the program execution.
+        Returns:
+            boolean -- True if the directory is a bucket, False otherwise.
         """
-        self._root_workdir = ""
-        self._exec_working_dir = ""
-
-        self._filters = {}
-        self._last_section = ""
-        self._report_file_path = ""
-        self._tag = ""
-        self._time_stamp = datetime.datetime.now()
-
-        os.chdir(self._init_pwd)
+        return re.match(r"([0-9a-f]{2}|\d{8})$", name) is not None
 
     def is_skip(self, section_name_no_filter):
         """check if the section is skip
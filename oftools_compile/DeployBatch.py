@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to run the deferred deploy commands by batch, target by target.
+
+Typical usage example:
+  deploy_batch = DeployBatch(report, size)
+  engine.run(profile, file_paths, deploy_batch)
+  deploy_batch.flush()
+  deploy_batch.abort()
+"""
+
+# Generic/Built-in modules
+import os
+import shutil
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .handlers.ShellHandler import ShellHandler
+from .Log import Log
+from .Manifest import Manifest
+
+
+class DeployBatch():
+    """A class used to collect the results of the file processing and run
+    their deferred deploy commands by batch.
+
+    It is used by the engines in place of the Report. All the results are
+    kept until the flush of the batch, which runs the deferred deploy commands
+    grouped by dataset, region and TDL directory, then adds the results to
+    the report in their original order, failed if one of their deploy
+    commands failed. The deploy commands of the source files which failed
+    before the end are not run.
+    A module deployed several times to the same target in a batch is only
+    deployed once, from the last source file, the deployments of the other
+    source files being superseded.
+
+    Attributes:
+        _report {Report} -- Report of the compilation.
+        _size {integer} -- Number of deferred deploy commands triggering a
+            flush of the batch, only at the end if 0.
+        _results {list[list]} -- Results of the file processing waiting for
+            the flush of the batch, in the order of the source files.
+        _intent_count {integer} -- Number of deferred deploy commands in the
+            batch.
+
+    Methods:
+        __init__(report, size) -- Initializes the class with all the
+            attributes.
+        _remove_copy(file_context) -- Removes the copies of the modules of a
+            source file deployed to datasets.
+        add_entry(source_file_path, return_code, elapsed_time, file_context) --
+            Adds the result of a file processing to the batch.
+        flush() -- Runs the deferred deploy commands of the batch and adds the
+            results to the report.
+        abort() -- Adds the results of the batch to the report without running
+            their deferred deploy commands.
+    """
+
+    def __init__(self, report, size=0):
+        """Initializes the class with all the attributes.
+        """
+        self._report = report
+        self._size = size
+        self._results = []
+        self._intent_count = 0
+
+    @staticmethod
+    def _remove_copy(file_context):
+        """Removes the copies of the modules of a source file deployed to
+        datasets.
+
+        Arguments:
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file.
+        """
+        shutil.rmtree(os.path.join(
+            Context().root_workdir, "deploy",
+            os.path.basename(file_context.current_workdir)),
+                      ignore_errors=True)
+
+    def add_entry(self, source_file_path, return_code, elapsed_time,
+                  file_context):
+        """Adds the result of a file processing to the batch.
+
+        Arguments:
+            source_file_path {string} -- Absolute path of the source file.
+            return_code {integer} -- Return code of the file processing.
+            elapsed_time {integer} -- Processing time.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file.
+        """
+        self._results.append(
+            [source_file_path, return_code, elapsed_time, file_context])
+
+        # The file failed before the end, nothing to deploy
+        if return_code not in (0, 1):
+            for _ in file_context.deploy_intents:
+                file_context.add_deploy_result("NOT_DEPLOYED")
+            return
+
+        self._intent_count += len(file_context.deploy_intents)
+
+        if self._size > 0 and self._intent_count >= self._size:
+            self.flush()
+
+    def flush(self):
+        """Runs the deferred deploy commands of the batch and adds the results
+        to the report.
+        """
+        # Group the commands by target, the last one of each module wins
+        targets = {}
+        for result in self._results:
+            if result[1] not in (0, 1):
+                continue
+            for intent in result[3].deploy_intents:
+                _, target_type, target, module_path, _, _ = intent
+                module = os.path.basename(module_path)
+                modules = targets.setdefault((target_type, target), {})
+                superseded = modules.pop(module, None)
+                if superseded is not None:
+                    superseded[1][3].add_deploy_result("SUPERSEDED")
+                modules[module] = (intent, result)
+
+        for (target_type, target), modules in targets.items():
+            Log().logger.info(LogMessage.DEPLOY_FLUSH.value %
+                              (len(modules), target_type, target))
+
+            for module, (intent, result) in modules.items():
+                section, _, _, _, shell_command, digest = intent
+                file_context = result[3]
+                Log().logger.info(LogMessage.RUN_COMMAND.value %
+                                  (section, shell_command))
+                _, _, return_code = ShellHandler().execute_command(
+                    shell_command, "deploy", file_context.env,
+                    Context().root_workdir)
+
+                if return_code != 0:
+                    Log().logger.error(ErrorMessage.DEPLOY_FAILED.value %
+                                       (result[0], shell_command))
+                    result[1] = -1
+                    file_context.last_section = section
+                    file_context.add_deploy_result("DEPLOY_FAILED")
+                else:
+                    Manifest().record(target_type, target, module, digest)
+                    file_context.add_deploy_result("DEPLOYED")
+
+        for result in self._results:
+            self._remove_copy(result[3])
+            self._report.add_entry(*result)
+
+        self._results = []
+        self._intent_count = 0
+
+    def abort(self):
+        """Adds the results of the batch to the report without running their
+        deferred deploy commands, when the execution is interrupted.
+        """
+        for result in self._results:
+            if result[1] in (0, 1):
+                for _ in result[3].deploy_intents:
+                    result[3].add_deploy_result("NOT_DEPLOYED")
+            self._remove_copy(result[3])
+            self._report.add_entry(*result)
+
+        self._results = []
+        self._intent_count = 0
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Set of variables and parameters for the processing of one source file.
+
+Typical usage example:
+  file_context = FileContext(profile, file_path)
+  file_context.add_env_variable("$OF_COMPILE_IN", file_name)
+  job.run(file_path, file_context)
+"""
+
+# Generic/Built-in modules
+import sys
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .handlers.ShellHandler import ShellHandler
+from .Log import Log
+
+
+class FileContext():
+    """A class used to store the variables and parameters of the processing
+    of one source file, passed from job to job.
+
+    Unlike the Context, nothing is shared with the other source files or
+    written to the process environment, which allows to process several
+    source files at the same time.
+
+    Attributes:
+        _source_file_path {string} -- Absolute path of the source file.
+        _source_digest {string} -- Hash of the source file when it is staged,
+            only computed for the history.
+        _env {dictionary} -- Environment variables added during the file
+            processing, on top of the environment of the Context.
+        _env_cache {dictionary} -- Complete environment of the file
+            processing, reset each time a variable is added.
+
+        _current_workdir {string} -- Absolute path of the working directory
+            of the file processing.
+
+        _filters {dictionary} -- Filter names and their respective values.
+        _filter_results {dictionary} -- Filter functions evaluated before the
+            execution of the sections and their result.
+
+        _last_section {string} -- Name of the last section being executed,
+            whether it succeeds or fails.
+        _sections_no_filter {dictionary} -- List of the section names without
+            filters if any.
+        _sections_complete {dictionary} -- List of the section names and their
+            completion status.
+
+        _cache_hits {integer} -- Number of compile sections restored from the
+            cache.
+        _cache_misses {integer} -- Number of compile sections executed while
+            the cache is enabled.
+
+        _deploy_intents {list[tuple]} -- Deploy commands deferred to the end
+            of the batch, with their section, target, module and its hash.
+        _deploy_results {list[string]} -- Result of each deployment to a
+            target, either DEPLOYED, DEPLOY_SKIPPED, DEPLOY_FAILED, SUPERSEDED
+            or NOT_DEPLOYED.
+
+        _section_times {list[tuple]} -- Name, return code and elapsed time of
+            each section run.
+
+    Methods:
+        __init__(profile, source_file_path) -- Initializes all attributes of
+            the class.
+        add_env_variable(key, value) -- Adds a variable to the environment.
+        expandvars(value) -- Expands the environment variables in the input
+            value.
+        add_filter(key, value) -- Adds a filter function to the list of filters.
+        scan_filters(functions) -- Evaluates the "re:" filter functions on the
+            source file in a single read.
+        get_filter_function(key) -- Retrieves the expression of the filter
+            function.
+        is_section_complete(section) -- Checks if given section is already
+            complete.
+        section_completed(section_no_filter) -- Changes the status of the given
+            section to complete.
+        add_cache_result(hit) -- Counts the result of a cache lookup.
+        add_deploy_intent(section, target_type, target, module_path, command,
+            digest) -- Defers a deploy command to the end of the batch.
+        add_section_time(section, return_code, elapsed_time) -- Records the
+            elapsed time of a section.
+        add_deploy_result(status) -- Records the result of a deployment to a
+            target.
+    """
+
+    def __init__(self, profile, source_file_path):
+        """Initializes all attributes of the class.
+        """
+        self._source_file_path = source_file_path
+        self._source_digest = None
+
+        # Environment
+        self._env = {}
+        self._env_cache = None
+
+        # Directories
+        self._current_workdir = ""
+
+        # Filter variables
+        self._filters = {}
+        self._filter_results = {}
+
+        # Profile sections
+        self._last_section = ""
+        self._sections_no_filter = profile.sections_no_filter
+        self._sections_complete = dict(profile.sections_complete)
+
+        # Cache
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Deploy
+        self._deploy_intents = []
+        self._deploy_results = []
+
+        # Timings
+        self._section_times = []
+
+    @property
+    def source_file_path(self):
+        """Getter method for the attribute _source_file_path.
+        """
+        return self._source_file_path
+
+    @property
+    def source_digest(self):
+        """Getter method for the attribute _source_digest.
+        """
+        return self._source_digest
+
+    @source_digest.setter
+    def source_digest(self, digest):
+        """Setter method for the attribute _source_digest.
+        """
+        self._source_digest = digest
+
+    @property
+    def env(self):
+        """Getter method for the complete environment of the file processing.
+        """
+        if self._env_cache is None:
+            self._env_cache = Context().env.copy()
+            self._env_cache.update(self._env)
+        return self._env_cache
+
+    @property
+    def variables(self):
+        """Getter method for the attribute _env.
+        """
+        return self._env
+
+    @property
+    def current_workdir(self):
+        """Getter method for the attribute _current_workdir.
+        """
+        return self._current_workdir
+
+    @current_workdir.setter
+    def current_workdir(self, working_dir):
+        """Setter method for the attribute _current_workdir.
+        """
+        self._current_workdir = working_dir
+
+    @property
+    def filters(self):
+        """Getter method for the attribute _filters.
+        """
+        return self._filters
+
+    @property
+    def filter_results(self):
+        """Getter method for the attribute _filter_results.
+        """
+        return self._filter_results
+
+    @property
+    def last_section(self):
+        """Getter method for the attribute _last_section.
+        """
+        return self._last_section
+
+    @last_section.setter
+    def last_section(self, section):
+        """Setter method for the attribute _last_section.
+        """
+        self._last_section = section
+
+    @property
+    def sections_complete(self):
+        """Getter method for the attribute _sections_complete.
+        """
+        return self._sections_complete
+
+    @property
+    def cache_status(self):
+        """Getter method for the status of the cache lookups, either HIT,
+        MISS, PARTIAL or empty if the cache has not been used.
+        """
+        if self._cache_hits == 0 and self._cache_misses == 0:
+            status = ""
+        elif self._cache_misses == 0:
+            status = "HIT"
+        elif self._cache_hits == 0:
+            status = "MISS"
+        else:
+            status = "PARTIAL"
+
+        return status
+
+    @property
+    def deploy_intents(self):
+        """Getter method for the attribute _deploy_intents.
+        """
+        return self._deploy_intents
+
+    @property
+    def deploy_status(self):
+        """Getter method for the status of the deployments, the result of all
+        the deployments if they are the same, PARTIAL if not, or empty if
+        nothing has been deployed.
+        """
+        if len(self._deploy_results) == 0:
+            status = ""
+        elif len(set(self._deploy_results)) == 1:
+            status = self._deploy_results[0]
+        else:
+            status = "PARTIAL"
+
+        return status
+
+    def add_env_variable(self, key, value):
+        """Adds a variable to the environment.
+
+        Arguments:
+            key {string} -- Name of the environment variable.
+            value {string} -- Value of the environment variable.
+        """
+        if not value.startswith("$(") and not value.startswith("`"):
+            value = self.expandvars(value)
+        else:
+            if value.startswith("$(") and value.endswith(")"):
+                value = value[2:-1]
+            elif value.startswith("`") and value.endswith("`"):
+                value = value[1:-1]
+            out, _, _ = ShellHandler().execute_command(
+                value, "env_variable", self.env, self._current_workdir)
+            value = out.rstrip()
+
+        # Write to env dictionary without dollar sign
+        self._env[key[1:]] = value
+        self._env_cache = None
+
+    def expandvars(self, value):
+        """Expands the environment variables in the input value, using the
+        environment of the file processing.
+
+        Arguments:
+            value {string} -- Value containing environment variables.
+
+        Returns:
+            string -- Value with environment variables expanded.
+        """
+        return ShellHandler().expand_variables(value, self.env)
+
+    def add_filter(self, key, value):
+        """Adds a filter function to the list of filters.
+
+        Arguments:
+            key {string} -- Name of the filter function.
+            value {string} -- Expression of the filter function.
+        """
+        # Remove question mark from filter function name
+        self._filters[key[1:]] = value
+
+    def scan_filters(self, functions):
+        """Evaluates the "re:" filter functions on the source file in a single
+        read, and stores their result for the execution of the sections.
+
+        Arguments:
+            functions {list[string]} -- Native "re:" filter functions.
+        """
+        self._filter_results.update(
+            ShellHandler().scan_filters(functions, self._source_file_path))
+
+    def get_filter_function(self, key):
+        """Retrieves the expression of the filter function.
+
+        Arguments:
+            key {string} -- Name of the filter function.
+
+        Returns:
+            string -- Expression of the filter function.
+
+        Raises:
+            KeyError -- Exception raised if a filter function is used in the
+                profile before being defined.
+        """
+        try:
+            if key == "":
+                filter_function = ""
+            else:
+                filter_function = self._filters[key]
+        except KeyError:
+            Log().logger.error(ErrorMessage.KEY_FILTER.value % key)
+            Context().clear_all()
+            sys.exit(-1)
+
+        return filter_function
+
+    def is_section_complete(self, section):
+        """Checks if given section is already complete.
+
+        Arguments:
+            section {string} -- Name of the section.
+
+        Returns:
+            boolean -- Status of the section, if it is complete or not.
+        """
+        section_no_filter = self._sections_no_filter[section]
+        status = self._sections_complete[section_no_filter]
+
+        if status:
+            Log().logger.debug(LogMessage.SECTION_COMPLETE.value % section)
+
+        return status
+
+    def section_completed(self, section_no_filter):
+        """Changes the status of the given section to complete.
+
+        Arguments:
+            section_no_filter {string} -- Name of the section without filter.
+        """
+        self._sections_complete[section_no_filter] = True
+
+    def add_cache_result(self, hit):
+        """Counts the result of a cache lookup.
+
+        Arguments:
+            hit {boolean} -- True if the outputs have been restored from the
+                cache, and False otherwise.
+        """
+        if hit is True:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+
+    def add_deploy_intent(self, section, target_type, target, module_path,
+                          command, digest):
+        """Defers a deploy command to the end of the batch.
+
+        Arguments:
+            section {string} -- Name of the deploy section.
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            module_path {string} -- Absolute path of the deployed module.
+            command {string} -- Shell command deploying the module.
+            digest {string} -- Hash of the module.
+        """
+        self._deploy_intents.append(
+            (section, target_type, target, module_path, command, digest))
+
+    @property
+    def section_times(self):
+        """Getter method for the attribute _section_times.
+        """
+        return self._section_times
+
+    def add_section_time(self, section, return_code, elapsed_time):
+        """Records the elapsed time of a section.
+
+        Arguments:
+            section {string} -- Name of the section.
+            return_code {integer} -- Return code of the section.
+            elapsed_time {float} -- Elapsed time of the section.
+        """
+        self._section_times.append((section, return_code, elapsed_time))
+
+    def add_deploy_result(self, status):
+        """Records the result of a deployment to a target.
+
+        Arguments:
+            status {string} -- Result of the deployment, either DEPLOYED,
+                DEPLOY_SKIPPED if the module is unchanged, DEPLOY_FAILED,
+                SUPERSEDED if the module is deployed from another source file
+                of the batch, or NOT_DEPLOYED if the batch is not run.
+        """
+        self._deploy_results.append(status)
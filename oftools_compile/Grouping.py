@@ -48,9 +48,19 @@ class Grouping():
             working_dir {string} -- Absolute path of the current working
                 directory.
         """
-        working_dirs = [
-            d.path for d in os.scandir(self._directory) if d.is_dir()
-        ]
+        # Working directories, in the bucket directories of the layout if any
+        working_dirs = []
+        for entry in os.scandir(self._directory):
+            if not entry.is_dir():
+                continue
+            if Context().is_bucket(entry.name):
+                working_dirs.extend(
+                    d.path for d in os.scandir(entry.path) if d.is_dir())
+            else:
+                working_dirs.append(entry.path)
+
+        # Sorted to get the same group log whatever the number of jobs
+        working_dirs.sort(key=os.path.basename)
 
         with open(self._log, "w", encoding="utf-8") as group_log:
 
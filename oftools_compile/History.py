@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to record the executions in the history database of the root working
+directory.
+
+Typical usage example:
+  History().add_file(source_file_path, result, return_code, elapsed_time,
+                     file_context)
+  History().end_run(total_time)
+  History().close()
+  elapsed_times = History().get_elapsed_times()
+"""
+
+# Generic/Built-in modules
+import contextlib
+import datetime
+import os
+import sqlite3
+import sys
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context, SingletonMeta
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .Log import Log
+
+
+class History(metaclass=SingletonMeta):
+    """A class used to record the executions, their source files and the
+    sections of each file in a SQLite database.
+
+    The database is stored in the report directory of the root working
+    directory, next to the CSV reports, and is shared by all the executions.
+    Each file is committed as soon as it is recorded, so the history of an
+    interrupted execution is kept, without the end of the run. A resumed
+    execution records its files in the run of the execution it resumes.
+
+    Attributes:
+        _timeout {integer} -- Number of seconds to wait for the lock of the
+            database held by a concurrent execution.
+        _connection {Connection} -- Connection to the database, opened with
+            the first file of the execution.
+        _run_id {integer} -- Identifier of the current execution.
+        _resumed_run_id {integer} -- Identifier of the execution resumed by
+            the current one, None if not resuming.
+        _disabled {boolean} -- Flag set if the database is not available,
+            to stop recording for the current execution.
+
+    Methods:
+        __init__() -- Initializes all attributes of the class.
+        _get_database_path() -- Gets the absolute path of the database.
+        _connect() -- Opens the database, creating it if needed.
+        _connect_read_only() -- Opens the existing database for reading.
+        _start_run() -- Records the start of the execution.
+        add_file(source_file_path, result, return_code, elapsed_time,
+            file_context) -- Records the processing of a source file.
+        end_run(total_time) -- Records the end of the execution.
+        close() -- Closes the database at the end of the execution.
+        resume(run_id) -- Records the execution in the run it resumes.
+        get_elapsed_times() -- Gets the last elapsed time of the source
+            files.
+        get_run(run_id) -- Gets the report and the source files of a run.
+        get_run_id(report_file_path) -- Gets the run of a report file.
+    """
+
+    def __init__(self):
+        """Initializes all attributes of the class.
+        """
+        self._timeout = 60
+        self._connection = None
+        self._run_id = None
+        self._resumed_run_id = None
+        self._disabled = False
+
+    @staticmethod
+    def _get_database_path():
+        """Gets the absolute path of the database.
+
+        Returns:
+            string -- Absolute path of the database.
+        """
+        return os.path.join(Context().root_workdir, "report", "history.db")
+
+    def _connect(self):
+        """Opens the database, creating it if needed.
+
+        Returns:
+            Connection -- Connection to the database.
+
+        Raises:
+            sqlite3.Error -- Exception raised if the database cannot be opened
+                or created.
+        """
+        connection = sqlite3.connect(self._get_database_path(),
+                                     timeout=self._timeout)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY, started TEXT, ended TEXT,
+                command TEXT, root_workdir TEXT, tag TEXT, report TEXT,
+                total INTEGER, success INTEGER, fail INTEGER, elapsed REAL)""")
+            connection.execute("""CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY, run_id INTEGER NOT NULL,
+                source TEXT, name TEXT, workdir TEXT, result TEXT,
+                return_code INTEGER, section TEXT, elapsed REAL, cache TEXT,
+                deploy TEXT, digest TEXT)""")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS files_name ON files (name)")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS files_run ON files (run_id)")
+            connection.execute("""CREATE TABLE IF NOT EXISTS sections (
+                file_id INTEGER NOT NULL, section TEXT, return_code INTEGER,
+                elapsed REAL)""")
+
+            # Columns added after the first version of the database
+            for table, column in (("runs", "report"), ("files", "digest")):
+                columns = [
+                    row[1] for row in connection.execute(
+                        "PRAGMA table_info(%s)" % table)
+                ]
+                if column not in columns:
+                    connection.execute("ALTER TABLE %s ADD COLUMN %s TEXT" %
+                                       (table, column))
+            connection.commit()
+        except BaseException:
+            connection.close()
+            raise
+
+        return connection
+
+    def _connect_read_only(self):
+        """Opens the existing database for reading.
+
+        The database is not created, so that it is not left by the executions
+        not recording their history.
+
+        Returns:
+            Connection -- Connection to the database.
+
+        Raises:
+            sqlite3.Error -- Exception raised if the database does not exist
+                or cannot be opened.
+        """
+        return sqlite3.connect("file:%s?mode=ro" % self._get_database_path(),
+                               timeout=self._timeout,
+                               uri=True)
+
+    def _start_run(self):
+        """Records the start of the execution.
+        """
+        self._connection = self._connect()
+        if self._resumed_run_id is not None:
+            self._run_id = self._resumed_run_id
+        else:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started, command, root_workdir, tag, "
+                "report) VALUES (?, ?, ?, ?, ?)",
+                (Context().time_stamp[1:], " ".join(sys.argv),
+                 Context().root_workdir, Context().tag[1:],
+                 Context().report_file_path))
+            self._run_id = cursor.lastrowid
+            self._connection.commit()
+        Log().logger.debug(LogMessage.HISTORY_RUN.value %
+                           (self._run_id, self._get_database_path()))
+
+    def add_file(self, source_file_path, result, return_code, elapsed_time,
+                 file_context):
+        """Records the processing of a source file.
+
+        Arguments:
+            source_file_path {string} -- Absolute path of the source file.
+            result {string} -- Result of the processing, either SUCCESSFUL or
+                FAILED.
+            return_code {integer} -- Return code of the file processing.
+            elapsed_time {integer} -- Processing time.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file.
+        """
+        if self._disabled is True:
+            return
+
+        try:
+            if self._connection is None:
+                self._start_run()
+
+            cursor = self._connection.execute(
+                "INSERT INTO files (run_id, source, name, workdir, result, "
+                "return_code, section, elapsed, cache, deploy, digest) VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._run_id, source_file_path,
+                 os.path.basename(source_file_path),
+                 file_context.current_workdir, result, return_code,
+                 file_context.last_section, elapsed_time,
+                 file_context.cache_status, file_context.deploy_status,
+                 file_context.source_digest))
+            self._connection.executemany(
+                "INSERT INTO sections VALUES (?, ?, ?, ?)",
+                [(cursor.lastrowid, section, section_return_code,
+                  section_time) for section, section_return_code,
+                 section_time in file_context.section_times])
+            self._connection.commit()
+        except sqlite3.Error as error:
+            Log().logger.warning(ErrorMessage.OS_HISTORY.value % error)
+            self._disabled = True
+
+    def end_run(self, total_time):
+        """Records the end of the execution.
+
+        The counts of the run are computed from the last result of each of
+        its source files, so that they include the files of the executions
+        resuming it.
+
+        Arguments:
+            total_time {float} -- Accumulated elapsed time.
+        """
+        if self._connection is None or self._disabled is True:
+            return
+
+        try:
+            total_count, success_count = self._connection.execute(
+                "SELECT COUNT(*), TOTAL(result = 'SUCCESSFUL') FROM files "
+                "WHERE id IN (SELECT MAX(id) FROM files WHERE run_id = ? "
+                "GROUP BY source)", (self._run_id,)).fetchone()
+            self._connection.execute(
+                "UPDATE runs SET ended = ?, total = ?, success = ?, fail = ?, "
+                "elapsed = COALESCE(elapsed, 0) + ? WHERE id = ?",
+                (datetime.datetime.now().strftime("%Y%m%d_%H%M%S"),
+                 total_count, int(success_count),
+                 total_count - int(success_count), total_time, self._run_id))
+            self._connection.commit()
+        except sqlite3.Error as error:
+            Log().logger.warning(ErrorMessage.OS_HISTORY.value % error)
+            self._disabled = True
+
+    def close(self):
+        """Closes the database at the end of the execution.
+        """
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+        self._run_id = None
+        self._resumed_run_id = None
+        self._disabled = False
+
+    def resume(self, run_id):
+        """Records the execution in the run it resumes.
+
+        Arguments:
+            run_id {integer} -- Identifier of the run resumed.
+        """
+        self._resumed_run_id = run_id
+
+    def get_elapsed_times(self):
+        """Gets the last elapsed time of the source files.
+
+        Returns:
+            dictionary -- Elapsed time of the last successful processing of
+                each source file, by file name, empty if the database is not
+                available.
+        """
+        try:
+            with contextlib.closing(self._connect_read_only()) as connection:
+                rows = connection.execute(
+                    "SELECT name, elapsed FROM files WHERE id IN (SELECT "
+                    "MAX(id) FROM files WHERE result = 'SUCCESSFUL' GROUP BY "
+                    "name)").fetchall()
+        except sqlite3.Error as error:
+            Log().logger.debug(ErrorMessage.OS_HISTORY.value % error)
+            return {}
+
+        return dict(rows)
+
+    def get_run(self, run_id):
+        """Gets the report and the source files of a run.
+
+        Arguments:
+            run_id {integer} -- Identifier of the run.
+
+        Returns:
+            tuple -- Absolute path of the report file of the run, empty if
+                none, and last result and hash of each source file, by
+                absolute path, or None if the run is not found.
+        """
+        try:
+            with contextlib.closing(self._connect_read_only()) as connection:
+                run = connection.execute(
+                    "SELECT report FROM runs WHERE id = ?",
+                    (run_id,)).fetchone()
+                if run is None:
+                    return None
+                rows = connection.execute(
+                    "SELECT source, result, digest FROM files WHERE id IN "
+                    "(SELECT MAX(id) FROM files WHERE run_id = ? GROUP BY "
+                    "source)", (run_id,)).fetchall()
+        except sqlite3.Error as error:
+            Log().logger.debug(ErrorMessage.OS_HISTORY.value % error)
+            return None
+
+        return run[0] or "", {
+            source: (result, digest) for source, result, digest in rows
+        }
+
+    def get_run_id(self, report_file_path):
+        """Gets the run of a report file.
+
+        Arguments:
+            report_file_path {string} -- Absolute path of the report file.
+
+        Returns:
+            integer -- Identifier of the last run writing to the report file,
+                None if not found.
+        """
+        try:
+            with contextlib.closing(self._connect_read_only()) as connection:
+                run = connection.execute(
+                    "SELECT MAX(id) FROM runs WHERE report = ?",
+                    (report_file_path,)).fetchone()
+        except sqlite3.Error as error:
+            Log().logger.debug(ErrorMessage.OS_HISTORY.value % error)
+            return None
+
+        return run[0]
@@ -11,6 +11,7 @@ Typical usage example:
 # Generic/Built-in modules
 import logging
 import sys
+import threading
 
 # Third-party modules
 
@@ -46,8 +47,8 @@ class Log(metaclass=SingletonType):
             messages.
         _formatter {Formatter} -- Formatter used to add color to log
             messages.
-        _file_handler {FileHandler} -- Handler used to write log messages to
-            the current log file.
+        _file_handlers {dictionary} -- Handlers used to write log messages to
+            the current log file of each thread.
         _stream_handler_out {StreamHandler} -- Handler used to write log
             messages to stdout.
         _stream_handler_err {StreamHandler} -- Handler used to write log
@@ -61,9 +62,13 @@ class Log(metaclass=SingletonType):
         close_stream() -- Closes the stream handlers at the end of the program
             execution.
         open_file(path_to_file) -- Opens the file handler to write log messages
-            to the current log file.
-        close_file() -- Closes the file handler at the end of each file
-            processing.
+            of the current thread to the current log file.
+        close_file() -- Closes the file handler of the current thread at the
+            end of each file processing.
+        detach_file() -- Detaches the file handler from the current thread,
+            without closing the log file.
+        attach_file(file_handler) -- Attaches a file handler to the current
+            thread.
     """
 
     def __init__(self):
@@ -85,7 +90,7 @@ class Log(metaclass=SingletonType):
         self._formatter = logging.Formatter(fmt, datefmt="%H:%M:%S")
         self._custom_formatter = CustomFormatter(fmt, datefmt="%H:%M:%S")
 
-        self._file_handler = None
+        self._file_handlers = {}
         self._stream_handler_out = None
         self._stream_handler_err = None
 
@@ -95,6 +100,12 @@ class Log(metaclass=SingletonType):
         """
         return self._logger
 
+    @property
+    def file_handler(self):
+        """Getter method for the file handler of the current thread.
+        """
+        return self._file_handlers.get(threading.get_ident())
+
     @property
     def level(self):
         """Getter method for the attribute _level
@@ -146,28 +157,72 @@ class Log(metaclass=SingletonType):
             self._stream_handler_err = None
 
     def open_file(self, file_path):
-        """Opens the file handler to write log messages to the log file.
+        """Opens the file handler to write log messages of the current thread
+        to the log file.
+
+        Each thread processing a source file has its own file handler, which
+        only accepts the log messages emitted by this thread.
 
         Arguments:
             file_path {string} -- Absolute path to the current log file.
         """
+        thread = threading.get_ident()
         try:
-            if self._file_handler is None:
-                self._file_handler = logging.FileHandler(filename=file_path,
-                                                         mode="a",
-                                                         encoding="utf-8")
-                self._file_handler.setFormatter(self._formatter)
-                self._logger.addHandler(self._file_handler)
+            if thread not in self._file_handlers:
+                file_handler = logging.FileHandler(filename=file_path,
+                                                   mode="a",
+                                                   encoding="utf-8")
+                file_handler.setFormatter(self._formatter)
+                file_handler.addFilter(ThreadFilter({thread}))
+                self._file_handlers[thread] = file_handler
+                self._logger.addHandler(file_handler)
         except FileNotFoundError:
             pass
 
     def close_file(self):
-        """Closes the file handler at the end of each file processing.
+        """Closes the file handler of the current thread at the end of each
+        file processing.
+        """
+        file_handler = self._file_handlers.pop(threading.get_ident(), None)
+        if file_handler is not None:
+            self._logger.removeHandler(file_handler)
+            file_handler.close()
+
+    def detach_file(self):
+        """Detaches the file handler from the current thread, without closing
+        the log file.
+
+        The file handler does not accept the log messages of the current thread
+        anymore, but it can be attached to another thread processing the same
+        source file.
+
+        Returns:
+            FileHandler -- File handler of the current thread, None if there is
+                no log file opened.
         """
-        if self._file_handler is not None:
-            self._logger.removeHandler(self._file_handler)
-            self._file_handler.close()
-            self._file_handler = None
+        thread = threading.get_ident()
+        file_handler = self._file_handlers.pop(thread, None)
+        if file_handler is not None:
+            for log_filter in file_handler.filters:
+                if isinstance(log_filter, ThreadFilter):
+                    log_filter.threads.discard(thread)
+
+        return file_handler
+
+    def attach_file(self, file_handler):
+        """Attaches a file handler to the current thread, in addition to the
+        threads it is already attached to.
+
+        Arguments:
+            file_handler {FileHandler} -- File handler of the source file,
+                nothing is done if None.
+        """
+        if file_handler is not None:
+            thread = threading.get_ident()
+            for log_filter in file_handler.filters:
+                if isinstance(log_filter, ThreadFilter):
+                    log_filter.threads.add(thread)
+            self._file_handlers[thread] = file_handler
 
 
 class CustomFormatter(logging.Formatter):
@@ -215,3 +270,22 @@ class LogFilter(logging.Filter):
         """Filters the log messages below ERROR level (not included) to stdout.
         """
         return record.levelno in (logging.DEBUG, logging.INFO, logging.WARNING)
+
+
+class ThreadFilter(logging.Filter):
+    """A class used to only keep the log messages emitted by given threads.
+
+    Attributes:
+        threads {set} -- Identifiers of the threads.
+    """
+
+    def __init__(self, threads):
+        """Initializes the class with the identifiers of the threads.
+        """
+        super().__init__()
+        self.threads = threads
+
+    def filter(self, record):
+        """Filters the log messages emitted by the threads.
+        """
+        return record.thread in self.threads
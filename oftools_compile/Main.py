@@ -6,29 +6,30 @@
 # Generic/Built-in modules
 import argparse
 import os
+import shutil
 import signal
 import sys
-import traceback
-import time
 # import logging
 
 # Third-party modules
 
 # Owned modules
 from . import __version__
+from .Cache import Cache
 from .Context import Context
+from .DeployBatch import DeployBatch
+from .engines.EngineFactory import EngineFactory
 from .enums.ErrorEnum import ErrorMessage
 from .enums.LogEnum import LogMessage
 from .Grouping import Grouping
 from .handlers.FileHandler import FileHandler
-from .jobs.JobFactory import JobFactory
 from .Log import Log
 from .Profile import Profile
 from .Report import Report
+from .Resume import Resume
+from .Retention import Retention
 from .Source import Source
-
-# Global variables
-INTERRUPT = False
+from .Trash import Trash
 
 
 def main():
@@ -45,10 +46,10 @@ class Main():
         _parse_args() -- Parses command-line options.
         _signal_handler(signum, frame) -- Handles signal SIGQUIT for the
             program execution.
-        _create_jobs(profile) -- Creates job depending on the section of the
-            profile.
-        _end_processing(mode, return_code, clear, report, file_path, elapsed_time,
-            profile) -- Common method to end file processing or entire program.
+        _remove_tmpfs() -- Removes the directory of the execution in the tmpfs
+            directory.
+        _end_processing(mode, return_code, report) -- Common method to end the
+            entire program.
         run() -- Performs all the steps to run compilation for all sources
             using the appropriate profile.
     """
@@ -124,6 +125,18 @@ class Main():
             and aggregate the logs""",
             required=False)
 
+        optional.add_argument(
+            "-j",
+            "--jobs",
+            action="store",
+            default=1,
+            dest="jobs",
+            help="""number of source files processed in parallel, each one in
+            its own worker process (default: 1)""",
+            metavar="N",
+            required=False,
+            type=int)
+
         optional.add_argument(
             "-l",
             "--log-level",
@@ -137,6 +150,57 @@ class Main():
             required=False,
             type=str)
 
+        optional.add_argument(
+            "--cache",
+            action="store_true",
+            dest="cache",
+            help="""flag used to restore the outputs of the compile sections from
+            the cache of the root working directory when the source, the
+            command, the environment and the compiler are unchanged, copybooks
+            and other included files being only checked if listed in the
+            cache_files option of the setup section""",
+            required=False)
+
+        optional.add_argument(
+            "--deploy-mode",
+            action="store",
+            choices=["inline", "batch"],
+            default="inline",
+            dest="deploy_mode",
+            help="""mode of the deploy sections, potential values:\n- inline
+            (default): deploy each module right after its compilation\n-
+            batch: defer the dataset, region and tdl deployments and run them
+            target by target at the end""",
+            metavar="MODE",
+            required=False,
+            type=str)
+
+        optional.add_argument(
+            "--deploy-batch",
+            action="store",
+            default=0,
+            dest="deploy_batch",
+            help="""number of deferred deploy commands triggering a batch in
+            batch deploy mode, 0 for a single batch at the end (default: 0)""",
+            metavar="N",
+            required=False,
+            type=int)
+
+        optional.add_argument(
+            "--engine",
+            action="store",
+            choices=["process", "async", "pipeline"],
+            default="process",
+            dest="engine",
+            help="""engine used to process the source files, potential
+            values:\n- process (default): one worker process per file\n- async:
+            one asyncio event loop running the commands of all the files\n-
+            pipeline: setup, compile and deploy stages overlapping across
+            files, with up to N files waiting between two stages""",
+            metavar="ENGINE",
+            required=False,
+            type=str)
+
         optional.add_argument(
             "--force",
             action="store_true",
@@ -144,6 +208,49 @@ class Main():
             help="flag used to force source files when not found",
             required=False)
 
+        optional.add_argument(
+            "--history",
+            action="store_true",
+            dest="history",
+            help="""flag used to record the execution, its source files and
+            their sections in the history database of the root working
+            directory""",
+            required=False)
+
+        optional.add_argument(
+            "--redeploy",
+            action="store_true",
+            dest="redeploy",
+            help="""flag used to deploy the modules even if they are unchanged
+            since their last deployment to the target""",
+            required=False)
+
+        optional.add_argument(
+            "--resume",
+            action="store",
+            dest="resume",
+            help="""report file or identifier in the history database of an
+            earlier execution, to only process the source files that failed,
+            were not processed or changed since, the records being added to
+            the earlier execution""",
+            metavar="REPORT",
+            required=False,
+            type=str)
+
+        optional.add_argument(
+            "--schedule",
+            action="store",
+            choices=["alpha", "lpt"],
+            default="alpha",
+            dest="schedule",
+            help="""order in which the source files are processed, potential
+            values:\n- alpha (default): alphabetical order\n- lpt: longest
+            processing time first, from the history database or the size of
+            the files""",
+            metavar="ORDER",
+            required=False,
+            type=str)
+
         optional.add_argument(
             "--skip",
             action="store",
@@ -152,6 +259,20 @@ class Main():
             required=False,
             type=str)
 
+        optional.add_argument(
+            "--tmpfs",
+            action="store",
+            const="/dev/shm",
+            default="",
+            dest="tmpfs",
+            help="""with the clear option, create the working directories under
+            the given tmpfs directory instead of the root working directory,
+            /dev/shm by default""",
+            metavar="DIRECTORY",
+            nargs="?",
+            required=False,
+            type=str)
+
         optional.add_argument(
             "-t",
             "--tag",
@@ -206,6 +327,32 @@ class Main():
                 Log().logger.critical(ErrorMessage.ABORT.value)
                 sys.exit(-1)
 
+        # Analyze number of parallel jobs
+        try:
+            if args.jobs < 1:
+                raise ValueError()
+        except ValueError:
+            Log().logger.critical(ErrorMessage.VALUE_JOBS.value % args.jobs)
+            Log().logger.critical(ErrorMessage.ABORT.value)
+            sys.exit(-1)
+
+        # Analyze tmpfs directory, only used with the clear option
+        try:
+            if args.tmpfs != "":
+                if args.clear is False:
+                    raise SystemError()
+                if not os.path.isdir(args.tmpfs) or not os.access(
+                        args.tmpfs, os.W_OK):
+                    raise ValueError()
+        except SystemError:
+            Log().logger.critical(ErrorMessage.SYSTEM_TMPFS.value)
+            Log().logger.critical(ErrorMessage.ABORT.value)
+            sys.exit(-1)
+        except ValueError:
+            Log().logger.critical(ErrorMessage.VALUE_TMPFS.value % args.tmpfs)
+            Log().logger.critical(ErrorMessage.ABORT.value)
+            sys.exit(-1)
+
         # Analyze number of profiles and sources provided
         try:
             if len(args.profile_list) != len(args.source_list):
@@ -223,101 +370,44 @@ class Main():
     def _signal_handler(signum, frame):
         """Handles signal SIGQUIT for the program execution.
         """
-        global INTERRUPT
-        INTERRUPT = True
+        Context().interrupt = True
         raise KeyboardInterrupt()
 
     @staticmethod
-    def _create_jobs(profile, clear):
-        """Creates job depending on the section of the profile.
-
-        Running the method "sections" on the profile which is a ConfigParser
-        object allow us to create a list of strings, the name of each section
-        of the profile. And then a call to the method create of the JobFactory
-        module generate the corresponding job.
-
-        Arguments:
-            profile {ConfigParser} -- Compilation profile specified for the
-                current source.
-            clear {boolean} -- Value of the argument clear from the CLI.
-
-        Returns:
-            list[Job] -- List of Job objects.
-
-        Raises:
-            #TODO Complete docstrings, maybe change the behavior to print
-            #TODO traceback only with DEBUG as log level
+    def _remove_tmpfs():
+        """Removes the directory of the execution in the tmpfs directory, with
+        the working directories left by the clear option.
         """
-        jobs = []
-        job_factory = JobFactory(profile)
-
-        try:
-            for section_name in profile.sections:
-                job = job_factory.create(section_name)
-                jobs.append(job)
-
-            if clear is True:
-                job = job_factory.create("clear")
-                jobs.append(job)
-        except:
-            traceback.print_exc()
-            Log().logger.critical(ErrorMessage.JOB.value)
-            Log().logger.critical(ErrorMessage.ABORT.value)
-            sys.exit(-1)
-        else:
-            return jobs
+        if Context().tmpfs != "" and Context().exec_working_dir != "":
+            shutil.rmtree(Context().exec_working_dir, ignore_errors=True)
 
     @staticmethod
-    def _end_processing(
-        mode,
-        return_code,
-        clear=None,
-        report=Report(False),
-        file_path=None,
-        elapsed_time=None,
-        profile=None,
-    ):
-        """Common method to end file processing or entire program.
+    def _end_processing(mode, return_code, report):
+        """Common method to end the entire program.
 
         Modes:
-            0: end the file processing normally.
-            1: end the file processing when user press Ctrl + C.
             2: end the entire program normally.
             3: end the entire program when the user press Ctrl + \\.
 
         Arguments:
             mode {integer} -- Ending mode for the program.
-            return_code {integer} -- Return code of the file processing.
-            clear {boolean} -- Value of the argument clear from the CLI.
-            report {Report} --
-            file_path {string} -- Absolute path to the source file.
-            elapsed_time {integer} -- Elapsed processing time.
-            profile {Profile} --
+            return_code {integer} -- Return code of the program.
+            report {Report} -- Report of the compilation, its records waiting
+                are written before the end.
         """
-        if mode == 1:
-            Log().logger.warning(LogMessage.WARNING_INTERRUPT.value)
-            time.sleep(2)
-            Log().logger.critical(
-                ErrorMessage.KEYBOARD_ABORT_COMPILATION.value % file_path)
-        elif mode == 3:
-            if INTERRUPT is True:
+        report.close()
+
+        if mode == 3:
+            if Context().interrupt is True:
                 Log().logger.debug(LogMessage.SIGQUIT.value)
             else:
                 Log().logger.debug(LogMessage.SIGINT.value)
             Log().logger.critical(ErrorMessage.KEYBOARD_INTERRUPT.value)
 
-        if mode in (0, 1):
-            if clear is not True:
-                Log().logger.info(LogMessage.WORKING_DIRECTORY.value %
-                                  Context().current_workdir)
-            report.add_entry(file_path, return_code, elapsed_time)
-            Context().clear(profile)
-            Log().close_file()
-
-        if mode in (2, 3):
-            Log().logger.debug(LogMessage.RETURN_CODE.value % return_code)
-            Context().clear_all()
-            Log().close_stream()
+        Log().logger.debug(LogMessage.RETURN_CODE.value % return_code)
+        Cache().clear()
+        Context().clear_all()
+        Log().close_stream()
 
     def run(self):
         """Performs all the steps to run compilation for all sources using the
@@ -348,9 +438,24 @@ class Main():
         # Initialize variables for program execution
         Context().grouping = args.grouping
         Context().force = args.force
+        Context().cache = args.cache
+        Context().deploy_mode = args.deploy_mode
+        Context().redeploy = args.redeploy
+        Context().history = args.history
         Context().skip = args.skip
         Context().tag = args.tag
+        Context().tmpfs = args.tmpfs
         report = Report(args.clear)
+        if args.deploy_mode == "batch":
+            deploy_batch = DeployBatch(report, args.deploy_batch)
+        else:
+            deploy_batch = None
+        engine = EngineFactory(args.clear).create(args.jobs, args.engine)
+        retention = Retention()
+        if args.resume is not None:
+            resume = Resume(args.resume, report)
+        else:
+            resume = None
         profile_dict = {}
 
         try:
@@ -371,44 +476,24 @@ class Main():
                 source_path = os.path.expandvars(args.source_list[i])
                 Log().logger.debug(LogMessage.SOURCE_PATH.value % source_path)
                 source = Source(args.source_list[i])
+                if args.schedule == "lpt":
+                    source.sort_by_duration()
+                file_paths = source.file_paths
+                if resume is not None:
+                    file_paths = resume.filter(file_paths)
+
+                # Old working directories deleted in the background, once the
+                # engine starts
+                retention.run(profile, file_paths)
 
-                # Create jobs
-                jobs = self._create_jobs(profile, args.clear)
-
-                for file_path in source.file_paths:
-                    try:
-                        # Initialization of variables before running the jobs
-                        file_name_in = ""
-                        file_name_out = file_path
-                        start_time = time.time()
-
-                        # GH#23: need to filter deployment based on the folder name
-                        Context().add_env_variable("$OF_COMPILE_SOURCE", file_path)
-
-                        for job in jobs:
-                            # For the SetupJob, file_name_in is an absolute path, but for all other
-                            # jobs this is just the name of the file
-                            file_name_in = file_name_out
-                            return_code = job.run(file_name_in)
-                            if return_code == 1:
-                                return_code = 0
-                            elif return_code not in (0, 1):
-                                Log().logger.error(LogMessage.ABORT_FILE.value %
-                                                   file_name_in)
-                                break
-                            file_name_out = job.file_name_out
-
-                        # Report related tasks
-                        elapsed_time = time.time() - start_time
-                        self._end_processing(0, return_code, args.clear, report,
-                                             file_path, elapsed_time, profile)
-
-                    except KeyboardInterrupt as exception:
-                        return_code = -2
-                        self._end_processing(1, return_code, args.clear, report,
-                                             file_path, 0, profile)
-                        if INTERRUPT is True:
-                            raise KeyboardInterrupt() from exception
+                # Run jobs for all the source files
+                return_code = engine.run(profile, file_paths,
+                                         deploy_batch or report, retention)
+
+            if deploy_batch is not None:
+                deploy_batch.flush()
+            retention.wait()
+            Trash().drain()
 
             if len(source.file_paths) != 0:
                 report.summary()
@@ -417,13 +502,27 @@ class Main():
                     grouping = Grouping(args.clear)
                     grouping.run()
 
-            self._end_processing(2, return_code)
+            # After the grouping, which deletes the same directory if clear
+            self._remove_tmpfs()
+
+            self._end_processing(2, return_code, report)
 
             if report.fail_count > 0:
                 return_code = -1
 
         except KeyboardInterrupt:
+            # Results withheld for their deferred deploy commands
+            if deploy_batch is not None:
+                deploy_batch.abort()
+            retention.wait()
+            Trash().drain(wait=False)
+            self._remove_tmpfs()
             return_code = -3
-            self._end_processing(3, return_code)
+            self._end_processing(3, return_code, report)
+        except SystemExit:
+            if deploy_batch is not None:
+                deploy_batch.abort()
+            report.close()
+            raise
 
         return return_code
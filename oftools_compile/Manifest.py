@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to handle the manifest of the modules deployed to each target.
+
+Typical usage example:
+  digest = Manifest().hash_file(module_path)
+  if Manifest().is_deployed("region", region, module_name, digest) is False:
+      ...
+      Manifest().record("region", region, module_name, digest)
+"""
+
+# Generic/Built-in modules
+import hashlib
+import os
+import threading
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context, SingletonMeta
+from .enums.ErrorEnum import ErrorMessage
+from .Log import Log
+
+
+class Manifest(metaclass=SingletonMeta):
+    """A class used to remember the hash of the last module deployed to each
+    dataset, region and TDL directory.
+
+    Each entry of the manifest is a small file named after a SHA-256 key
+    computed from the target and the name of the module, and containing the
+    SHA-256 hash of the deployed module. Entries are stored in the manifest
+    directory of the root working directory, so they persist across
+    executions, and they are written atomically, so concurrent executions can
+    share them.
+
+    Methods:
+        _get_entry_path(target_type, target, module_name) -- Gets the absolute
+            path of the file of a manifest entry.
+        hash_file(path) -- Computes the hash of the content of the file.
+        is_deployed(target_type, target, module_name, digest, deployed_path)
+            -- Checks if the module has already been deployed to the target.
+        record(target_type, target, module_name, digest) -- Records the
+            deployment of the module to the target.
+    """
+
+    @staticmethod
+    def _get_entry_path(target_type, target, module_name):
+        """Gets the absolute path of the file of a manifest entry.
+
+        Arguments:
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            module_name {string} -- Name of the deployed module.
+
+        Returns:
+            string -- Absolute path of the file of the manifest entry.
+        """
+        key = hashlib.sha256(
+            ("%s\0%s\0%s" % (target_type, target, module_name)).encode(
+                "utf_8")).hexdigest()
+
+        return os.path.join(Context().root_workdir, "manifest", key[:2], key)
+
+    @staticmethod
+    def hash_file(path):
+        """Computes the hash of the content of the file.
+
+        Arguments:
+            path {string} -- Absolute path of the file.
+
+        Returns:
+            string -- SHA-256 hash of the file, None if it cannot be read.
+        """
+        digest = hashlib.sha256()
+
+        try:
+            with open(path, "rb") as fd:
+                for chunk in iter(lambda: fd.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError as error:
+            Log().logger.debug(ErrorMessage.OS_MANIFEST.value % error)
+            return None
+
+        return digest.hexdigest()
+
+    def is_deployed(self,
+                    target_type,
+                    target,
+                    module_name,
+                    digest,
+                    deployed_path=None):
+        """Checks if the module has already been deployed to the target.
+
+        Arguments:
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            module_name {string} -- Name of the deployed module.
+            digest {string} -- Hash of the module being deployed.
+            deployed_path {string} -- Absolute path of the module once
+                deployed, if it can be checked.
+
+        Returns:
+            boolean -- True if the same module has been deployed last time,
+                and False otherwise.
+        """
+        if digest is None:
+            return False
+        if deployed_path is not None and not os.path.isfile(deployed_path):
+            return False
+
+        try:
+            with open(self._get_entry_path(target_type, target, module_name),
+                      "r") as fd:
+                return fd.read() == digest
+        except OSError:
+            return False
+
+    def record(self, target_type, target, module_name, digest):
+        """Records the deployment of the module to the target.
+
+        The entry is first written in a temporary file then renamed, so that a
+        concurrent execution never reads an incomplete entry.
+
+        Arguments:
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            module_name {string} -- Name of the deployed module.
+            digest {string} -- Hash of the deployed module.
+        """
+        if digest is None:
+            return
+
+        entry_path = self._get_entry_path(target_type, target, module_name)
+        temp_path = "%s.%d.%d" % (entry_path, os.getpid(),
+                                  threading.get_ident())
+
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(temp_path, "w") as fd:
+                fd.write(digest)
+            os.replace(temp_path, entry_path)
+        except OSError as error:
+            Log().logger.warning(ErrorMessage.OS_MANIFEST.value % error)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
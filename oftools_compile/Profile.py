@@ -27,8 +27,11 @@ class Profile():
         _data {ConfigParser} -- Data extracted from the profile.
         _sections {dictionary} -- List of the section names in the profile.
         _filters {dictionary} -- List of the filter functions.
+        _native_filters {list} -- Expressions of the "re:" filter functions
+            defined in the profile, scanned together on each source file.
         _sections_complete {dictionary} -- List of the section names and their
-            completion status.
+            initial completion status, copied in the FileContext of each file
+            processing.
         _sections_mandatory_ {list} -- Sections that are listed as mandatory.
         _sections_no_filter {dictionary} -- List of the section names without
             filters if any.
@@ -47,10 +50,6 @@ class Profile():
 
         is_section_mandatory(section_name_no_filter) -- Checks if given section
             is mandatory or not.
-        is_section_complete(section_name_no_filter, skip=True) -- Checks if
-            given section is already complete.
-        section_completed(section_name_no_filter) -- Changes the status of the
-            given section to complete.
     """
 
     def __init__(self, profile_path):
@@ -61,6 +60,7 @@ class Profile():
         Log().logger.debug(LogMessage.PROFILE_SECTIONS.value % self._sections)
 
         self._filters = {}
+        self._native_filters = []
 
         self._sections_complete = {}
         self._sections_mandatory = []
@@ -92,6 +92,12 @@ class Profile():
         """
         return self._filters
 
+    @property
+    def native_filters(self):
+        """Getter method for the attribute _native_filters.
+        """
+        return self._native_filters
+
     @property
     def sections_complete(self):
         """Getter method for the attribute _complete_sections.
@@ -138,6 +144,12 @@ class Profile():
             for section in self._sections:
                 self._split_section_and_filter(section)
 
+                # List "re:" filter functions to scan them all at once
+                for key, value in self._data[section].items():
+                    if key.startswith("?") and value.startswith(
+                            "re:") and value not in self._native_filters:
+                        self._native_filters.append(value)
+
                 # Detailed analysis of the sections
                 if section.startswith("setup"):
                     self._analyze_setup(section)
@@ -175,12 +187,30 @@ class Profile():
                     if FileHandler().is_a_directory(
                             working_directory) and FileHandler().check_write_access(working_directory):
 
-                        # Set group directory as working directory for the
-                        # execution if grouping option used
-                        if Context().grouping:
+                        # Layout of the working directories, validated by
+                        # the setup section
+                        Context().layout = self._data.get(section,
+                                                          "layout",
+                                                          fallback="flat")
+
+                        # Set a directory of the tmpfs directory as working
+                        # directory for the execution if tmpfs option used,
+                        # or the group directory if grouping option used
+                        if Context().tmpfs != "":
+                            tmpfs_directory = os.path.join(
+                                Context().tmpfs,
+                                "oftools_compile_%d" % os.getpid())
+                            FileHandler().create_directory(tmpfs_directory)
+                            Context().exec_working_dir = tmpfs_directory
+                        elif Context().grouping:
+                            group_name = "group" + Context().tag + Context(
+                            ).time_stamp
+                            bucket = Context().get_bucket(group_name)
+                            if bucket != "":
+                                FileHandler().create_directory(
+                                    os.path.join(working_directory, bucket))
                             group_directory = os.path.join(
-                                working_directory,
-                                "group" + Context().tag + Context().time_stamp)
+                                working_directory, bucket, group_name)
                             FileHandler().create_directory(
                                 group_directory, "group")
                             Context().exec_working_dir = group_directory
@@ -346,29 +376,3 @@ class Profile():
             status = False
 
         return status
-
-    def is_section_complete(self, section, skip=True):
-        """Checks if given section is already complete.
-
-        Arguments:
-            section {string} -- Name of the section.
-            skip {boolean} -- Value of the skip flag.
-
-        Returns:
-            boolean -- Status of the section, if it is complete or not.
-        """
-        section_no_filter = self.sections_no_filter[section]
-        status = self.sections_complete[section_no_filter]
-
-        if status and skip is True:
-            Log().logger.debug(LogMessage.SECTION_COMPLETE.value % section)
-
-        return status
-
-    def section_completed(self, section_no_filter):
-        """Changes the status of the given section to complete.
-
-        Arguments:
-            section_no_filter {string} -- Name of the section without filter.
-        """
-        self.sections_complete[section_no_filter] = True
@@ -4,18 +4,23 @@
 
 Typical usage example:
   report = Report()
+  report.resume(report_file_path, count)
   report.add_entry(file_path, return_code, elapsed_time)
   report.generate()
+  report.close()
 """
 # Generic/Built-in modules
+import atexit
+import csv
 import os
+import threading
 
 # Third-party modules
 
 # Owned modules
 from .Context import Context
 from .enums.LogEnum import LogMessage
-from .handlers.FileHandler import FileHandler
+from .History import History
 from .Log import Log
 
 
@@ -32,17 +37,25 @@ class Record():
         _rc {integer} -- Return code of the file processing.
         _last_section {string} -- Name of the last executed section.
         _elapsed_time {integer} -- Elapsed processing time.
+        _cache_status {string} -- Status of the cache lookups of the compile
+            sections, either HIT, MISS, PARTIAL or empty.
+        _deploy_status {string} -- Status of the deployments, either DEPLOYED,
+            DEPLOY_SKIPPED, DEPLOY_FAILED, SUPERSEDED, NOT_DEPLOYED, PARTIAL
+            or empty.
+        _file_path {string} -- Absolute path of the file which has just been
+            processed.
 
     Methods:
         __init__(count, file_name, working_directory, processing_status, return_code,
-            last_section, elapsed_time) -- Initializes the record with all the
-            attributes.
+            last_section, elapsed_time, cache_status, deploy_status,
+            file_path) -- Initializes the record with all the attributes.
         to_csv() -- Converts the record data to a CSV record format, with a ","
             as a delimiter.
     """
 
     def __init__(self, count, file_name, working_directory, processing_status,
-                 return_code, last_section, elapsed_time):
+                 return_code, last_section, elapsed_time, cache_status,
+                 deploy_status, file_path):
         """Initializes the record with all the attributes.
         """
         self._count = str(count)
@@ -52,6 +65,9 @@ class Record():
         self._rc = str(return_code)
         self._last_section = last_section
         self._elapsed_time = str(round(elapsed_time, 4))
+        self._cache_status = cache_status
+        self._deploy_status = deploy_status
+        self._file_path = file_path
 
     def to_csv(self):
         """Converts the record data to a CSV record format, with a "," as a
@@ -63,7 +79,8 @@ class Record():
         return [
             self._count, self._file_name, self._working_directory,
             self._processing_status, self._rc, self._last_section,
-            self._elapsed_time
+            self._elapsed_time, self._cache_status, self._deploy_status,
+            self._file_path
         ]
 
 
@@ -77,14 +94,41 @@ class Report(object):
         _total_count {integer} -- Number of programs processed.
         _total_time {integer} -- Accumulated elapsed time.
 
+        _headers {list[string]} -- Columns of the report file.
+        _fd {TextIOWrapper} -- Report file, kept open until the end of the
+            execution.
+        _writer {csv.writer} -- Writer of the report file.
+        _rows {list[list]} -- Records waiting to be written to the report
+            file.
+        _flush_rows {integer} -- Number of records triggering a write.
+        _flush_interval {integer} -- Number of seconds after which the
+            records are written by a timer, even if no other record is added.
+        _timer {Timer} -- Timer writing the records waiting, started when
+            the first one is added.
+        _lock {RLock} -- Lock of the records waiting and of the report file,
+            shared with the timer.
+
+        _resume_file_path {string} -- Absolute path of the report file of the
+            execution resumed, the records are added to it.
+        _resume_count {integer} -- Number of records of the report file of
+            the execution resumed.
+
         _green {string} -- Green color for log messages.
         _red {string} -- Red color for log messages.
         _white {string} -- White color for log messages.
 
     Methods:
         __init__(clear) -- Initializes the class with all the attributes.
-        add_entry(source_file_path, return_code, elapsed_time) -- Adds a new record to
-            the report of the compilation.
+        _open() -- Creates the report file and writes the headers, or opens
+            the report file of the execution resumed.
+        _rewrite(path) -- Rewrites the report file of the execution resumed
+            with the current headers.
+        resume(report_file_path, count) -- Adds the records to the report
+            file of the execution resumed.
+        add_entry(source_file_path, return_code, elapsed_time, file_context) --
+            Adds a new record to the report of the compilation.
+        flush() -- Writes the records waiting to the report file.
+        close() -- Writes the records waiting and closes the report file.
         summary() -- Generates a quick summary of the compilation.
     """
 
@@ -98,6 +142,21 @@ class Report(object):
         self._total_count = 0
         self._total_time = 0
 
+        self._headers = [
+            "count", "source", "working_directory", "result", "return_code",
+            "section", "time(s)", "cache", "deploy", "source_path"
+        ]
+        self._fd = None
+        self._writer = None
+        self._rows = []
+        self._flush_rows = 100
+        self._flush_interval = 5
+        self._timer = None
+        self._lock = threading.RLock()
+
+        self._resume_file_path = ""
+        self._resume_count = 0
+
         self._green = "\x1b[92m"
         self._red = "\x1b[91m"
         self._white = "\x1b[39m"
@@ -108,36 +167,90 @@ class Report(object):
         """
         return self._fail_count
 
-    def add_entry(self, source_file_path, return_code, elapsed_time):
+    def _open(self):
+        """Creates the report file and writes the headers, or opens the report
+        file of the execution resumed.
+
+        The file is kept open, so that the records are not written with one
+        open and close of the file each, which is slow on network file
+        systems. The records waiting are also written if the program exits
+        without closing the report.
+        """
+        atexit.register(self.close)
+
+        if self._resume_file_path != "":
+            path = self._resume_file_path
+            Log().logger.debug(LogMessage.OPEN_REPORT_FILE.value % path)
+            self._rewrite(path)
+            self._fd = open(path, "a", encoding="utf-8")
+            self._writer = csv.writer(self._fd, delimiter=",")
+            Context().report_file_path = path
+            return
+
+        report_file_name = "report/oftools_compile" + Context(
+        ).tag + Context().time_stamp + ".csv"
+        path = os.path.join(Context().root_workdir, report_file_name)
+        Log().logger.debug(LogMessage.CREATE_REPORT_FILE.value % path)
+
+        self._fd = open(path, "w", encoding="utf-8")
+        self._writer = csv.writer(self._fd, delimiter=",")
+        self._writer.writerow(self._headers)
+        self._fd.flush()
+        Context().report_file_path = path
+
+    def _rewrite(self, path):
+        """Rewrites the report file of the execution resumed with the current
+        headers.
+
+        A report file written by an older version of the program does not
+        have all the columns, so its records are rewritten with the current
+        headers, the missing columns being empty, before new records are
+        added to it.
+
+        Arguments:
+            path {string} -- Absolute path of the report file.
+        """
+        with open(path, "r", encoding="utf-8") as fd:
+            reader = csv.DictReader(fd)
+            if reader.fieldnames == self._headers:
+                return
+            rows = list(reader)
+
+        Log().logger.debug(LogMessage.REWRITE_REPORT_FILE.value % path)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as fd:
+            writer = csv.DictWriter(fd,
+                                    self._headers,
+                                    restval="",
+                                    extrasaction="ignore",
+                                    delimiter=",")
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(temporary_path, path)
+
+    def add_entry(self, source_file_path, return_code, elapsed_time,
+                  file_context):
         """Adds a new record to the report of the compilation.
 
         It first creates the report file if it does not already exist, then
-        analyzes one by one the input parameters, and retrieves some parameters
-        from the Context to create the full report record. Finally, it writes
-        the record to the report file.
+        analyzes one by one the input parameters to create the full report
+        record. Finally, it writes the record to the report file.
 
         Arguments:
             source_file_path {string} -- Absolute path of the source file.
             return_code {integer} -- Return code of the file processing.
             elapsed_time {integer} --Processing time.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file, such as its working directory,
+                last executed section, cache and deploy status.
 
         Raises:
             IndexError -- Exception raised if there is no "/" symbol in the
                 filename, which means the file name only has been provided and
                 not the absolute file path.
         """
-        if Context().report_file_path == "" and self._clear is False:
-            report_file_name = "report/oftools_compile" + Context(
-            ).tag + Context().time_stamp + ".csv"
-            path = os.path.join(Context().root_workdir, report_file_name)
-            Log().logger.debug(LogMessage.CREATE_REPORT_FILE.value % path)
-
-            headers = [
-                "count", "source", "working_directory", "result", "return_code",
-                "section", "time(s)"
-            ]
-            FileHandler().write_file(path, headers)
-            Context().report_file_path = path
+        if self._fd is None and self._clear is False:
+            self._open()
 
         # Get input source file name
         source_file_name = source_file_path.rsplit("/", 1)[1]
@@ -160,15 +273,65 @@ class Report(object):
         self._total_count = self._success_count + self._fail_count
 
         if self._clear is False:
-            record = Record(self._total_count, source_file_name,
-                            Context().current_workdir, processing_status, return_code,
-                            Context().last_section, elapsed_time)
-            row = record.to_csv()
-            FileHandler().write_file(Context().report_file_path, row, mode="a")
+            record = Record(self._resume_count + self._total_count,
+                            source_file_name,
+                            file_context.current_workdir, processing_status,
+                            return_code, file_context.last_section,
+                            elapsed_time, file_context.cache_status,
+                            file_context.deploy_status, source_file_path)
+            with self._lock:
+                self._rows.append(record.to_csv())
+                if len(self._rows) >= self._flush_rows:
+                    self.flush()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self._flush_interval,
+                                                  self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if Context().history is True:
+            History().add_file(source_file_path, processing_status,
+                               return_code, elapsed_time, file_context)
 
         # Analyze input parameter: elapsed_time, cumulate compilation times
         self._total_time += elapsed_time
 
+    def resume(self, report_file_path, count):
+        """Adds the records to the report file of the execution resumed.
+
+        Arguments:
+            report_file_path {string} -- Absolute path of the report file.
+            count {integer} -- Number of records of the report file, to go on
+                with the numbering.
+        """
+        self._resume_file_path = report_file_path
+        self._resume_count = count
+
+    def flush(self):
+        """Writes the records waiting to the report file.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._fd is not None and len(self._rows) != 0:
+                self._writer.writerows(self._rows)
+                self._fd.flush()
+                self._rows = []
+
+    def close(self):
+        """Writes the records waiting and closes the report file, as well as
+        the history database.
+        """
+        History().close()
+        with self._lock:
+            if self._fd is not None:
+                self.flush()
+                self._fd.close()
+                self._fd = None
+                self._writer = None
+                atexit.unregister(self.close)
+
     def summary(self):
         """Generates a quick summary of the compilation.
 
@@ -186,7 +349,11 @@ class Report(object):
         Log().logger.info(LogMessage.TOTAL_TIME.value %
                           round(self._total_time, 4))
 
+        if Context().history is True:
+            History().end_run(self._total_time)
+
         # Inform the user that the report has been successfully generated
         if self._clear is False:
+            self.flush()
             Log().logger.info(LogMessage.REPORT_GENERATED.value %
                               Context().report_file_path)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to resume an earlier execution from its report or its record in the
+history database.
+
+Typical usage example:
+  resume = Resume(resume, report)
+  file_paths = resume.filter(file_paths)
+"""
+
+# Generic/Built-in modules
+import csv
+import datetime
+import os
+import re
+import sys
+
+# Third-party modules
+
+# Owned modules
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .History import History
+from .Log import Log
+from .Manifest import Manifest
+
+
+class Resume():
+    """A class used to skip the source files already processed successfully
+    by an earlier execution, so that only the failed, unprocessed and changed
+    source files are processed again.
+
+    The earlier execution is either given by its report file or by its
+    identifier in the history database. A source file recorded in the history
+    is unchanged if its hash is the same. A source file only found in the
+    report file is unchanged if it has not been modified since the start of
+    the earlier execution. The records of the execution are added to the
+    report file and to the history record of the earlier execution.
+
+    Attributes:
+        _resume {string} -- Report file or identifier of the history record of
+            the execution to resume.
+        _report {Report} -- Report of the compilation.
+        _loaded {boolean} -- Flag set once the earlier execution is loaded, as
+            the history database is only known with the first profile.
+        _successes {set} -- Absolute paths of the source files successful in
+            the report file, or their names for the records written before the
+            source_path column.
+        _start_time {float} -- Timestamp of the start of the earlier
+            execution, taken from the name of the report file.
+        _digests {dictionary} -- Last result and hash of the source files in
+            the history record, by absolute path.
+        _report_pattern {Pattern} -- Regular expression matching the time
+            stamp of the name of a report file.
+
+    Methods:
+        __init__(resume, report) -- Initializes the class with all the
+            attributes.
+        _abort() -- Ends the program if the earlier execution is not found.
+        _load_report(report_file_path) -- Reads the report file of the earlier
+            execution.
+        _load() -- Loads the earlier execution and adds the records of the
+            execution to it.
+        _is_unchanged(file_path) -- Checks if the source file was successful
+            and is unchanged since the earlier execution.
+        filter(file_paths) -- Removes the source files that do not need to be
+            processed again.
+    """
+
+    def __init__(self, resume, report):
+        """Initializes the class with all the attributes.
+        """
+        self._resume = resume
+        self._report = report
+        self._loaded = False
+        self._successes = set()
+        self._start_time = 0
+        self._digests = {}
+        self._report_pattern = re.compile(r".*_(\d{8}_\d{6})\.csv$")
+
+    def _abort(self):
+        """Ends the program if the earlier execution is not found.
+        """
+        Log().logger.critical(ErrorMessage.VALUE_RESUME.value % self._resume)
+        Log().logger.critical(ErrorMessage.ABORT.value)
+        sys.exit(-1)
+
+    def _load_report(self, report_file_path):
+        """Reads the report file of the earlier execution.
+
+        Arguments:
+            report_file_path {string} -- Absolute path of the report file.
+
+        Returns:
+            integer -- Number of records of the report file.
+
+        Raises:
+            OSError -- Exception raised if the report file cannot be read.
+            ValueError -- Exception raised if the report file has no source
+                and result columns.
+        """
+        results = {}
+        count = 0
+
+        with open(report_file_path, "r", encoding="utf-8") as fd:
+            reader = csv.DictReader(fd)
+            if not {"source", "result"}.issubset(reader.fieldnames or []):
+                raise ValueError()
+            # The last record of a source file wins
+            for row in reader:
+                results[row.get("source_path") or row["source"]] = \
+                    row["result"]
+                count += 1
+
+        self._successes = {
+            key for key, result in results.items() if result == "SUCCESSFUL"
+        }
+
+        match = self._report_pattern.match(report_file_path)
+        if match is not None:
+            self._start_time = datetime.datetime.strptime(
+                match.group(1), "%Y%m%d_%H%M%S").timestamp()
+
+        return count
+
+    def _load(self):
+        """Loads the earlier execution and adds the records of the execution
+        to it.
+        """
+        self._loaded = True
+
+        if self._resume.isdigit():
+            run_id = int(self._resume)
+            run = History().get_run(run_id)
+            if run is None:
+                self._abort()
+            report_file_path, self._digests = run
+        else:
+            report_file_path = os.path.abspath(
+                os.path.expandvars(self._resume))
+            run_id = History().get_run_id(report_file_path)
+            if run_id is not None:
+                _, self._digests = History().get_run(run_id) or ("", {})
+
+        if os.path.isfile(report_file_path):
+            try:
+                count = self._load_report(report_file_path)
+            except (OSError, ValueError):
+                self._abort()
+            self._report.resume(report_file_path, count)
+        elif run_id is None:
+            self._abort()
+        else:
+            report_file_path = ""
+
+        if run_id is not None:
+            History().resume(run_id)
+
+        Log().logger.info(LogMessage.RESUME_RUN.value %
+                          (report_file_path, run_id))
+
+    def _is_unchanged(self, file_path):
+        """Checks if the source file was successful and is unchanged since the
+        earlier execution.
+
+        Arguments:
+            file_path {string} -- Absolute path of the source file.
+
+        Returns:
+            boolean -- True if the source file does not need to be processed
+                again.
+        """
+        if file_path in self._digests:
+            result, digest = self._digests[file_path]
+            return result == "SUCCESSFUL" and digest is not None and \
+                Manifest().hash_file(file_path) == digest
+
+        if file_path in self._successes or os.path.basename(
+                file_path) in self._successes:
+            try:
+                return os.path.getmtime(file_path) < self._start_time
+            except OSError:
+                return False
+
+        return False
+
+    def filter(self, file_paths):
+        """Removes the source files that do not need to be processed again.
+
+        Arguments:
+            file_paths {list[string]} -- Absolute paths of the source files.
+
+        Returns:
+            list[string] -- Absolute paths of the source files to process, in
+                the same order.
+        """
+        if self._loaded is False:
+            self._load()
+
+        remaining_paths = []
+        for file_path in file_paths:
+            if self._is_unchanged(file_path):
+                Log().logger.debug(LogMessage.RESUME_SKIP.value % file_path)
+            else:
+                remaining_paths.append(file_path)
+
+        Log().logger.info(LogMessage.RESUME_COUNT.value %
+                          (len(file_paths) - len(remaining_paths),
+                           len(file_paths)))
+
+        return remaining_paths
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to apply the retention options of the setup section once for the
+whole execution.
+
+Typical usage example:
+  retention = Retention()
+  retention.run(profile, file_paths)
+  retention.start()
+  retention.wait()
+"""
+
+# Generic/Built-in modules
+import concurrent.futures
+import os
+import re
+import time
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context
+from .enums.LogEnum import LogMessage
+from .Log import Log
+from .Trash import Trash
+from .WorkdirIndex import WorkdirIndex
+
+
+class Retention():
+    """A class used to delete the old working directories of the source files
+    of the execution, based on the backup, housekeeping and quota options of
+    the setup section, whatever their tag. A working directory belongs to the
+    longest name of the source files of the execution followed by "_" which
+    starts its name.
+
+    The working directories are looked up once in the index of the root
+    working directory, and the deletions run in a background pool of threads
+    started by the engine, so that they do not block the compilations and do
+    not run while the engine forks its worker processes. The deleted
+    directories are removed from the index at the end of the deletions.
+    As the working directories of the execution are not created yet, one
+    directory less than the backup value is kept for each source file.
+
+    Attributes:
+        _workers {integer} -- Number of threads deleting the directories.
+        _executor {ThreadPoolExecutor} -- Pool of threads deleting the
+            directories, created at the first deletion.
+        _futures {list[Future]} -- Deletions submitted to the pool.
+        _paths {list[string]} -- Absolute paths of the working directories
+            submitted to the pool.
+        _pending {list[tuple]} -- Absolute paths of the working directories
+            to delete and name of the option deleting them, waiting for the
+            start of the deletions.
+
+    Methods:
+        __init__() -- Initializes the class with all the attributes.
+        parse_size(value) -- Converts a size with an optional unit to bytes.
+        _get_options(profile) -- Reads the retention options of the profile.
+        _get_size(path) -- Computes the total size of the files of a
+            directory.
+        _plan(workdirs, backup, threshold, quota) -- Selects the working
+            directories of a source file to delete.
+        _delete(path, option) -- Deletes a working directory.
+        run(profile, file_paths) -- Selects the old working directories of
+            the source files to delete.
+        start() -- Deletes the selected working directories in the
+            background.
+        wait() -- Waits for the end of the deletions started.
+    """
+
+    def __init__(self):
+        """Initializes the class with all the attributes.
+        """
+        self._workers = 4
+        self._executor = None
+        self._futures = []
+        self._paths = []
+        self._pending = []
+
+    @staticmethod
+    def parse_size(value):
+        """Converts a size with an optional unit to bytes.
+
+        Arguments:
+            value {string} -- Size in bytes, or followed by K, M, G or T.
+
+        Returns:
+            integer -- Size in bytes.
+
+        Raises:
+            ValueError -- Exception raised if the value is not a valid size.
+        """
+        units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+        value = value.strip().upper()
+
+        if value[-1:] in units:
+            size = int(float(value[:-1]) * units[value[-1]])
+        else:
+            size = int(value)
+        if size < 0:
+            raise ValueError()
+
+        return size
+
+    def _get_options(self, profile):
+        """Reads the retention options of the profile.
+
+        Invalid values are ignored here, they are reported by the setup
+        section of each source file.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+
+        Returns:
+            tuple -- Number of backups, age threshold as a timestamp and size
+                quota in bytes, each one None if not used.
+        """
+        setup = profile.data["setup"]
+        backup = threshold = quota = None
+
+        try:
+            if setup.get("backup", "") != "":
+                backup = int(setup["backup"])
+        except ValueError:
+            backup = None
+
+        try:
+            value = setup.get("housekeeping", "")
+            if value.endswith("d") and backup is not None:
+                threshold = time.time() - int(value[:-1]) * 86400
+        except ValueError:
+            threshold = None
+
+        try:
+            if setup.get("quota", "") != "":
+                quota = self.parse_size(setup["quota"])
+        except ValueError:
+            quota = None
+
+        return backup, threshold, quota
+
+    def _get_size(self, path):
+        """Computes the total size of the files of a directory.
+
+        Arguments:
+            path {string} -- Absolute path of the directory.
+
+        Returns:
+            integer -- Total size in bytes.
+        """
+        size = 0
+
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        size += self._get_size(entry.path)
+                    else:
+                        size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+
+        return size
+
+    def _plan(self, workdirs, backup, threshold, quota):
+        """Selects the working directories of a source file to delete.
+
+        Arguments:
+            workdirs {list[tuple]} -- Absolute path and modification time of
+                the working directories of the source file.
+            backup {integer} -- Number of working directories to keep,
+                including the one of the execution.
+            threshold {float} -- Timestamp before which working directories
+                are deleted, keeping at least the number of backups.
+            quota {integer} -- Maximum total size of the working directories.
+
+        Returns:
+            list[tuple] -- Absolute path of the working directories to delete
+                and name of the option deleting them.
+        """
+        workdirs = sorted(workdirs, key=lambda workdir: workdir[1])
+        deletions = []
+        keep = max(backup - 1, 0) if backup is not None else 0
+
+        if threshold is not None:
+            while len(workdirs) > keep and workdirs[0][1] < threshold:
+                deletions.append((workdirs.pop(0)[0], "housekeeping"))
+        elif backup is not None:
+            while len(workdirs) > keep:
+                deletions.append((workdirs.pop(0)[0], "backup"))
+
+        if quota is not None:
+            sizes = [self._get_size(path) for path, _ in workdirs]
+            total = sum(sizes)
+            while len(workdirs) > 0 and total > quota:
+                total -= sizes.pop(0)
+                deletions.append((workdirs.pop(0)[0], "quota"))
+
+        return deletions
+
+    @staticmethod
+    def _delete(path, option):
+        """Deletes a working directory.
+
+        Arguments:
+            path {string} -- Absolute path of the working directory.
+            option {string} -- Name of the option deleting the directory.
+        """
+        Log().logger.debug(LogMessage.RETENTION_DELETE.value % (option, path))
+        try:
+            Trash().discard(path)
+        except SystemExit:
+            # Error already logged, the other deletions go on
+            pass
+
+    def run(self, profile, file_paths):
+        """Selects the old working directories of the source files to delete.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+        """
+        backup, threshold, quota = self._get_options(profile)
+        if backup is None and quota is None:
+            return
+
+        # Working directories of each source file of the execution, the name
+        # of the source file and the tag being what remains once the time
+        # stamp and the identifier are removed, as both may contain "_"
+        sources = {os.path.basename(path): [] for path in file_paths}
+        name_pattern = re.compile(r"(.+)_\d{8}_\d{6}(_\d+_\d+)?")
+        workdirs = WorkdirIndex().get_workdirs(list(sources))
+        Log().logger.debug(LogMessage.RETENTION_SCAN.value %
+                           (Context().root_workdir, len(workdirs)))
+        for path, name, mtime in workdirs:
+            match = name_pattern.fullmatch(name)
+            if match is None:
+                continue
+
+            # The longest source name wins, PGM1_A_test belongs to PGM1_A
+            # if both are compiled, to PGM1 with the tag A_test otherwise
+            prefix = match.group(1)
+            index = prefix.rfind("_")
+            while index > 0:
+                if prefix[:index] in sources:
+                    sources[prefix[:index]].append((path, mtime))
+                    break
+                index = prefix.rfind("_", 0, index)
+
+        for workdirs in sources.values():
+            self._pending.extend(
+                self._plan(workdirs, backup, threshold, quota))
+
+    def start(self):
+        """Deletes the selected working directories in the background.
+        """
+        for path, option in self._pending:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._workers)
+            self._futures.append(
+                self._executor.submit(self._delete, path, option))
+            self._paths.append(path)
+
+        self._pending = []
+
+    def wait(self):
+        """Waits for the end of the deletions started, and removes the
+        deleted directories from the index.
+        """
+        if self._executor is not None:
+            concurrent.futures.wait(self._futures)
+            # A path may be reused by a working directory of the execution
+            WorkdirIndex().remove(
+                [path for path in self._paths if not os.path.isdir(path)])
+            self._executor.shutdown()
+            self._executor = None
+            self._futures = []
+            self._paths = []
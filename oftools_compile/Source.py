@@ -4,15 +4,18 @@
 
 Typical usage example:
   source = Source(source_path)
+  source.sort_by_duration()
 """
 
 # Generic/Built-in modules
+import os
 
 # Third-party modules
 
 # Owned modules
 from .enums.LogEnum import LogMessage
 from .handlers.FileHandler import FileHandler
+from .History import History
 from .Log import Log
 
 
@@ -29,6 +32,8 @@ class Source(object):
     Methods:
         __init__(source_path) -- Initializes the class with all the attributes.
         _analyze() -- Creates the source list based on the input.
+        sort_by_duration() -- Orders the source files by decreasing expected
+            processing time.
     """
 
     def __init__(self, source_path):
@@ -100,3 +105,44 @@ class Source(object):
                            len(self._file_paths))
 
         return return_code
+
+    def sort_by_duration(self):
+        """Orders the source files by decreasing expected processing time.
+
+        The longest files start first, so that they do not set the end of a
+        parallel execution. The expected time of a file is its last elapsed
+        time in the history database, or else its size, converted to seconds
+        with the average speed of the files found in the history.
+        """
+        elapsed_times = History().get_elapsed_times()
+        sizes = {}
+        known_count = 0
+        known_time = known_size = 0
+
+        for file_path in self._file_paths:
+            try:
+                sizes[file_path] = os.path.getsize(file_path)
+            except OSError:
+                sizes[file_path] = 0
+            file_name = os.path.basename(file_path)
+            if file_name in elapsed_times:
+                known_count += 1
+                known_time += elapsed_times[file_name]
+                known_size += sizes[file_path]
+
+        if known_size > 0:
+            speed = known_time / known_size
+        else:
+            speed = 1
+
+        def get_duration(file_path):
+            file_name = os.path.basename(file_path)
+            if file_name in elapsed_times:
+                return elapsed_times[file_name]
+            return sizes[file_path] * speed
+
+        # The sort is stable, files with the same duration keep their order
+        self._file_paths.sort(key=get_duration, reverse=True)
+
+        Log().logger.debug(LogMessage.SOURCE_SCHEDULE.value %
+                           (known_count, len(self._file_paths)))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to delete directories in the background through a trash directory.
+
+Typical usage example:
+  Trash().discard(current_workdir)
+  Trash().drain()
+"""
+
+# Generic/Built-in modules
+import concurrent.futures
+import itertools
+import os
+import shutil
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context, SingletonMeta
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .handlers.FileHandler import FileHandler
+from .Log import Log
+
+
+class Trash(metaclass=SingletonMeta):
+    """A class used to delete directories without waiting for the removal of
+    their files.
+
+    A directory is first renamed into the .trash directory of the root working
+    directory, or of the tmpfs directory of the execution, which is atomic and
+    immediate, then removed by a background thread. The directories left in
+    the trash by an interrupted execution or by a worker process are removed
+    by the next drain of the trash.
+
+    Attributes:
+        _executor {ThreadPoolExecutor} -- Background thread removing the
+            directories of the trash.
+        _pid {integer} -- Process id owning the background thread, as it does
+            not survive a fork.
+        _futures {list[Future]} -- Removals submitted to the background thread.
+        _trash_paths {set} -- Absolute paths of the trash directories used.
+        _counter {count} -- Counter making the names in the trash unique.
+
+    Methods:
+        __init__() -- Initializes the class with all the attributes.
+        _submit(path) -- Removes a directory in the background.
+        _sweep(trash_path) -- Removes all the directories of the trash.
+        discard(path) -- Moves the directory to the trash.
+        drain(wait) -- Empties the trash at the end of the execution.
+    """
+
+    def __init__(self):
+        """Initializes the class with all the attributes.
+        """
+        self._executor = None
+        self._pid = None
+        self._futures = []
+        self._trash_paths = set()
+        self._counter = itertools.count()
+
+    def _submit(self, path):
+        """Removes a directory in the background.
+
+        Arguments:
+            path {string} -- Absolute path of the directory in the trash.
+        """
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1)
+            self._pid = os.getpid()
+            self._futures = []
+
+        self._futures.append(
+            self._executor.submit(shutil.rmtree, path, ignore_errors=True))
+
+    def _sweep(self, trash_path):
+        """Removes all the directories of the trash.
+
+        Arguments:
+            trash_path {string} -- Absolute path of the trash directory.
+        """
+        try:
+            with os.scandir(trash_path) as entries:
+                paths = [entry.path for entry in entries]
+        except OSError:
+            return
+
+        Log().logger.debug(LogMessage.TRASH_SWEEP.value %
+                           (trash_path, len(paths)))
+        for path in paths:
+            self._submit(path)
+
+    def discard(self, path):
+        """Moves the directory to the trash.
+
+        If the directory cannot be renamed, for instance if the trash is on
+        another file system, it is deleted right away.
+
+        Arguments:
+            path {string} -- Absolute path of the directory.
+
+        Returns:
+            integer -- Return code of the method.
+        """
+        # The trash must be on the same file system as the directory
+        if Context().tmpfs != "" and path.startswith(
+                Context().exec_working_dir + os.sep):
+            trash_path = os.path.join(Context().exec_working_dir, ".trash")
+        else:
+            trash_path = os.path.join(Context().root_workdir, ".trash")
+        trash_name = "%s.%d.%d" % (os.path.basename(path.rstrip(os.sep)),
+                                   os.getpid(), next(self._counter))
+
+        try:
+            os.makedirs(trash_path, exist_ok=True)
+            os.rename(path, os.path.join(trash_path, trash_name))
+        except OSError as error:
+            Log().logger.debug(ErrorMessage.OS_TRASH.value % error)
+            return FileHandler().delete_directory(path)
+
+        Log().logger.debug(LogMessage.TRASH_DISCARD.value % path)
+        if trash_path not in self._trash_paths:
+            # Leftovers of previous executions
+            self._trash_paths.add(trash_path)
+            self._sweep(trash_path)
+        else:
+            self._submit(os.path.join(trash_path, trash_name))
+
+        return 0
+
+    def drain(self, wait=True):
+        """Empties the trash at the end of the execution.
+
+        Arguments:
+            wait {boolean} -- Wait for the removal of all the directories of
+                the trash, or leave the remaining ones for the next execution.
+        """
+        if wait is True:
+            # The worker processes may have left directories in the trash
+            if Context().root_workdir != "":
+                self._trash_paths.add(
+                    os.path.join(Context().root_workdir, ".trash"))
+            for trash_path in self._trash_paths:
+                self._sweep(trash_path)
+
+        if self._executor is not None and self._pid == os.getpid():
+            if wait is True:
+                concurrent.futures.wait(self._futures)
+                self._executor.shutdown()
+            else:
+                # shutdown(cancel_futures=True) needs Python 3.9
+                for future in self._futures:
+                    future.cancel()
+                self._executor.shutdown(wait=False)
+
+        self._executor = None
+        self._futures = []
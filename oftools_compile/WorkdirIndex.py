@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to handle the index of the working directories of the root working
+directory.
+
+Typical usage example:
+  WorkdirIndex().add(current_workdir)
+  workdirs = WorkdirIndex().get_workdirs(file_names)
+"""
+
+# Generic/Built-in modules
+import contextlib
+import os
+import re
+import sqlite3
+
+# Third-party modules
+
+# Owned modules
+from .Context import Context, SingletonMeta
+from .enums.ErrorEnum import ErrorMessage
+from .enums.LogEnum import LogMessage
+from .Log import Log
+
+
+class WorkdirIndex(metaclass=SingletonMeta):
+    """A class used to index the working directories of the root working
+    directory, to find the previous working directories of the source files
+    without walking the whole tree.
+
+    The index is a SQLite database stored in the report directory of the root
+    working directory. It is filled with a walk of the tree the first time it
+    is used, then each new working directory is added when it is created. The
+    entries of the directories removed outside of the program are discarded
+    when they are looked up.
+
+    Attributes:
+        _timeout {integer} -- Number of seconds to wait for the lock of the
+            database held by a concurrent execution.
+        _workdir_pattern {Pattern} -- Regular expression matching the name of
+            a working directory.
+
+    Methods:
+        _get_database_path() -- Gets the absolute path of the database.
+        _connect() -- Opens the database, creating and filling it if needed.
+        _walk(root_workdir) -- Lists the working directories of the root
+            working directory.
+        _scan(connection) -- Adds all the working directories of the root
+            working directory to the index.
+        add(path) -- Adds a working directory to the index.
+        remove(paths) -- Removes working directories from the index.
+        get_workdirs(file_names) -- Gets the working directories of the
+            source files.
+    """
+
+    def __init__(self):
+        """Initializes all attributes of the class.
+        """
+        self._timeout = 60
+        self._workdir_pattern = re.compile(r".+_.+_\d{8}_\d{6}(_\d+_\d+)?$")
+
+    @staticmethod
+    def _get_database_path():
+        """Gets the absolute path of the database.
+
+        Returns:
+            string -- Absolute path of the database.
+        """
+        return os.path.join(Context().root_workdir, "report", "workdirs.db")
+
+    def _connect(self):
+        """Opens the database, creating and filling it if needed.
+
+        Returns:
+            Connection -- Connection to the database.
+
+        Raises:
+            sqlite3.Error -- Exception raised if the database cannot be opened
+                or created.
+        """
+        connection = sqlite3.connect(self._get_database_path(),
+                                     timeout=self._timeout,
+                                     isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""CREATE TABLE IF NOT EXISTS workdirs (
+                path TEXT PRIMARY KEY, name TEXT NOT NULL, mtime REAL)""")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS workdirs_name ON workdirs (name)")
+            connection.execute("""CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY, value TEXT)""")
+
+            # Only one execution fills the index, the others wait for it
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                scanned = connection.execute(
+                    "SELECT value FROM settings WHERE key = 'scanned'"
+                ).fetchone()
+                if scanned is None:
+                    self._scan(connection)
+                    connection.execute(
+                        "INSERT INTO settings VALUES ('scanned', '1')")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except BaseException:
+            connection.close()
+            raise
+
+        return connection
+
+    def _walk(self, root_workdir):
+        """Lists the working directories of the root working directory.
+
+        The working directories are either in the root working directory, in
+        the group directories or in the bucket directories of the layout, so
+        the other directories are not walked.
+
+        Arguments:
+            root_workdir {string} -- Absolute path of the root working
+                directory.
+
+        Returns:
+            list[tuple] -- Absolute path, name and modification time of the
+                working directories.
+        """
+        workdirs = []
+        directories = [root_workdir]
+
+        while len(directories) != 0:
+            try:
+                with os.scandir(directories.pop()) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if Context().is_bucket(entry.name):
+                            directories.append(entry.path)
+                            continue
+                        if self._workdir_pattern.match(entry.name) is None:
+                            continue
+                        if entry.name.startswith("group_"):
+                            directories.append(entry.path)
+                            continue
+                        workdirs.append((entry.path, entry.name,
+                                         entry.stat().st_mtime))
+            except OSError:
+                continue
+
+        return workdirs
+
+    def _scan(self, connection):
+        """Adds all the working directories of the root working directory to
+        the index.
+
+        Arguments:
+            connection {Connection} -- Connection to the database.
+        """
+        root_workdir = Context().root_workdir
+        rows = self._walk(root_workdir)
+
+        connection.executemany(
+            "INSERT OR REPLACE INTO workdirs VALUES (?, ?, ?)", rows)
+        Log().logger.debug(LogMessage.INDEX_SCAN.value %
+                           (root_workdir, len(rows)))
+
+    def add(self, path):
+        """Adds a working directory to the index.
+
+        Arguments:
+            path {string} -- Absolute path of the working directory.
+        """
+        try:
+            with contextlib.closing(self._connect()) as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO workdirs VALUES (?, ?, ?)",
+                    (path, os.path.basename(path), os.path.getmtime(path)))
+        except (OSError, sqlite3.Error) as error:
+            Log().logger.warning(ErrorMessage.OS_INDEX.value % error)
+
+    def remove(self, paths):
+        """Removes working directories from the index.
+
+        Arguments:
+            paths {list[string]} -- Absolute paths of the working directories.
+        """
+        if len(paths) == 0:
+            return
+
+        try:
+            with contextlib.closing(self._connect()) as connection:
+                connection.executemany("DELETE FROM workdirs WHERE path = ?",
+                                       [(path,) for path in paths])
+        except sqlite3.Error as error:
+            Log().logger.warning(ErrorMessage.OS_INDEX.value % error)
+
+    def get_workdirs(self, file_names):
+        """Gets the working directories of the source files.
+
+        The working directories returned are the ones whose name starts with
+        the name of one of the source files followed by "_", it is up to the
+        caller to tell the directories of PGM1 from the ones of PGM1_A. If the
+        index is not available, the root working directory is walked instead.
+
+        Arguments:
+            file_names {list[string]} -- Names of the source files.
+
+        Returns:
+            list[tuple] -- Absolute path, name and modification time of the
+                working directories.
+        """
+        workdirs = []
+        missing = []
+
+        try:
+            with contextlib.closing(self._connect()) as connection:
+                for file_name in set(file_names):
+                    # Range on the indexed name instead of a LIKE on the
+                    # prefix, "`" being the character following "_"
+                    rows = connection.execute(
+                        "SELECT path, name FROM workdirs WHERE name > ? AND "
+                        "name < ?",
+                        (file_name + "_", file_name + "`")).fetchall()
+
+                    for path, name in rows:
+                        try:
+                            mtime = os.path.getmtime(path)
+                        except OSError:
+                            missing.append((path,))
+                            continue
+                        workdirs.append((path, name, mtime))
+
+                if len(missing) != 0:
+                    connection.executemany(
+                        "DELETE FROM workdirs WHERE path = ?", missing)
+                if len(workdirs) != 0:
+                    connection.executemany(
+                        "UPDATE workdirs SET mtime = ? WHERE path = ?",
+                        [(mtime, path) for path, _, mtime in workdirs])
+        except sqlite3.Error as error:
+            Log().logger.warning(ErrorMessage.OS_INDEX.value % error)
+            prefixes = tuple(file_name + "_" for file_name in file_names)
+            return [
+                workdir for workdir in self._walk(Context().root_workdir)
+                if workdir[1].startswith(prefixes)
+            ]
+
+        return workdirs
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to run the jobs of the source files from an asyncio event loop.
+
+Typical usage example:
+  engine = AsyncEngine(clear, jobs)
+  return_code = engine.run(profile, file_paths, report)
+"""
+
+# Generic/Built-in modules
+import asyncio
+import concurrent.futures
+import signal
+import sys
+
+# Third-party modules
+
+# Owned modules
+from ..Context import Context
+from .Engine import Engine
+from ..enums.LogEnum import LogMessage
+from ..handlers.ShellHandler import ShellHandler
+from ..Log import Log
+from .ProcessEngine import WorkerExit
+
+
+class AsyncEngine(Engine):
+    """A class used to run the jobs of each source file as a task of an asyncio
+    event loop.
+
+    The job chain of each source file runs in a worker thread, while all the
+    commands are spawned and awaited by the event loop of the main thread,
+    with a semaphore limiting the number of running commands. Ctrl + C kills
+    the running commands, which aborts the compilation of their source files,
+    and Ctrl + \\ also stops the scheduling of the remaining source files.
+    The results are collected in the order of the source files, so the report
+    is the same as the one of a serial execution.
+
+    Attributes:
+        Inherited from Engine module.
+        _jobs {integer} -- Maximum number of source files processed at the
+            same time.
+
+    Methods:
+        __init__(clear, jobs) -- Initializes the class with all the attributes.
+        _run_file(profile, file_path) -- Runs all the jobs for the given source
+            file in a worker thread.
+        _signal_handler(signum) -- Handles signals SIGINT and SIGQUIT in the
+            event loop.
+        _run(profile, file_paths, report) -- Schedules the source files and
+            collects their results.
+        run(profile, file_paths, report, retention) -- Runs the jobs for all
+            the source files.
+    """
+
+    def __init__(self, clear, jobs):
+        """Initializes the class with all the attributes.
+        """
+        super().__init__(clear)
+        self._jobs = jobs
+
+    def _run_file(self, profile, file_path):
+        """Runs all the jobs for the given source file in a worker thread.
+
+        The jobs keep their state during the processing of a file, so each
+        file gets its own list of jobs.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_path {string} -- Absolute path to the source file.
+
+        Returns:
+            tuple -- Source file path, return code, elapsed time and
+                FileContext of the file processing, or None if the processing
+                has been interrupted by the user.
+
+        Raises:
+            WorkerExit -- Exception raised if the file processing exits the
+                program.
+        """
+        # Source file scheduled before the user pressed Ctrl + \
+        if Context().interrupt is True:
+            return None
+
+        try:
+            jobs = self._create_jobs(profile)
+            return self._process_file(profile, jobs, file_path)
+        except KeyboardInterrupt:
+            return None
+        except SystemExit as error:
+            raise WorkerExit(error.code) from None
+
+    @staticmethod
+    def _signal_handler(signum):
+        """Handles signals SIGINT and SIGQUIT in the event loop.
+
+        Arguments:
+            signum {integer} -- Number of the signal received.
+        """
+        if signum == signal.SIGQUIT:
+            Context().interrupt = True
+        ShellHandler().cancel_commands(Context().interrupt)
+
+    async def _run(self, profile, file_paths, report):
+        """Schedules the source files and collects their results.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+            report {Report} -- Report of the compilation.
+
+        Returns:
+            integer -- Return code of the last file processing.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the user press Ctrl + \\.
+            WorkerExit -- Exception raised if the file processing exits the
+                program in one of the worker threads.
+        """
+        return_code = 0
+        loop = asyncio.get_event_loop()
+        workers = min(self._jobs, len(file_paths))
+        Log().logger.debug(LogMessage.START_LOOP.value % workers)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        ShellHandler().attach_loop(loop, workers)
+        for signum in (signal.SIGINT, signal.SIGQUIT):
+            loop.add_signal_handler(signum, self._signal_handler, signum)
+
+        tasks = []
+        try:
+            tasks = [
+                loop.run_in_executor(executor, self._run_file, profile,
+                                     file_path) for file_path in file_paths
+            ]
+
+            for task in tasks:
+                result = await task
+                if Context().interrupt is True:
+                    break
+                if result is None:
+                    continue
+
+                _, return_code, _, _ = result
+                report.add_entry(*result)
+        except WorkerExit:
+            ShellHandler().cancel_commands(True)
+            raise
+        finally:
+            for signum in (signal.SIGINT, signal.SIGQUIT):
+                loop.remove_signal_handler(signum)
+            # Stop the scheduling of the remaining source files
+            for task in tasks:
+                task.cancel()
+            if Context().interrupt is True:
+                ShellHandler().cancel_commands(True)
+            # Let the running files finish their interrupted command
+            await loop.run_in_executor(None, executor.shutdown, True)
+            ShellHandler().detach_loop()
+
+        return return_code
+
+    def run(self, profile, file_paths, report, retention=None):
+        """Runs the jobs for all the source files.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+            report {Report} -- Report of the compilation.
+            retention {Retention} -- Deletions of the old working directories
+                to start in the background, if any.
+
+        Returns:
+            integer -- Return code of the last file processing.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the user press Ctrl + \\.
+        """
+        if len(file_paths) == 0:
+            return 0
+
+        # Check the compile tools once before scheduling the source files
+        self._create_jobs(profile)
+        if retention is not None:
+            retention.start()
+        handlers = (signal.getsignal(signal.SIGINT),
+                    signal.getsignal(signal.SIGQUIT))
+
+        # Same as asyncio.run, which is not available before Python 3.7
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return_code = loop.run_until_complete(
+                self._run(profile, file_paths, report))
+        except WorkerExit as error:
+            sys.exit(error.args[0])
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            asyncio.set_event_loop(None)
+            loop.close()
+            signal.signal(signal.SIGINT, handlers[0])
+            signal.signal(signal.SIGQUIT, handlers[1])
+
+        if Context().interrupt is True:
+            raise KeyboardInterrupt()
+
+        return return_code
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to run the jobs of all the source files, one file after the other.
+
+Typical usage example:
+  engine = Engine(clear)
+  return_code = engine.run(profile, file_paths, report)
+"""
+
+# Generic/Built-in modules
+import sys
+import time
+import traceback
+
+# Third-party modules
+
+# Owned modules
+from ..Context import Context
+from ..enums.ErrorEnum import ErrorMessage
+from ..enums.LogEnum import LogMessage
+from ..FileContext import FileContext
+from ..jobs.JobFactory import JobFactory
+from ..Log import Log
+
+
+class Engine():
+    """A class used to run the jobs of each source file sequentially. It is
+    also the parent class of all the other engines.
+
+    Attributes:
+        _clear {boolean} -- Value of the argument clear from the CLI.
+
+    Methods:
+        __init__(clear) -- Initializes the class with all the attributes.
+        _create_jobs(profile) -- Creates job depending on the section of the
+            profile.
+        _run_jobs(jobs, file_name_in, file_context) -- Runs the jobs one after
+            the other for the given source file.
+        _process_file(profile, jobs, file_path, report) -- Runs all the jobs
+            for the given source file.
+        _end_processing(mode, return_code, file_path, elapsed_time,
+            file_context, report) -- Common method to end the processing of a
+            source file.
+        run(profile, file_paths, report, retention) -- Runs the jobs for all
+            the source files.
+    """
+
+    def __init__(self, clear):
+        """Initializes the class with all the attributes.
+        """
+        self._clear = clear
+
+    def _create_jobs(self, profile):
+        """Creates job depending on the section of the profile.
+
+        Running the method "sections" on the profile which is a ConfigParser
+        object allow us to create a list of strings, the name of each section
+        of the profile. And then a call to the method create of the JobFactory
+        module generate the corresponding job.
+
+        Arguments:
+            profile {ConfigParser} -- Compilation profile specified for the
+                current source.
+
+        Returns:
+            list[Job] -- List of Job objects.
+
+        Raises:
+            SystemExit -- Exception raised if a job cannot be created, the
+                error being logged before.
+        """
+        jobs = []
+        job_factory = JobFactory(profile)
+
+        try:
+            for section_name in profile.sections:
+                job = job_factory.create(section_name)
+                jobs.append(job)
+
+            if self._clear is True:
+                job = job_factory.create("clear")
+                jobs.append(job)
+        except SystemExit:
+            raise
+        except:
+            traceback.print_exc()
+            Log().logger.critical(ErrorMessage.JOB.value)
+            Log().logger.critical(ErrorMessage.ABORT.value)
+            sys.exit(-1)
+        else:
+            return jobs
+
+    @staticmethod
+    def _run_jobs(jobs, file_name_in, file_context):
+        """Runs the jobs one after the other for the given source file.
+
+        Arguments:
+            jobs {list[Job]} -- List of Job objects.
+            file_name_in {string} -- Name of the input file of the first job.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file.
+
+        Returns:
+            tuple -- Return code of the last job and name of its output file.
+        """
+        return_code = 0
+        file_name_out = file_name_in
+
+        for job in jobs:
+            # For the SetupJob, file_name_in is an absolute path, but for all
+            # other jobs this is just the name of the file
+            file_name_in = file_name_out
+            start_time = time.time()
+            return_code = job.run(file_name_in, file_context)
+            file_context.add_section_time(job.section_name, return_code,
+                                          time.time() - start_time)
+            if return_code == 1:
+                return_code = 0
+            elif return_code not in (0, 1):
+                Log().logger.error(LogMessage.ABORT_FILE.value % file_name_in)
+                break
+            file_name_out = job.file_name_out
+
+        return return_code, file_name_out
+
+    def _process_file(self, profile, jobs, file_path, report=None):
+        """Runs all the jobs for the given source file.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            jobs {list[Job]} -- List of Job objects.
+            file_path {string} -- Absolute path to the source file.
+            report {Report} -- Report of the compilation, the entry is not
+                added if None.
+
+        Returns:
+            tuple -- Source file path, return code, elapsed time and
+                FileContext of the file processing.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the user press Ctrl + C or
+                Ctrl + \\.
+        """
+        file_context = FileContext(profile, file_path)
+
+        try:
+            start_time = time.time()
+
+            # GH#23: need to filter deployment based on the folder name
+            file_context.add_env_variable("$OF_COMPILE_SOURCE", file_path)
+            # Evaluate all "re:" filter functions in a single read
+            file_context.scan_filters(profile.native_filters)
+
+            return_code, _ = self._run_jobs(jobs, file_path, file_context)
+
+            # Report related tasks
+            elapsed_time = time.time() - start_time
+            result = self._end_processing(0, return_code, file_path,
+                                          elapsed_time, file_context, report)
+
+        except KeyboardInterrupt as exception:
+            return_code = -2
+            result = self._end_processing(1, return_code, file_path, 0,
+                                          file_context, report)
+            if Context().interrupt is True:
+                raise KeyboardInterrupt() from exception
+
+        return result
+
+    def _end_processing(self, mode, return_code, file_path, elapsed_time,
+                        file_context, report=None):
+        """Common method to end the processing of a source file.
+
+        Modes:
+            0: end the file processing normally.
+            1: end the file processing when user press Ctrl + C.
+
+        Arguments:
+            mode {integer} -- Ending mode for the file processing.
+            return_code {integer} -- Return code of the file processing.
+            file_path {string} -- Absolute path to the source file.
+            elapsed_time {integer} -- Elapsed processing time.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the source file.
+            report {Report} -- Report of the compilation, the entry is not
+                added if None.
+
+        Returns:
+            tuple -- Source file path, return code, elapsed time and
+                FileContext of the file processing.
+        """
+        if mode == 1:
+            Log().logger.warning(LogMessage.WARNING_INTERRUPT.value)
+            time.sleep(2)
+            Log().logger.critical(
+                ErrorMessage.KEYBOARD_ABORT_COMPILATION.value % file_path)
+
+        if self._clear is not True:
+            Log().logger.info(LogMessage.WORKING_DIRECTORY.value %
+                              file_context.current_workdir)
+        result = (file_path, return_code, elapsed_time, file_context)
+        if report is not None:
+            report.add_entry(*result)
+        Log().close_file()
+
+        return result
+
+    def run(self, profile, file_paths, report, retention=None):
+        """Runs the jobs for all the source files.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+            report {Report} -- Report of the compilation.
+            retention {Retention} -- Deletions of the old working directories
+                to start in the background, if any.
+
+        Returns:
+            integer -- Return code of the last file processing.
+        """
+        return_code = 0
+        jobs = self._create_jobs(profile)
+
+        if retention is not None:
+            retention.start()
+
+        for file_path in file_paths:
+            _, return_code, _, _ = self._process_file(
+                profile, jobs, file_path, report)
+
+        return return_code
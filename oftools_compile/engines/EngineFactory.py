@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to create the engine used to run the jobs of all the source files.
+
+Typical usage example:
+  engine_factory = EngineFactory(clear)
+  engine = engine_factory.create(jobs, engine_type)
+"""
+
+# Generic/Built-in modules
+
+# Third-party modules
+
+# Owned modules
+from .AsyncEngine import AsyncEngine
+from .Engine import Engine
+from .PipelineEngine import PipelineEngine
+from .ProcessEngine import ProcessEngine
+
+
+class EngineFactory():
+    """A class used to create the engine matching the command-line options.
+
+    Attributes:
+        _clear {boolean} -- Value of the argument clear from the CLI.
+
+    Methods:
+        __init__(clear) -- Initializes the class with the _clear attribute.
+        create(jobs, engine_type) -- Creates the engine according to the input
+            parameters.
+    """
+
+    def __init__(self, clear):
+        """Initializes the class with the _clear attribute.
+        """
+        self._clear = clear
+
+    def create(self, jobs, engine_type="process"):
+        """Creates the engine according to the input parameters.
+
+        Arguments:
+            jobs {integer} -- Number of source files processed in parallel.
+            engine_type {string} -- Type of the parallel engine, either
+                process, async or pipeline.
+
+        Returns:
+            Engine object -- Appropriate Engine object depending on the input.
+        """
+        if engine_type == "async":
+            return AsyncEngine(self._clear, jobs)
+        elif engine_type == "pipeline":
+            return PipelineEngine(self._clear, jobs)
+        elif jobs > 1:
+            return ProcessEngine(self._clear, jobs)
+        else:
+            return Engine(self._clear)
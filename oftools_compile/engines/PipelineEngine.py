@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to run the setup, compile and deploy stages of the source files in a
+pipeline.
+
+Typical usage example:
+  engine = PipelineEngine(clear, depth)
+  return_code = engine.run(profile, file_paths, report)
+"""
+
+# Generic/Built-in modules
+import queue
+import threading
+import time
+
+# Third-party modules
+
+# Owned modules
+from ..Context import Context
+from .Engine import Engine
+from ..enums.LogEnum import LogMessage
+from ..FileContext import FileContext
+from ..jobs.CompileJob import CompileJob
+from ..jobs.SetupJob import SetupJob
+from ..Log import Log
+
+
+class PipelineItem():
+    """A class used to pass a source file from one stage of the pipeline to
+    the next one.
+
+    Attributes:
+        file_path {string} -- Absolute path to the source file.
+        file_context {FileContext} -- Variables and parameters of the
+            processing of the source file.
+        file_name_out {string} -- Output file of the last job run.
+        return_code {integer} -- Return code of the last job run, the next
+            stages are skipped if it is not 0.
+        start_time {float} -- Time when the processing of the file started.
+        file_handler {FileHandler} -- Handler of the log file of the source
+            file, detached from the thread of the previous stage.
+    """
+
+    def __init__(self, file_path, file_context):
+        """Initializes the class with all the attributes.
+        """
+        self.file_path = file_path
+        self.file_context = file_context
+        self.file_name_out = file_path
+        self.return_code = 0
+        self.start_time = time.time()
+        self.file_handler = None
+
+
+class PipelineEngine(Engine):
+    """A class used to run the jobs of the source files in a pipeline of
+    stages.
+
+    The jobs are split in three stages, the setup, the compilation and the
+    deployment with the clear, and each stage runs in its own thread. Bounded
+    queues between the stages let the working directory of the next file be
+    prepared and the previous file be deployed while the current file is
+    compiled. The files go through the stages in order, so the report is the
+    same as the one of a serial execution.
+
+    Attributes:
+        Inherited from Engine module.
+        _depth {integer} -- Maximum number of files waiting between two
+            stages.
+
+    Methods:
+        __init__(clear, depth) -- Initializes the class with all the
+            attributes.
+        _split_stages(jobs) -- Splits the jobs in the stages of the pipeline.
+        _run_stage(stage, jobs, profile, queue_in, queue_out) -- Runs the jobs of a
+            stage for each source file received from the previous stage.
+        run(profile, file_paths, report, retention) -- Runs the jobs for all
+            the source files.
+    """
+
+    def __init__(self, clear, depth):
+        """Initializes the class with all the attributes.
+        """
+        super().__init__(clear)
+        self._depth = depth
+
+    @staticmethod
+    def _split_stages(jobs):
+        """Splits the jobs in the stages of the pipeline.
+
+        A job never goes to a stage before the one of the previous job, so the
+        jobs keep the order of the profile.
+
+        Arguments:
+            jobs {list[Job]} -- List of Job objects.
+
+        Returns:
+            list[list[Job]] -- Jobs of the setup, compile and deploy stages.
+        """
+        stages = [[], [], []]
+        stage = 0
+
+        for job in jobs:
+            # The setup jobs stay in the current stage
+            if isinstance(job, CompileJob):
+                stage = max(stage, 1)
+            elif not isinstance(job, SetupJob):
+                stage = 2
+            stages[stage].append(job)
+
+        return stages
+
+    def _run_stage(self, stage, jobs, profile, queue_in, queue_out):
+        """Runs the jobs of a stage for each source file received from the
+        previous stage.
+
+        The first stage creates the items from the source file paths, and the
+        last stage ends the processing of the files. An exception is forwarded
+        to the next stages instead of an item, so that it is raised again by
+        the main thread.
+
+        Arguments:
+            stage {integer} -- Index of the stage in the pipeline.
+            jobs {list[Job]} -- Jobs of the stage.
+            profile {Profile} -- Profile object of the current source.
+            queue_in {Queue} -- Items received from the previous stage, or
+                source file paths for the first stage, None ending the stage.
+            queue_out {Queue} -- Items sent to the next stage, or results of
+                the file processing for the last stage.
+        """
+        while True:
+            item = queue_in.get()
+            if item is None or isinstance(item, BaseException):
+                queue_out.put(item)
+                break
+
+            try:
+                # Source file scheduled before the user pressed Ctrl + \
+                if Context().interrupt is True:
+                    queue_out.put(None)
+                    break
+
+                if stage == 0:
+                    item = PipelineItem(item, FileContext(profile, item))
+                    # GH#23: need to filter deployment based on the folder name
+                    item.file_context.add_env_variable(
+                        "$OF_COMPILE_SOURCE", item.file_path)
+                    item.file_context.scan_filters(profile.native_filters)
+                else:
+                    Log().attach_file(item.file_handler)
+
+                if item.return_code == 0:
+                    item.return_code, item.file_name_out = self._run_jobs(
+                        jobs, item.file_name_out, item.file_context)
+
+                if stage == 2:
+                    elapsed_time = time.time() - item.start_time
+                    queue_out.put(
+                        self._end_processing(0, item.return_code,
+                                             item.file_path, elapsed_time,
+                                             item.file_context))
+                else:
+                    item.file_handler = Log().detach_file()
+                    queue_out.put(item)
+            except BaseException as error:
+                queue_out.put(error)
+                break
+
+    def run(self, profile, file_paths, report, retention=None):
+        """Runs the jobs for all the source files.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+            report {Report} -- Report of the compilation.
+            retention {Retention} -- Deletions of the old working directories
+                to start in the background, if any.
+
+        Returns:
+            integer -- Return code of the last file processing.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the user press Ctrl + \\.
+            SystemExit -- Exception raised if the file processing exits the
+                program in one of the stages.
+        """
+        return_code = 0
+        if len(file_paths) == 0:
+            return return_code
+
+        stages = self._split_stages(self._create_jobs(profile))
+        if retention is not None:
+            retention.start()
+        Log().logger.debug(
+            LogMessage.START_PIPELINE.value %
+            (self._depth, ", ".join(
+                "/".join(job.__class__.__name__ for job in jobs) or "-"
+                for jobs in stages)))
+
+        # The source files are all known, only the queues between the stages
+        # are bounded
+        queues = [queue.Queue()]
+        queues.extend(queue.Queue(maxsize=self._depth) for _ in stages[1:])
+        queues.append(queue.Queue())
+
+        for file_path in file_paths:
+            queues[0].put(file_path)
+        queues[0].put(None)
+
+        for stage, jobs in enumerate(stages):
+            thread = threading.Thread(target=self._run_stage,
+                                      args=(stage, jobs, profile,
+                                            queues[stage], queues[stage + 1]),
+                                      daemon=True)
+            thread.start()
+
+        while True:
+            try:
+                result = queues[-1].get()
+            except KeyboardInterrupt:
+                # Ctrl + C only interrupts the running compilation, which also
+                # receives the signal
+                if Context().interrupt is True:
+                    raise
+                continue
+
+            if result is None:
+                break
+            elif isinstance(result, BaseException):
+                raise result
+
+            _, return_code, _, _ = result
+            report.add_entry(*result)
+
+        if Context().interrupt is True:
+            raise KeyboardInterrupt()
+
+        return return_code
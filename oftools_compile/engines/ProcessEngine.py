@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Module to run the jobs of the source files in a pool of worker processes.
+
+Typical usage example:
+  engine = ProcessEngine(clear, jobs)
+  return_code = engine.run(profile, file_paths, report)
+"""
+
+# Generic/Built-in modules
+import multiprocessing
+import signal
+import sys
+
+# Third-party modules
+
+# Owned modules
+from ..Context import Context
+from ..enums.LogEnum import LogMessage
+from .Engine import Engine
+from ..Log import Log
+
+# Global variables, only initialized in the worker processes
+WORKER_ENGINE = None
+WORKER_PROFILE = None
+WORKER_JOBS = None
+
+
+class WorkerExit(Exception):
+    """Exception raised in a worker process when the file processing calls
+    sys.exit, to forward the exit code to the main process.
+    """
+
+
+def _init_worker(engine, profile, jobs):
+    """Initializes the global variables of the worker process.
+
+    The worker processes are forked, so the engine, the profile and the jobs
+    are inherited from the main process without being pickled. Signals are
+    ignored while the worker waits for a new file, only the main process
+    decides to stop the pool.
+    """
+    global WORKER_ENGINE, WORKER_PROFILE, WORKER_JOBS
+    WORKER_ENGINE = engine
+    WORKER_PROFILE = profile
+    WORKER_JOBS = jobs
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGQUIT, signal.SIG_IGN)
+
+
+def _run_worker(file_path):
+    """Runs all the jobs for the given source file in the worker process.
+
+    Arguments:
+        file_path {string} -- Absolute path to the source file.
+
+    Returns:
+        tuple -- Source file path, return code, elapsed time and FileContext
+            of the file processing.
+
+    Raises:
+        WorkerExit -- Exception raised if the file processing exits the
+            program.
+    """
+    # Ctrl + C only interrupts the current compilation, as in serial mode
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        result = WORKER_ENGINE._process_file(WORKER_PROFILE, WORKER_JOBS,
+                                             file_path)
+    except SystemExit as error:
+        raise WorkerExit(error.code) from None
+    finally:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    return result
+
+
+class ProcessEngine(Engine):
+    """A class used to run the jobs of each source file in a pool of worker
+    processes.
+
+    Each worker process has its own copy of the Context and the Log, and
+    therefore its own working directory and log file. The results are
+    collected in the order of the source files, so the report is the same as
+    the one of a serial execution.
+
+    Attributes:
+        Inherited from Engine module.
+        _jobs {integer} -- Maximum number of worker processes.
+
+    Methods:
+        __init__(clear, jobs) -- Initializes the class with all the attributes.
+        run(profile, file_paths, report, retention) -- Runs the jobs for all
+            the source files.
+    """
+
+    def __init__(self, clear, jobs):
+        """Initializes the class with all the attributes.
+        """
+        super().__init__(clear)
+        self._jobs = jobs
+
+    def run(self, profile, file_paths, report, retention=None):
+        """Runs the jobs for all the source files.
+
+        Arguments:
+            profile {Profile} -- Profile object of the current source.
+            file_paths {list[string]} -- Absolute paths of the source files.
+            report {Report} -- Report of the compilation.
+            retention {Retention} -- Deletions of the old working directories
+                to start in the background, if any.
+
+        Returns:
+            integer -- Return code of the last file processing.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the user press Ctrl + \\.
+            WorkerExit -- Exception raised if the file processing exits the
+                program in one of the worker processes.
+        """
+        return_code = 0
+        if len(file_paths) == 0:
+            return return_code
+
+        jobs = self._create_jobs(profile)
+        processes = min(self._jobs, len(file_paths))
+        Log().logger.debug(LogMessage.START_POOL.value % processes)
+
+        # No deletion thread may run while the worker processes are forked,
+        # the ones of a previous source are waited for, the new ones only
+        # start once the pool is created
+        if retention is not None:
+            retention.wait()
+        context = multiprocessing.get_context("fork")
+        pool = context.Pool(processes=processes,
+                            initializer=_init_worker,
+                            initargs=(self, profile, jobs))
+        if retention is not None:
+            retention.start()
+        try:
+            results = pool.imap(_run_worker, file_paths)
+
+            while True:
+                try:
+                    result = next(results)
+                except StopIteration:
+                    break
+                except KeyboardInterrupt:
+                    # Ctrl + C is handled by the worker processes
+                    if Context().interrupt is True:
+                        raise
+                    continue
+
+                _, return_code, _, _ = result
+                report.add_entry(*result)
+
+            pool.close()
+        except WorkerExit as error:
+            pool.terminate()
+            sys.exit(error.args[0])
+        except KeyboardInterrupt:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        return return_code
@@ -19,18 +19,39 @@ class ErrorMessage(enum.Enum):
     # Shared
     ABORT = 'Error: Aborting program execution'
 
-    # Context module
+    # Cache module
+    OS_CACHE = 'OSError: Cache entry not available: %s'
+
+    # DeployBatch module
+    DEPLOY_FAILED = 'DeployError: Deferred deploy command failed for %s: %s'
+
+    # DeployJob module
+    OS_DEPLOY_STAGE = 'OSError: Failed to create the deploy directory: %s'
+
+    # FileContext module
     KEY_FILTER = 'KeyError: Filter function must be defined before being used in a section: %s'
 
+    # History module
+    OS_HISTORY = 'OSError: History database not available: %s'
+
     # Job module
     OPTION_NOT_SUPPORTED = 'Warning: Option not supported: Skipping option in the %s section: %s'
 
+    # JobFactory module
+    SYSTEM_TOOL = 'ShellError: Tool of the %s section not found in PATH: %s'
+
     # Main module
     ARGUMENT = 'ArgumentError: %s'
     JOB = 'JobError: Unexpected error detected during the job creation'
     KEYBOARD_ABORT_COMPILATION = 'KeyboardInterrupt: Aborting compilation for current program: %s'
     KEYBOARD_INTERRUPT = 'KeyboardInterrupt: Execution ended by user'
     SYSTEM_NUMBER = 'NumberError: Number of profile and source are not matching: profile: %s, source: %s'
+    SYSTEM_TMPFS = 'MissingOptionError: "clear" option required to use a tmpfs directory'
+    VALUE_JOBS = 'ValueError: The "jobs" option value must be a positive integer: current = %s, expected (example) = 8'
+    VALUE_TMPFS = 'ValueError: The "tmpfs" option value must be a writable directory: current = %s, expected (example) = /dev/shm'
+
+    # Manifest module
+    OS_MANIFEST = 'OSError: Manifest entry not available: %s'
 
     # Profile module
     OS_ISSUE_WORKDIR = 'OSError: Issue in the %s section with the option: workdir'
@@ -39,10 +60,22 @@ class ErrorMessage(enum.Enum):
     VALUE_EMPTY = 'ValueError: Option empty in the %s section: %s'
     WARNING_MANDATORY = 'Warning: Skipping mandatory section: %s'
 
+    # Resume module
+    VALUE_RESUME = 'ValueError: The "resume" option value must be a report file or an execution of the history database: current = %s, expected (example) = 12'
+
     # SetupJob module
     MISSING_BACKUP = 'MissingOptionError: "backup" option required to run housekeeping'
     VALUE_BACKUP = 'ValueError: The "backup" option value must be an integer: current = %s, expected (example) = 10'
     VALUE_HOUSEKEEPING = 'ValueError: The "housekeeping" option value must be a number of days: current = %s, expected (example) = 30d'
+    VALUE_LAYOUT = 'ValueError: The "layout" option value must be flat, hash or date: current = %s'
+    VALUE_QUOTA = 'ValueError: The "quota" option value must be a size: current = %s, expected (example) = 500M'
+    VALUE_STAGE = 'ValueError: The "stage" option value must be copy, link, reflink, symlink or auto: current = %s'
+
+    # Trash module
+    OS_TRASH = 'OSError: Cannot move directory to the trash, deleting it: %s'
+
+    # WorkdirIndex module
+    OS_INDEX = 'OSError: Working directory index not available: %s'
 
     # Handlers
 
@@ -79,7 +112,9 @@ class ErrorMessage(enum.Enum):
     # ShellHandler module
     CALLED_PROCESS = 'CalledProcessError: %s'
     KEY = 'KeyError: Environment variable not found: %s'
+    OS_FILTER = 'OSError: Failed to read the input file of the filter function: %s'
     PYODBC = 'pyodbc.Error: Generic I/O error: Connection failed: server does not exist or access denied'
     PYODBC_PROGRAMMING = 'pyodbc.ProgrammingError: Invalid SQL statement: %s'
+    RE_FILTER = 're.error: Invalid expression in the filter function: %s: %s'
     SYSTEM_SHELL = 'ShellError: Command does not exist: %s'
     UNICODE = 'UnicodeDecodeError: Using latin-1 instead of utf-8 to decode stdout and stderr'
\ No newline at end of file
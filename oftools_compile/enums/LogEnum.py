@@ -25,14 +25,29 @@ class LogMessage(enum.Enum):
     START_SECTION = '[%s] Start section: Input filename: %s'
     VALUE_EMPTY = 'Option empty in the %s section: Skipping option: %s'
 
+    # AsyncEngine module
+    START_LOOP = '(ENGINE) Start event loop with worker threads: %d'
+
+    # Cache module
+    CACHE_RESTORE = '(CACHE) Restore entry %s from %s'
+    CACHE_STORE = '(CACHE) Store entry %s to %s'
+
+    # CompileJob module
+    CACHE_HIT = '[%s] Skip compilation: Outputs restored from the cache'
+
     # Context module
     MANDATORY_ADD = 'Adding section to mandatory sections: %s'
 
+    # DeployBatch module
+    DEPLOY_FLUSH = '(DEPLOY) Run %d deferred deploy commands for %s: %s'
+
     # DeployJob module
     COMPILE_FOUND = '[%s] Evaluate completion status: Compile section found'
     COMPILE_NOT_FOUND = '[%s] Proceed deploy job only: Compile section not found'
     COMPLETE_FOUND = '[%s] Proceed deploy job execution: Complete compile section found'
     COMPLETE_NOT_FOUND = '[%s] Abort deploy job execution: Complete compile section not found'
+    DEPLOY_DEFERRED = '[%s] Deferred to the end of the batch: %s'
+    DEPLOY_SKIPPED = '[%s] Module unchanged since its last deployment: Skipping %s: %s'
     END_DATASET = '[%s] End dataset option processing'
     END_DEPLOY_FILE = '[%s] End file option processing'
     END_REGION = '[%s] End region option processing'
@@ -47,13 +62,17 @@ class LogMessage(enum.Enum):
     CP_SUCCESS = 'Successful copy of %s to %s'
     DIRECTORY_CREATED = 'Directory successfully created: %s'
     DIRECTORY_EMPTY = 'Directory empty: %s'
-    DIRECTORY_NOT_EXIST = 'Directory does not exist: Creating new directory: %s'
     DIRECTORY_REMOVED = 'Directory successfully removed: %s'
     DIRECTORY_SIZE_0 = 'Directory size equal to 0: %s'
+    STAGE_FALLBACK = 'Staging method not available: %s: %s'
+    STAGE_SUCCESS = 'Successful staging (%s) of %s to %s'
 
     # Grouping module
     AGGREGATE_LOG_FILE = '(GROUPING) Aggregate %s to group.log'
 
+    # History module
+    HISTORY_RUN = '(HISTORY) Record execution %d in the history database: %s'
+
     # Main module
     ABORT_FILE = 'Aborting source file processing: %s'
     PROFILE_PATH = 'Profile path: %s'
@@ -64,6 +83,12 @@ class LogMessage(enum.Enum):
     WARNING_INTERRUPT = "Ctrl+C only interrupts current compilation. Press Ctrl+\\ to interrupt the program"
     WORKING_DIRECTORY = 'Current working directory: %s'
 
+    # PipelineEngine module
+    START_PIPELINE = '(ENGINE) Start pipeline with queues of %d files: %s'
+
+    # ProcessEngine module
+    START_POOL = '(ENGINE) Start pool of worker processes: %d'
+
     # Profile module
     MANDATORY_SECTIONS = 'Mandatory sections: %s'
     MANDATORY_FILTER = 'Filter function not allowed in mandatory section: %s'
@@ -75,6 +100,8 @@ class LogMessage(enum.Enum):
     # Report module
     BUILD_STATUS = 'BUILD %s (%fs)'
     CREATE_REPORT_FILE = '(REPORT) Create report file: %s'
+    OPEN_REPORT_FILE = '(REPORT) Open report file of the execution resumed: %s'
+    REWRITE_REPORT_FILE = '(REPORT) Rewrite report file with the current columns: %s'
     REPORT_GENERATED = '(REPORT) CSV report successfully generated: %s'
     REPORT_SUMMARY = '======== SUMMARY ================================================================='
     TOTAL_PROGRAMS = 'TOTAL      : %d'
@@ -82,29 +109,46 @@ class LogMessage(enum.Enum):
     TOTAL_FAIL = 'FAIL       : %d'
     TOTAL_TIME = 'TOTAL TIME : %fs'
 
+    # Resume module
+    RESUME_COUNT = '(RESUME) Source files skipped: %d of %d'
+    RESUME_RUN = '(RESUME) Resume execution: report = %s, history record = %s'
+    RESUME_SKIP = '(RESUME) Skip source file already successful and unchanged: %s'
+
+    # Retention module
+    RETENTION_DELETE = '(RETENTION) Delete working directory: %s: %s'
+    RETENTION_SCAN = '(RETENTION) Look up working directories of %s: %d directories'
+
     # SetupJob module
-    ADD_TIME_TO_TIME_STAMP = '[%s] Add 1 second to the time stamp: directory already exists: %s'
     CD_COMMAND = '[%s] cd %s'
     END_LOG_FILE = '[%s] End log file initialization'
-    END_CLEANING = '[%s] Root working directory now clean: %s'
     END_SETUP_FILE = '[%s] End source file copy'
     END_WORKING_DIRECTORY = '[%s] End working directory creation'
     MKDIR_COMMAND = '[%s] mkdir %s'
-    NOT_OLD_ENOUGH = '[%s] No directory found old enough to be deleted: Skipping option: %s'
-    START_CLEANING = '[%s] Start cleaning root working directory: %s'
+    RETENTION_DEFERRED = '[%s] Cleaning deferred to the retention of the execution: %s'
     START_LOG_FILE = '[%s] Initialize log file'
     START_SETUP_FILE = '[%s] Start source file copy'
     START_WORKING_DIRECTORY = '[%s] Start working directory creation'
-    VALUE_BELOW_THRESHOLD = '[%s] Number of backups below threshold (%d < %d): Skipping option: %s'
+    WORKDIR_EXISTS = '[%s] Directory already exists: Use next sequence number: %s'
 
     # Source module
     SOURCE_COUNT = '(SOURCE) Number of source files being compiled: %d'
     SOURCE_FORCE = '(SOURCE) Force source: force option enabled'
+    SOURCE_SCHEDULE = '(SOURCE) Longest source files first: %d of %d source files with a known elapsed time'
     SOURCE_TYPE = '(SOURCE) Source type specified: %s'
 
+    # Trash module
+    TRASH_DISCARD = '(TRASH) Directory moved to the trash: %s'
+    TRASH_SWEEP = '(TRASH) Empty the trash %s: %d directories'
+
+    # WorkdirIndex module
+    INDEX_SCAN = '(INDEX) Index working directories of %s: %d directories'
+
     # Handlers
 
     # ShellHandler module
+    FILTER_CACHE_HIT = 'Filter function result reused from cache: %s: %d hit(s)'
     FILTER_FALSE = '[%s] Filter function %s result: False: Skipping section'
     FILTER_NONE = '[%s] No filter function: Executing section'
     FILTER_TRUE = '[%s] Filter function %s result: True: Executing section'
+    OUTPUT_FILES = 'Command output written to: %s, %s'
+    SHELL_FALLBACK = 'Command not executed directly: Running it with the shell: %s'
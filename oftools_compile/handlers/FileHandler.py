@@ -14,6 +14,7 @@ Typical usage example:
 import configparser
 import collections
 import csv
+import fcntl
 import json
 import os
 import shutil
@@ -60,6 +61,10 @@ class FileHandler(object, metaclass=SingletonMeta):
         read_file(path) -- Opens and reads a file.
         write_file(path, content, mode) -- Writes content to the file.
         copy_file(src, dst) -- Copies the source file to its given destination.
+        stage_file(src, dst, method) -- Makes the source file available at its
+            given destination, without copying it if possible.
+        _clone_file(src, dst, method) -- Copies the content of the source file
+            inside the kernel.
         delete_file(path) -- Deletes the file.
         check_extension(path, extension) -- Checks of the given file has the
             correct extension.
@@ -315,6 +320,96 @@ class FileHandler(object, metaclass=SingletonMeta):
 
         return return_code
 
+    def stage_file(self, src, dst, method="copy"):
+        """Makes the source file available at its given destination, without
+        copying it if possible.
+
+        Methods:
+            copy: regular copy of the file.
+            link: hard link, the file must not be modified in place.
+            reflink: copy-on-write clone of the file, on Btrfs or XFS.
+            symlink: symbolic link, for read-only source files.
+            auto: reflink, then in-kernel copy with copy_file_range.
+
+        If the method is not supported, or if the destination already exists,
+        the file is copied.
+
+        Arguments:
+            src {string} -- Absolute path of the source file.
+            dst {string} -- Absolute path of the destination file.
+            method {string} -- Method used to stage the file.
+
+        Returns:
+            integer -- Return code of the method.
+        """
+        src_expand = os.path.expandvars(src)
+        dst_expand = os.path.expandvars(dst)
+        if os.path.isdir(dst_expand):
+            dst_expand = os.path.join(dst_expand, os.path.basename(src_expand))
+
+        if method == "auto":
+            attempts = ["reflink"]
+            if hasattr(os, "copy_file_range"):
+                attempts.append("copy_file_range")
+        elif method in ("link", "reflink", "symlink"):
+            attempts = [method]
+        else:
+            attempts = []
+
+        if os.path.lexists(dst_expand):
+            attempts = []
+
+        for attempt in attempts:
+            try:
+                if attempt == "link":
+                    os.link(src_expand, dst_expand)
+                elif attempt == "symlink":
+                    os.symlink(os.path.abspath(src_expand), dst_expand)
+                else:
+                    self._clone_file(src_expand, dst_expand, attempt)
+                Log().logger.debug(LogMessage.STAGE_SUCCESS.value %
+                                   (attempt, src, dst))
+                return 0
+            except OSError as error:
+                Log().logger.debug(LogMessage.STAGE_FALLBACK.value %
+                                   (attempt, error))
+
+        return self.copy_file(src, dst)
+
+    @staticmethod
+    def _clone_file(src, dst, method):
+        """Copies the content of the source file inside the kernel.
+
+        Arguments:
+            src {string} -- Absolute path of the source file.
+            dst {string} -- Absolute path of the destination file, which must
+                not exist.
+            method {string} -- Either reflink or copy_file_range.
+
+        Raises:
+            OSError -- Exception raised if the file system does not support
+                the method, the destination file is then removed.
+        """
+        with open(src, "rb") as fd_src, open(dst, "xb") as fd_dst:
+            try:
+                if method == "reflink":
+                    # FICLONE ioctl, shares the extents of the source file
+                    fcntl.ioctl(fd_dst.fileno(), 0x40049409, fd_src.fileno())
+                else:
+                    remaining = os.fstat(fd_src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fd_src.fileno(),
+                                                    fd_dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            except OSError:
+                fd_dst.close()
+                os.remove(dst)
+                raise
+
+        shutil.copymode(src, dst)
+
     @staticmethod
     def delete_file(path):
         """Deletes the file.
@@ -401,15 +496,11 @@ class FileHandler(object, metaclass=SingletonMeta):
         try:
             path_expand = os.path.expandvars(path)
 
-            # Check if the directory already exists
-            if os.path.isdir(path_expand) is False:
-                Log().logger.debug(LogMessage.DIRECTORY_NOT_EXIST.value % path)
-                os.mkdir(path_expand)
+            # No prior check, mkdir fails atomically if the directory exists
+            os.mkdir(path_expand)
 
-                Log().logger.debug(LogMessage.DIRECTORY_CREATED.value % path)
-                return_code = 0
-            else:
-                raise FileExistsError()
+            Log().logger.debug(LogMessage.DIRECTORY_CREATED.value % path)
+            return_code = 0
         except FileExistsError:
             if path_type == "group":
                 Log().logger.error(ErrorMessage.FILE_EXISTS.value % path)
@@ -11,7 +11,13 @@ Typical usage example:
 """
 
 # Generic/Built-in modules
+import asyncio
+import concurrent.futures
+import fnmatch
+import mmap
 import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
@@ -46,63 +52,356 @@ class ShellHandler(metaclass=SingletonMeta):
     Attributes:
         _env {dictionary} -- Environment variables for the execution of the
             program.
+        _variable_pattern {Pattern} -- Regular expression matching an
+            environment variable in a string.
+        _command_paths {dictionary} -- Commands and PATH values, and the
+            absolute path of the command found with them.
+        _tail_size {integer} -- Number of bytes kept from the end of the
+            output files of a command for logging purposes.
+        _shell_characters {frozenset} -- Characters for which a command needs
+            to be run by the shell.
+        _filter_patterns {dictionary} -- Native filter functions and their
+            precompiled regular expression.
+        _filter_alternations {dictionary} -- Combinations of "re:" filter
+            functions and their precompiled alternation.
+        _filter_cache {dictionary} -- Keys of the native filter functions
+            already evaluated and their return code.
+        _filter_cache_hits {integer} -- Number of filter function results
+            reused from the filter cache.
+        _flags_pattern {Pattern} -- Regular expression matching the global
+            inline flags at the start of a filter expression.
+        _mmap_threshold {integer} -- Size in bytes from which a file scanned
+            by the filter functions is memory-mapped.
+        _loop {AbstractEventLoop} -- Event loop running the commands, the
+            commands are run directly in the calling thread if None.
+        _semaphore {Semaphore} -- Semaphore limiting the number of commands
+            running at the same time in the event loop.
+        _tasks {set} -- Tasks of the commands currently running in the event
+            loop.
+        _interrupted {boolean} -- Whether the commands submitted to the event
+            loop are cancelled right away.
 
     Methods:
-        _is_command_exist(command) -- Checks if the command exists in the
-            environment using which.
-        _run_command(command, env) -- Runs the command, using variables from
-            the environment if any.
+        _is_command_exist(command, env, cwd=None) -- Checks if the command
+            exists in the environment using which.
+        resolve_command(command, env=None, cwd=None) -- Resolves the absolute
+            path of the command using which.
+        _split_command(command) -- Splits the command into a list of
+            arguments, if it can be executed without a shell.
+        attach_loop(loop, limit) -- Runs the commands of all the threads in
+            the given event loop.
+        detach_loop() -- Runs the commands directly in the calling thread
+            again.
+        cancel_commands(interrupt) -- Kills all the commands running in the
+            event loop.
+        _run_command_async(command, env, cwd, stdout, stderr) -- Runs the
+            command as a subprocess of the event loop.
+        _run_command(command, env, cwd) -- Runs the command, using variables
+            from the environment if any.
         _read_command(process) -- Decode stdout and stderr from the
             CompletedProcess object.
+        _read_tail(path) -- Decode the end of an output file of a command.
         _log_command(stdout, stderr, return_code, command_type) -- Log output
             and errors if any, with different log levels.
-        execute_command(command, command_type, env=None) -- Executes shell
-            command.
-
-        evaluate_filter(section, filter_name): Evaluates the status of the
-            filter function passed as an argument.
-
-        evaluate_env_variable(self, environment_variable) -- Evaluates if the
-            input variable exists in the current environment.
+        execute_command(command, command_type, env=None, cwd=None,
+            output_path=None) -- Executes shell command.
+
+        _compile_filter(function) -- Compiles the regular expression of a
+            native filter function.
+        _compile_filters(functions) -- Combines the regular expressions of
+            several "re:" filter functions into one alternation.
+        _search_lines(pattern, content, position) -- Searches the expression
+            in each line of the content, from the line of the given position.
+        _search_content(pattern, content) -- Searches the expression in the
+            content without matching across lines.
+        _scan_content(functions, content) -- Searches the content for all the
+            "re:" filter functions at once.
+        scan_filters(functions, file_path) -- Evaluates all the "re:" filter
+            functions in a single read of the file.
+        _get_filter_key(function, env) -- Gets the key of the filter function
+            in the filter cache.
+        _count_filter_hit(function) -- Counts a filter function result reused
+            from the filter cache.
+        _evaluate_native_filter(function, env) -- Evaluates a native filter
+            function in Python, without running a shell command.
+        evaluate_filter(function, name, section, env, cwd=None, results=None)
+            -- Evaluates the status of the filter function passed as an
+            argument.
+
+        expand_variables(value, env) -- Expands the environment variables in
+            the input value using the given environment.
+        evaluate_env_variable(environment_variable, env=None) -- Evaluates if
+            the input variable exists in the given environment.
     """
 
     def __init__(self):
         """Initializes all attributes of the class.
         """
         self._env = os.environ.copy()
+        self._variable_pattern = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+        self._command_paths = {}
+        self._tail_size = 64 * 1024
+        self._shell_characters = frozenset("|&;<>()$`\\*?[]#~!\n")
+        self._filter_patterns = {}
+        self._filter_alternations = {}
+        self._filter_cache = {}
+        self._filter_cache_hits = 0
+        self._flags_pattern = re.compile(r"\(\?([aiLmsux]+)\)")
+        self._mmap_threshold = 1024 * 1024
+        self._loop = None
+        self._semaphore = None
+        self._tasks = set()
+        self._interrupted = False
 
     # Shell command related methods
 
-    @staticmethod
-    def _is_command_exist(command):
+    def _is_command_exist(self, command, env, cwd=None):
         """Checks if the command exists in the environment using which.
 
         Arguments:
             command {string} -- Shell command that needs to be checked.
+            env {dictionary} -- Environment variables currently in the shell
+                environment.
+            cwd {string} -- Absolute path of the directory where the command
+                is executed, the current directory if None.
 
         Returns:
             boolean -- True if the command does exist, and False otherwise.
         """
-        return bool(shutil.which(command))
+        return bool(self.resolve_command(command, env, cwd))
 
-    @staticmethod
-    def _run_command(command, env):
+    def resolve_command(self, command, env=None, cwd=None):
+        """Resolves the absolute path of the command using which.
+
+        The PATH of the given environment is used for the resolution, and the
+        commands found are cached by command and PATH value, so the PATH
+        directories are only scanned again when a profile changes the PATH. A
+        command containing a slash is not searched in the PATH but relative to
+        the directory where it is executed, and is not cached.
+
+        Arguments:
+            command {string} -- Shell command that needs to be resolved.
+            env {dictionary} -- Environment variables currently in the shell
+                environment.
+            cwd {string} -- Absolute path of the directory where the command
+                is executed, the current directory if None.
+
+        Returns:
+            string -- Absolute path of the command, or None if it does not
+                exist.
+        """
+        if "/" in command:
+            return shutil.which(os.path.join(cwd or os.getcwd(), command))
+
+        if env is None:
+            env = self._env
+        key = (command, env.get("PATH"))
+
+        if key not in self._command_paths:
+            command_path = shutil.which(command, path=key[1])
+            if command_path is None:
+                return None
+            self._command_paths[key] = command_path
+
+        return self._command_paths[key]
+
+    def _split_command(self, command):
+        """Splits the command into a list of arguments, if it can be executed
+        without a shell.
+
+        Arguments:
+            command {string} -- Shell command that needs to be split.
+
+        Returns:
+            list[string] -- Arguments of the command, or None if the command
+                contains pipes, redirections, globs, variables or any other
+                shell syntax.
+        """
+        if any(character in self._shell_characters for character in command):
+            return None
+
+        try:
+            args = shlex.split(command)
+        except ValueError:
+            return None
+
+        # Variable assignment before the command
+        if len(args) == 0 or "=" in args[0]:
+            return None
+
+        return args
+
+    def attach_loop(self, loop, limit):
+        """Runs the commands of all the threads in the given event loop.
+
+        Arguments:
+            loop {AbstractEventLoop} -- Event loop running in the main thread.
+            limit {integer} -- Maximum number of commands running at the same
+                time.
+        """
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(limit)
+        self._tasks = set()
+        self._interrupted = False
+
+    def detach_loop(self):
+        """Runs the commands directly in the calling thread again.
+        """
+        self._loop = None
+        self._semaphore = None
+        self._tasks = set()
+        self._interrupted = False
+
+    def cancel_commands(self, interrupt=False):
+        """Kills all the commands running in the event loop.
+
+        This method must be called from the event loop. The threads waiting
+        for a cancelled command get a KeyboardInterrupt, as if the user pressed
+        Ctrl + C during a serial execution.
+
+        Arguments:
+            interrupt {boolean} -- Whether the commands submitted afterwards
+                are also cancelled.
+        """
+        self._interrupted = self._interrupted or interrupt
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def _run_command_async(self, command, env, cwd, stdout, stderr):
+        """Runs the command as a subprocess of the event loop.
+
+        As for the synchronous execution, a simple command is executed directly
+        with its list of arguments, and any other command by the shell.
+
+        Arguments:
+            command {string} -- Shell command that needs to be executed.
+            env {dictionary} -- Environment variables currently in the shell
+                environment.
+            cwd {string} -- Absolute path of the directory where the command
+                is executed, the current directory if None.
+            stdout {integer or file object} -- Destination of the standard
+                output.
+            stderr {integer or file object} -- Destination of the standard
+                error.
+
+        Returns:
+            CompletedProcess object -- Object containing multiple information
+                on the command execution.
+
+        Raises:
+            asyncio.CancelledError -- Exception raised if the command is
+                cancelled, the process is killed before raising it again.
+        """
+        if self._interrupted is True:
+            raise asyncio.CancelledError()
+
+        # asyncio.current_task is not available before Python 3.7
+        if sys.version_info >= (3, 7):
+            task = asyncio.current_task()
+        else:
+            task = asyncio.Task.current_task()
+        self._tasks.add(task)
+        process = None
+
+        try:
+            async with self._semaphore:
+                args = self._split_command(command)
+
+                if args is not None:
+                    try:
+                        process = await asyncio.create_subprocess_exec(
+                            *args,
+                            executable=self.resolve_command(
+                                args[0], env, cwd),
+                            stdout=stdout,
+                            stderr=stderr,
+                            cwd=cwd,
+                            env=env)
+                    except OSError:
+                        process = None
+
+                if process is None:
+                    process = await asyncio.create_subprocess_shell(
+                        command,
+                        stdout=stdout,
+                        stderr=stderr,
+                        cwd=cwd,
+                        env=env)
+
+                output, error = await process.communicate()
+        except asyncio.CancelledError:
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        finally:
+            self._tasks.discard(task)
+
+        return subprocess.CompletedProcess(command, process.returncode, output,
+                                           error)
+
+    def _run_command(self, command, env, cwd, stdout=subprocess.PIPE,
+                     stderr=subprocess.PIPE):
         """Runs the command, using variables from the environment if any.
 
+        A simple command is executed directly with its list of arguments,
+        which avoids starting a shell for each command. The command is run by
+        the shell if it contains any shell syntax, or if it cannot be executed
+        directly, such as a script without shebang. If an event loop is
+        attached, the command is run in the event loop and the calling thread
+        waits for its completion.
+
         Arguments:
             command {string} -- Shell command that needs to be executed.
             env {dictionary} -- Environment variables currently in the shell
                 environment.
+            cwd {string} -- Absolute path of the directory where the command
+                is executed, the current directory if None.
+            stdout {integer or file object} -- Destination of the standard
+                output, captured in memory by default.
+            stderr {integer or file object} -- Destination of the standard
+                error, captured in memory by default.
 
         Returns:
             CompletedProcess object -- Object containing multiple information
                 on the command execution.
+
+        Raises:
+            KeyboardInterrupt -- Exception raised if the command is cancelled
+                in the event loop.
         """
+        if self._loop is not None:
+            future = asyncio.run_coroutine_threadsafe(
+                self._run_command_async(command, env, cwd, stdout, stderr),
+                self._loop)
+            try:
+                return future.result()
+            except concurrent.futures.CancelledError:
+                raise KeyboardInterrupt() from None
+
+        args = self._split_command(command)
+
+        if args is not None:
+            try:
+                process = subprocess.run(args,
+                                         executable=self.resolve_command(
+                                             args[0], env, cwd),
+                                         stdout=stdout,
+                                         stderr=stderr,
+                                         check=False,
+                                         cwd=cwd,
+                                         env=env)
+            except OSError as error:
+                Log().logger.debug(LogMessage.SHELL_FALLBACK.value % error)
+            else:
+                return process
+
         process = subprocess.run(command,
                                  shell=True,
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE,
+                                 stdout=stdout,
+                                 stderr=stderr,
                                  check=False,
+                                 cwd=cwd,
                                  env=env)
         return process
 
@@ -133,6 +432,44 @@ class ShellHandler(metaclass=SingletonMeta):
 
         return stdout, stderr, return_code
 
+    def _read_tail(self, path):
+        """Decode the end of an output file of a command.
+
+        Only the last bytes of the file are read, so the memory used does not
+        depend on the size of the output.
+
+        Arguments:
+            path {string} -- Absolute path of the output file.
+
+        Returns:
+            string -- End of the output file.
+
+        Raises:
+            UnicodeDecodeError -- Exception raised if there is an issue
+                decoding a certain character in the output.
+        """
+        with open(path, "rb") as fd:
+            size = os.fstat(fd.fileno()).st_size
+            if size > self._tail_size:
+                fd.seek(size - self._tail_size)
+                output = fd.read()
+                # Skip the end of a multi-byte character cut by the seek
+                start = 0
+                while start < 3 and output[start:start + 1] and (
+                        output[start] & 0xC0) == 0x80:
+                    start += 1
+                output = b"...\n" + output[start:]
+            else:
+                output = fd.read()
+
+        try:
+            output = output.decode("utf_8")
+        except UnicodeDecodeError:
+            Log().logger.debug(ErrorMessage.UNICODE.value)
+            output = output.decode("latin_1")
+
+        return output
+
     @staticmethod
     def _log_command(stdout, stderr, return_code, command_type):
         """Log output and errors if any, with different log levels.
@@ -156,17 +493,33 @@ class ShellHandler(metaclass=SingletonMeta):
             Log().logger.error(stdout)
             Log().logger.error(stderr)
 
-    def execute_command(self, command, command_type="", env=None):
+    def execute_command(self,
+                        command,
+                        command_type="",
+                        env=None,
+                        cwd=None,
+                        output_path=None):
         """Executes shell command.
 
         This method is dedicated to execute a shell command and it handles
-        exceptions in case of failure.
+        exceptions in case of failure. The environment variables of the command
+        are expanded using the given environment, and the process environment
+        and current directory are never modified.
+
+        If an output path is given, the standard output and error of the
+        command are written directly to the files <output_path>.out and
+        <output_path>.err instead of being kept in memory, and only the end of
+        each of them is returned and logged.
 
         Arguments:
             command {string} -- Shell command that needs to be executed.
             command_type {string} -- Type of the command to execute.
             env {dictionary} -- Environment variables currently in the shell
                 environment.
+            cwd {string} -- Absolute path of the directory where the command
+                is executed, the current directory if None or empty.
+            output_path {string} -- Absolute path, without extension, of the
+                files where the output of the command is written.
 
         Returns:
             tuple -- stdout, stderr, and return code of the shell command.
@@ -180,8 +533,10 @@ class ShellHandler(metaclass=SingletonMeta):
         """
         if env is None:
             env = self._env
+        if not cwd:
+            cwd = None
 
-        command = os.path.expandvars(command)
+        command = self.expand_variables(command, env)
 
         if command_type != "deploy":
             Log().logger.debug(command)
@@ -189,9 +544,21 @@ class ShellHandler(metaclass=SingletonMeta):
         root_command = command.split()[0]
 
         try:
-            if self._is_command_exist(root_command):
-                process = self._run_command(command, env)
-                stdout, stderr, return_code = self._read_command(process)
+            if self._is_command_exist(root_command, env, cwd):
+                if output_path is None:
+                    process = self._run_command(command, env, cwd)
+                    stdout, stderr, return_code = self._read_command(process)
+                else:
+                    with open(output_path + ".out", "wb") as fd_out, open(
+                            output_path + ".err", "wb") as fd_err:
+                        process = self._run_command(command, env, cwd, fd_out,
+                                                    fd_err)
+                    stdout = self._read_tail(output_path + ".out")
+                    stderr = self._read_tail(output_path + ".err")
+                    return_code = process.returncode
+                    Log().logger.debug(LogMessage.OUTPUT_FILES.value %
+                                       (output_path + ".out",
+                                        output_path + ".err"))
             else:
                 raise SystemError()
         except KeyboardInterrupt as exception:
@@ -213,21 +580,361 @@ class ShellHandler(metaclass=SingletonMeta):
 
     # Filter functions
 
-    def evaluate_filter(self, function, name, section, env):
+    def _compile_filter(self, function):
+        """Compiles the regular expression of a native filter function.
+
+        The expression of a "re:" filter is compiled as a bytes pattern in
+        multiline mode, so that ^ and $ match at each line of the file.
+        The expression of a "glob:" filter is translated to a regular
+        expression using fnmatch. Each expression is compiled once and reused
+        for all the source files.
+
+        Arguments:
+            function {string} -- Native filter function.
+
+        Returns:
+            Pattern -- Precompiled regular expression of the filter function.
+
+        Raises:
+            re.error -- Exception raised if the expression of the filter
+                function is not a valid regular expression.
+        """
+        if function not in self._filter_patterns:
+            try:
+                if function.startswith("re:"):
+                    pattern = re.compile(function[3:].encode("utf_8"),
+                                         re.MULTILINE)
+                else:
+                    pattern = re.compile(fnmatch.translate(function[5:]))
+            except re.error as error:
+                Log().logger.critical(ErrorMessage.RE_FILTER.value %
+                                      (function, error))
+                Log().logger.critical(ErrorMessage.ABORT.value)
+                sys.exit(-1)
+            self._filter_patterns[function] = pattern
+
+        return self._filter_patterns[function]
+
+    def _compile_filters(self, functions):
+        """Combines the regular expressions of several "re:" filter functions
+        into one alternation, each of them in its own named group.
+
+        A global inline flag at the start of an expression, such as (?i), is
+        turned into a scoped flag so that it only applies to its own
+        alternative.
+
+        Arguments:
+            functions {tuple[string]} -- Native "re:" filter functions.
+
+        Returns:
+            tuple -- Precompiled alternation, and dictionary of the group
+                names and their filter function. The alternation is None if
+                the expressions cannot be combined.
+        """
+        if functions not in self._filter_alternations:
+            alternatives = []
+            groups = {}
+
+            for i, function in enumerate(functions):
+                expression = function[3:]
+                match = self._flags_pattern.match(expression)
+                if match:
+                    expression = "(?%s:%s)" % (match.group(1),
+                                               expression[match.end():])
+                group = "f%d" % i
+                alternatives.append("(?P<%s>%s)" % (group, expression))
+                groups[group] = function
+
+            try:
+                pattern = re.compile(
+                    "|".join(alternatives).encode("utf_8"), re.MULTILINE)
+            except re.error:
+                pattern = None
+            self._filter_alternations[functions] = (pattern, groups)
+
+        return self._filter_alternations[functions]
+
+    @staticmethod
+    def _search_lines(pattern, content, position=0):
+        """Searches the expression in each line of the content, from the line
+        of the given position.
+
+        The search of each line ends at its line break, so the expression
+        cannot match across lines, like grep.
+
+        Arguments:
+            pattern {Pattern} -- Precompiled regular expression.
+            content {bytes or mmap} -- Content of the source file.
+            position {integer} -- Position in the first line to search.
+
+        Returns:
+            boolean -- True if the expression matches a line.
+        """
+        start = content.rfind(b"\n", 0, position) + 1
+        size = len(content)
+
+        while start <= size:
+            end = content.find(b"\n", start)
+            if end < 0:
+                end = size
+            if pattern.search(content, start, end):
+                return True
+            start = end + 1
+
+        return False
+
+    def _search_content(self, pattern, content):
+        """Searches the expression in the content without matching across
+        lines.
+
+        The whole content is searched at once. Only if the match spans a line
+        break, such as with \\s or [^x], the search goes on line by line from
+        the line where the match starts, no earlier line being able to match.
+
+        Arguments:
+            pattern {Pattern} -- Precompiled regular expression.
+            content {bytes or mmap} -- Content of the source file.
+
+        Returns:
+            boolean -- True if the expression matches a line.
+        """
+        match = pattern.search(content)
+        if match is None:
+            return False
+        if b"\n" not in match.group():
+            return True
+
+        return self._search_lines(pattern, content, match.start())
+
+    def _scan_content(self, functions, content):
+        """Searches the content for all the "re:" filter functions at once.
+
+        The combined alternation returns the leftmost match of all the
+        remaining expressions. Each time an expression matches, it is removed
+        from the alternation and the search resumes at the same position, so
+        the content is read only once when no expression overlaps another one.
+        An expression whose match spans a line break is removed as well, and
+        searched line by line from there.
+
+        Arguments:
+            functions {list[string]} -- Native "re:" filter functions.
+            content {bytes or mmap} -- Content of the source file.
+
+        Returns:
+            dictionary -- Filter functions and their result.
+        """
+        results = {}
+        remaining = []
+
+        # Expressions with their own groups cannot be combined
+        for function in functions:
+            if self._compile_filter(function).groups > 0:
+                results[function] = self._search_content(
+                    self._compile_filter(function), content)
+            else:
+                results[function] = False
+                remaining.append(function)
+
+        position = 0
+        while remaining:
+            pattern, groups = self._compile_filters(tuple(remaining))
+            if pattern is None:
+                for function in remaining:
+                    results[function] = self._search_content(
+                        self._compile_filter(function), content)
+                break
+
+            match = pattern.search(content, position)
+            if match is None:
+                break
+            function = groups[match.lastgroup]
+            if b"\n" in match.group():
+                results[function] = self._search_lines(
+                    self._compile_filter(function), content, match.start())
+            else:
+                results[function] = True
+            remaining.remove(function)
+            position = match.start()
+
+        return results
+
+    def scan_filters(self, functions, file_path):
+        """Evaluates all the "re:" filter functions in a single read of the
+        file.
+
+        Large files are memory-mapped instead of being read in memory.
+
+        Arguments:
+            functions {list[string]} -- Native "re:" filter functions.
+            file_path {string} -- Absolute path of the file.
+
+        Returns:
+            dictionary -- Filter functions and their result, False for all of
+                them if the file cannot be read.
+
+        Raises:
+            OSError -- Exception raised if the file cannot be read.
+        """
+        results = {}
+        functions_to_scan = []
+        source_env = {"OF_COMPILE_SOURCE": file_path}
+
+        # Reuse results of the same file from previous processing
+        for function in functions:
+            key = self._get_filter_key(function, source_env)
+            if key in self._filter_cache:
+                results[function] = self._filter_cache[key] == 0
+                self._count_filter_hit(function)
+            else:
+                results[function] = False
+                functions_to_scan.append(function)
+
+        if not functions_to_scan:
+            return results
+
+        try:
+            with open(file_path, "rb") as fd:
+                if os.fstat(fd.fileno()).st_size >= self._mmap_threshold:
+                    with mmap.mmap(fd.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as content:
+                        scan_results = self._scan_content(
+                            functions_to_scan, content)
+                else:
+                    scan_results = self._scan_content(functions_to_scan,
+                                                      fd.read())
+        except OSError as error:
+            Log().logger.debug(ErrorMessage.OS_FILTER.value % error)
+        else:
+            for function, result in scan_results.items():
+                results[function] = result
+                key = self._get_filter_key(function, source_env)
+                if key is not None:
+                    if result is True:
+                        self._filter_cache[key] = 0
+                    else:
+                        self._filter_cache[key] = 1
+
+        return results
+
+    def _get_filter_key(self, function, env):
+        """Gets the key of the filter function in the filter cache.
+
+        The key is made of the path, the modification time and the size of the
+        source file, and the expression of the filter function. Only the
+        native filter functions are cached, as they only depend on the source
+        file. A shell filter function may test the files of the working
+        directory, such as test -f or ls, which change from one section to
+        another.
+
+        Arguments:
+            function {string} -- Filter function.
+            env {dictionary} -- Environment variables currently in the shell
+                environment.
+
+        Returns:
+            tuple -- Key of the filter function, or None if the filter function
+                cannot be cached.
+        """
+        source_file_path = env.get("OF_COMPILE_SOURCE", "")
+        if source_file_path == "" or not function.startswith(("re:", "glob:")):
+            return None
+
+        try:
+            stat = os.stat(source_file_path)
+        except OSError:
+            return None
+
+        return (source_file_path, stat.st_mtime_ns, stat.st_size, function)
+
+    def _count_filter_hit(self, function):
+        """Counts a filter function result reused from the filter cache.
+
+        Arguments:
+            function {string} -- Filter function.
+        """
+        self._filter_cache_hits += 1
+        Log().logger.debug(LogMessage.FILTER_CACHE_HIT.value %
+                           (function, self._filter_cache_hits))
+
+    def _evaluate_native_filter(self, function, env):
+        """Evaluates a native filter function in Python, without running a
+        shell command.
+
+        Supported native filter functions:
+            re:<expression> -- True if a line of the source file
+                ($OF_COMPILE_SOURCE) matches the regular expression.
+            glob:<pattern> -- True if the name of the source file matches the
+                pattern, or its absolute path if the pattern contains a "/".
+
+        Arguments:
+            function {string} -- Native filter function.
+            env {dictionary} -- Environment variables currently in the shell
+                environment.
+
+        Returns:
+            integer -- Return code of the filter function, 0 if it matches
+                like grep.
+        """
+        source_file_path = env.get("OF_COMPILE_SOURCE", "")
+
+        if function.startswith("re:"):
+            match = self.scan_filters([function], source_file_path)[function]
+        else:
+            if "/" not in function:
+                source_file_path = os.path.basename(source_file_path)
+            match = bool(self._compile_filter(function).match(source_file_path))
+
+        if match is True:
+            return_code = 0
+        else:
+            return_code = 1
+
+        return return_code
+
+    def evaluate_filter(self, function, name, section, env, cwd=None,
+                        results=None):
         """Evaluates the status of the filter function passed as an argument.
 
+        Filter functions already evaluated are read from the results or from
+        the filter cache. Filter functions starting with "re:" or "glob:" are
+        evaluated natively in Python, any other filter function is run as a
+        shell command.
+
         Arguments:
             function {string} -- Shell command that needs to be executed.
             name {string} -- Name of the filter function.
             section {string} -- Name of the section.
             env {dictionary} -- Environment variables currently in the shell
                 environment.
+            cwd {string} -- Absolute path of the directory where the filter
+                function is executed.
+            results {dictionary} -- Filter functions already evaluated and
+                their result.
 
         Returns:
             None or boolean -- Result of the filter function evaluation.
         """
         if function != "":
-            _, _, return_code = self.execute_command(function, "filter", env)
+            key = self._get_filter_key(function, env)
+
+            if results is not None and function in results:
+                if results[function] is True:
+                    return_code = 0
+                else:
+                    return_code = 1
+            elif key in self._filter_cache:
+                return_code = self._filter_cache[key]
+                self._count_filter_hit(function)
+            else:
+                if function.startswith(("re:", "glob:")):
+                    return_code = self._evaluate_native_filter(function, env)
+                else:
+                    _, _, return_code = self.execute_command(
+                        function, "filter", env, cwd)
+
+                # Errors, such as a missing file, are not cached
+                if key is not None and return_code in (0, 1):
+                    self._filter_cache[key] = return_code
 
             # grep command returns 0 if there is any line match
             if return_code == 0:
@@ -246,13 +953,42 @@ class ShellHandler(metaclass=SingletonMeta):
 
     # Environment variables
 
+    def expand_variables(self, value, env):
+        """Expands the environment variables in the input value using the
+        given environment.
+
+        It works the same way as os.path.expandvars, but without relying on
+        the process environment: variables of the form $name or ${name} are
+        replaced, and unknown variables are left unchanged.
+
+        Arguments:
+            value {string} -- Value containing environment variables.
+            env {dictionary} -- Environment variables used for the expansion.
+
+        Returns:
+            string -- Value with environment variables expanded.
+        """
+        if "$" not in value:
+            return value
+
+        def replace(match):
+            name = match.group(1)
+            if name.startswith("{") and name.endswith("}"):
+                name = name[1:-1]
+            return env.get(name, match.group(0))
+
+        return self._variable_pattern.sub(replace, value)
+
     @staticmethod
-    def evaluate_env_variable(environment_variable):
-        """Evaluates if the input variable exists in the current environment.
+    def evaluate_env_variable(environment_variable, env=None):
+        """Evaluates if the input variable exists in the given environment.
 
         Arguments:
             environment_variable {string} -- Environment variable that needs to
                 be evaluated.
+            env {dictionary} -- Environment variables of the file processing,
+                such as the env of its FileContext, the process environment if
+                None.
 
         Returns:
             string -- Result of the environment variable evaluation.
@@ -260,8 +996,11 @@ class ShellHandler(metaclass=SingletonMeta):
         Raises:
             KeyError -- Exception raised if the variable does not exist.
         """
+        if env is None:
+            env = os.environ
+
         try:
-            env_variable = os.environ[environment_variable]
+            env_variable = env[environment_variable]
         except KeyError:
             Log().logger.critical(ErrorMessage.KEY.value % environment_variable)
             sys.exit(-1)
@@ -4,7 +4,7 @@
 
 Typical usage example:
   job = CompileJob()
-  job.run(file_path_in)
+  job.run(file_path_in, file_context)
 """
 # Generic/Built-in modules
 import os
@@ -12,6 +12,7 @@ import os
 # Third-party modules
 
 # Owned modules
+from ..Cache import Cache
 from ..Context import Context
 from ..enums.LogEnum import LogMessage
 from ..handlers.ShellHandler import ShellHandler
@@ -31,8 +32,8 @@ class CompileJob(Job):
         _process_section() -- Reads the section line by line to execute the
             corresponding methods.
         _compile(args) -- Runs the given shell command with all its arguments.
-        run(file_path_in) -- Performs all the steps for any compile section of
-            the profile.
+        run(file_path_in, file_context) -- Performs all the steps for any
+            compile section of the profile.
     """
 
     def _analyze(self):
@@ -48,15 +49,17 @@ class CompileJob(Job):
         Returns:
             integer -- Return code of the analysis.
         """
-        filter_function = Context().get_filter_function(self._filter)
+        filter_function = self._file_context.get_filter_function(self._filter)
 
-        if self._profile.is_section_complete(self._section_name):
+        if self._file_context.is_section_complete(self._section_name):
             return_code = 1
         elif self._profile.is_section_mandatory(self._section_name):
             return_code = 0
-        elif ShellHandler().evaluate_filter(filter_function, self._filter,
-                                            self._section_name,
-                                            Context().env) in (True, None):
+        elif ShellHandler().evaluate_filter(
+                filter_function, self._filter, self._section_name,
+                self._file_context.env,
+                self._file_context.current_workdir,
+                self._file_context.filter_results) in (True, None):
             return_code = 0
         else:
             return_code = 1
@@ -103,13 +106,22 @@ class CompileJob(Job):
         if return_code in (0, 1):
             Log().logger.debug(LogMessage.END_SECTION.value %
                                (self._section_name, self._file_name_out))
-            self._profile.section_completed(self._section_no_filter)
+            self._file_context.section_completed(self._section_no_filter)
 
         return return_code
 
     def _compile(self, args):
         """Runs the given shell command with all its arguments.
 
+        If the cache is enabled and the same compilation has already been
+        done, the outputs are restored from the cache instead of running the
+        command. Otherwise, the outputs of a successful command are stored in
+        the cache.
+
+        The output of the command is written to the files
+        oftools_compile.<section>.out and oftools_compile.<section>.err of the
+        working directory.
+
         Arguments:
             args {string} -- Arguments of the command being executed.
 
@@ -119,21 +131,51 @@ class CompileJob(Job):
         # Build command
         shell_command = self._section_no_filter + " " + args
 
+        current_workdir = self._file_context.current_workdir
+        expanded_command = self._file_context.expandvars(shell_command)
+
+        # Restore outputs from the cache
+        if Context().cache is True:
+            key = Cache().get_key(self._section_no_filter, expanded_command,
+                                  self._file_context, self._file_name_in,
+                                  self._profile)
+            if Cache().restore(key, current_workdir) is True:
+                Log().logger.info(LogMessage.CACHE_HIT.value %
+                                  self._section_name)
+                self._file_context.add_cache_result(True)
+                return 0
+            self._file_context.add_cache_result(False)
+            snapshot = Cache().snapshot(current_workdir)
+
         # Run command
-        Log().logger.info(
-            LogMessage.RUN_COMMAND.value %
-            (self._section_name, os.path.expandvars(shell_command)))
-        _, _, return_code = ShellHandler().execute_command(shell_command,
-                                                  env=Context().env)
+        Log().logger.info(LogMessage.RUN_COMMAND.value %
+                          (self._section_name, expanded_command))
+        output_path = os.path.join(
+            current_workdir, "oftools_compile." + self._section_no_filter)
+        _, _, return_code = ShellHandler().execute_command(
+            shell_command,
+            env=self._file_context.env,
+            cwd=current_workdir,
+            output_path=output_path)
+
+        # Store outputs in the cache
+        if Context().cache is True and return_code == 0:
+            Cache().store(key, current_workdir, snapshot)
 
         return return_code
 
-    def run(self, file_path_in):
+    def run(self, file_path_in, file_context):
         """Performs all the steps for any compile section of the profile.
 
+        Arguments:
+            file_path_in {string} -- Path of the input file.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+
         Returns:
             integer -- Return code of the given compile section.
         """
+        self._file_context = file_context
         self._initialize_file_variables(file_path_in)
         self._update_context()
 
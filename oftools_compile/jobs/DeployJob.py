@@ -4,20 +4,23 @@
 
 Typical usage example:
   job = DeployJob()
-  job.run(file_path_in)
+  job.run(file_path_in, file_context)
 """
 # Generic/Built-in modules
+import concurrent.futures
 import os
 
 # Third-party modules
 
 # Owned modules
 from ..Context import Context
+from ..enums.ErrorEnum import ErrorMessage
 from ..enums.LogEnum import LogMessage
 from ..handlers.FileHandler import FileHandler
 from ..handlers.ShellHandler import ShellHandler
 from .Job import Job
 from ..Log import Log
+from ..Manifest import Manifest
 
 
 class DeployJob(Job):
@@ -25,6 +28,10 @@ class DeployJob(Job):
 
     Attributes:
         Inherited from Job module.
+        _max_workers {integer} -- Maximum number of targets of an option
+            deployed at the same time.
+        _module_digest {string} -- Hash of the compiled object, compared with
+            the manifest of the targets.
 
     Methods:
         _analyze(): Analyzes prerequisites before running the job for the
@@ -39,10 +46,32 @@ class DeployJob(Job):
             compiled object.
         _process_tdl(option): Runs the tdlupdate command to deploy the compiled
             object.
-        run(file_path_in): Performs all the steps for the deploy section of the
-            profile.
+        _fan_out(target_type, option, function, *args): Runs the deploy
+            function for all the targets of the option.
+        _deploy_dataset(dataset, module_path): Runs the dlupdate command for
+            one dataset.
+        _deploy_region(region): Copies the compiled object to the region and
+            runs the osctdlupdate command.
+        _deploy_tdl(tdl): Copies the compiled object to the TDL directory and
+            runs the tdlupdate command.
+        _is_unchanged(target_type, target, deployed_path): Checks if the
+            compiled object is unchanged since its last deployment to the
+            target.
+        _stage_module(): Copies the compiled object out of the working
+            directory until the deferred deploy commands are run.
+        _run_deploy_command(target_type, target, module_path, shell_command):
+            Runs the deploy command, or defers it to the end of the batch.
+        run(file_path_in, file_context): Performs all the steps for the deploy
+            section of the profile.
     """
 
+    def __init__(self, profile, section_name):
+        """Initializes the class with all the attributes.
+        """
+        super().__init__(profile, section_name)
+        self._max_workers = 8
+        self._module_digest = None
+
     def _analyze(self):
         """Analyzes prerequisites before running the job for the section.
 
@@ -56,15 +85,17 @@ class DeployJob(Job):
         Returns:
             integer -- Return code of the analysis.
         """
-        filter_function = Context().get_filter_function(self._filter)
+        filter_function = self._file_context.get_filter_function(self._filter)
 
-        if self._profile.is_section_complete(self._section_name):
+        if self._file_context.is_section_complete(self._section_name):
             return_code = 1
         elif self._profile.is_section_mandatory(self._section_name):
             return_code = 0
-        elif ShellHandler().evaluate_filter(filter_function, self._filter,
-                                            self._section_name,
-                                            Context().env) in (True, None):
+        elif ShellHandler().evaluate_filter(
+                filter_function, self._filter, self._section_name,
+                self._file_context.env,
+                self._file_context.current_workdir,
+                self._file_context.filter_results) in (True, None):
             return_code = 0
         else:
             return_code = 1
@@ -73,7 +104,7 @@ class DeployJob(Job):
             compile_section = False
             complete_status = False
 
-            for key, value in self._profile.sections_complete.items():
+            for key, value in self._file_context.sections_complete.items():
                 if key not in ("setup", "deploy"):
                     compile_section = True
                     complete_status = value
@@ -119,6 +150,13 @@ class DeployJob(Job):
                                (self._section_name, "file"))
             return return_code
 
+        if Context().redeploy is False:
+            self._module_digest = Manifest().hash_file(
+                os.path.join(self._file_context.current_workdir,
+                             self._file_name_out))
+        else:
+            self._module_digest = None
+
         for key, value in self._profile.data[self._section_name].items():
             if key == "file":
                 continue
@@ -139,7 +177,7 @@ class DeployJob(Job):
         if return_code in (0, 1):
             Log().logger.debug(LogMessage.END_SECTION.value %
                                (self._section_name, self._file_name_out))
-            self._profile.section_completed(self._section_no_filter)
+            self._file_context.section_completed(self._section_no_filter)
 
         return return_code
 
@@ -155,12 +193,16 @@ class DeployJob(Job):
         Log().logger.debug(LogMessage.START_DEPLOY_FILE.value %
                            self._section_name)
 
-        self._file_name_out = os.path.expandvars(option)
+        self._file_name_out = self._file_context.expandvars(option)
 
         Log().logger.info(
             LogMessage.CP_COMMAND.value %
             (self._section_name, self._file_name_in, self._file_name_out))
-        return_code = FileHandler().copy_file(self._file_name_in, self._file_name_out)
+        current_workdir = self._file_context.current_workdir
+        return_code = FileHandler().stage_file(
+            os.path.join(current_workdir, self._file_name_in),
+            os.path.join(current_workdir, self._file_name_out),
+            self._profile.data.get("setup", "stage", fallback="copy"))
 
         if return_code == 1:
             Log().logger.warning(LogMessage.FILE_ALREADY_EXISTS.value %
@@ -182,24 +224,17 @@ class DeployJob(Job):
         """
         Log().logger.debug(LogMessage.START_DATASET.value % self._section_name)
 
-        return_code = 0
-        datasets = option.split(":")
-
-        for dataset in datasets:
-            if dataset != "":
-                shell_command = "dlupdate " + Context(
-                ).current_workdir + "/" + self._file_name_out + " " + dataset
-                Log().logger.info(LogMessage.RUN_COMMAND.value %
-                                  (self._section_name, shell_command))
-                _, _, return_code = ShellHandler().execute_command(
-                    shell_command, "deploy",
-                    Context().env)
-                if return_code != 0:
-                    break
-            else:
-                Log().logger.warning(LogMessage.VALUE_EMPTY.value %
-                                     (self._section_name, "dataset"))
-                return_code = 1
+        if Context().deploy_mode == "batch":
+            module_path = self._stage_module()
+        else:
+            module_path = os.path.join(self._file_context.current_workdir,
+                                       self._file_name_out)
+
+        if module_path is None:
+            return_code = -1
+        else:
+            return_code = self._fan_out("dataset", option, self._deploy_dataset,
+                                        module_path)
 
         Log().logger.debug(LogMessage.END_DATASET.value % self._section_name)
 
@@ -216,30 +251,7 @@ class DeployJob(Job):
         """
         Log().logger.debug(LogMessage.START_REGION.value % self._section_name)
 
-        return_code = 0
-        regions = option.split(":")
-
-        for region in regions:
-            if region != "":
-                region = os.path.expandvars(region)
-                region_path = os.path.join("$OPENFRAME_HOME/osc/region",
-                                           region + "/tdl/mod")
-                return_code = FileHandler().copy_file(self._file_name_out, region_path)
-                if return_code != 0:
-                    break
-
-                shell_command = "osctdlupdate " + region + " " + self._file_name_out
-                Log().logger.info(LogMessage.RUN_COMMAND.value %
-                                  (self._section_name, shell_command))
-                _, _, return_code = ShellHandler().execute_command(
-                    shell_command, "deploy",
-                    Context().env)
-                if return_code != 0:
-                    break
-            else:
-                Log().logger.warning(LogMessage.VALUE_EMPTY.value %
-                                     (self._section_name, "region"))
-                return_code = 1
+        return_code = self._fan_out("region", option, self._deploy_region)
 
         Log().logger.debug(LogMessage.END_REGION.value % self._section_name)
 
@@ -256,40 +268,247 @@ class DeployJob(Job):
         """
         Log().logger.debug(LogMessage.START_TDL.value % self._section_name)
 
-        return_code = 0
-        tdls = option.split(":")
-
-        for tdl in tdls:
-            if tdl != "":
-                tdl = os.path.expandvars(tdl)
-                tdl_path = os.path.join(tdl + "/tdl/mod")
-                return_code = FileHandler().copy_file(self._file_name_out, tdl_path)
-                if return_code != 0:
-                    break
+        return_code = self._fan_out("tdl", option, self._deploy_tdl)
 
-                shell_command = "tdlupdate -m " + self._file_name_out + " -r " + tdl_path
-                Log().logger.info(LogMessage.RUN_COMMAND.value %
-                                  (self._section_name, shell_command))
-                _, _, return_code = ShellHandler().execute_command(
-                    shell_command, "deploy",
-                    Context().env)
-                if return_code != 0:
-                    break
+        Log().logger.debug(LogMessage.END_TDL.value % self._section_name)
+
+        return return_code
+
+    def _fan_out(self, target_type, option, function, *args):
+        """Runs the deploy function for all the targets of the option.
+
+        The targets are deployed concurrently in a bounded pool of threads, so
+        that the deployment of a module takes as long as its slowest target.
+        Each thread writes to the log file of the source file.
+
+        Arguments:
+            target_type {string} -- Type of the targets, either dataset, region
+                or tdl.
+            option {string} -- Colon-separated list of targets.
+            function {method} -- Method deploying the module to one target.
+            args {tuple} -- Additional arguments of the method.
+
+        Returns:
+            integer -- Return code of the first target which failed, in the
+                order of the option, 1 if a target has been skipped and 0
+                otherwise.
+        """
+        targets = []
+        return_codes = []
+
+        for target in option.split(":"):
+            if target != "":
+                targets.append(target)
             else:
                 Log().logger.warning(LogMessage.VALUE_EMPTY.value %
-                                     (self._section_name, "tdl"))
-                return_code = 1
+                                     (self._section_name, target_type))
+                return_codes.append(1)
+
+        if len(targets) == 1:
+            return_codes.append(function(targets[0], *args))
+        elif len(targets) > 1:
+            file_handler = Log().file_handler
+
+            def run_target(target):
+                Log().attach_file(file_handler)
+                try:
+                    return function(target, *args)
+                finally:
+                    Log().detach_file()
+
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(targets),
+                                    self._max_workers)) as executor:
+                return_codes.extend(executor.map(run_target, targets))
+
+        for return_code in return_codes:
+            if return_code not in (0, 1):
+                return return_code
 
-        Log().logger.debug(LogMessage.END_TDL.value % self._section_name)
+        return 1 if 1 in return_codes else 0
+
+    def _deploy_dataset(self, dataset, module_path):
+        """Runs the dlupdate command for one dataset.
+
+        Arguments:
+            dataset {string} -- Name of the dataset.
+            module_path {string} -- Absolute path of the compiled object.
+
+        Returns:
+            integer -- Return code of the deployment.
+        """
+        if self._is_unchanged("dataset", dataset):
+            return 0
+
+        shell_command = "dlupdate " + module_path + " " + dataset
+        return self._run_deploy_command("dataset", dataset, module_path,
+                                        shell_command)
+
+    def _deploy_region(self, region):
+        """Copies the compiled object to the region and runs the osctdlupdate
+        command.
+
+        Arguments:
+            region {string} -- Name of the region.
+
+        Returns:
+            integer -- Return code of the deployment.
+        """
+        region = self._file_context.expandvars(region)
+        region_path = self._file_context.expandvars(
+            os.path.join("$OPENFRAME_HOME/osc/region", region + "/tdl/mod"))
+        if self._is_unchanged("region", region,
+                              os.path.join(region_path, self._file_name_out)):
+            return 0
+
+        return_code = FileHandler().copy_file(
+            os.path.join(self._file_context.current_workdir,
+                         self._file_name_out), region_path)
+        if return_code != 0:
+            return return_code
+
+        shell_command = "osctdlupdate " + region + " " + self._file_name_out
+        return self._run_deploy_command(
+            "region", region, os.path.join(region_path, self._file_name_out),
+            shell_command)
+
+    def _deploy_tdl(self, tdl):
+        """Copies the compiled object to the TDL directory and runs the
+        tdlupdate command.
+
+        Arguments:
+            tdl {string} -- Path of the TDL directory.
+
+        Returns:
+            integer -- Return code of the deployment.
+        """
+        tdl = self._file_context.expandvars(tdl)
+        tdl_path = os.path.join(tdl + "/tdl/mod")
+        if self._is_unchanged("tdl", tdl,
+                              os.path.join(tdl_path, self._file_name_out)):
+            return 0
+
+        return_code = FileHandler().copy_file(
+            os.path.join(self._file_context.current_workdir,
+                         self._file_name_out), tdl_path)
+        if return_code != 0:
+            return return_code
+
+        shell_command = "tdlupdate -m " + self._file_name_out + " -r " + tdl_path
+        return self._run_deploy_command(
+            "tdl", tdl, os.path.join(tdl_path, self._file_name_out),
+            shell_command)
+
+    def _is_unchanged(self, target_type, target, deployed_path=None):
+        """Checks if the compiled object is unchanged since its last
+        deployment to the target, in which case the deployment is skipped.
+
+        Arguments:
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            deployed_path {string} -- Absolute path of the compiled object
+                once deployed, if it can be checked.
+
+        Returns:
+            boolean -- True if the deployment is skipped, and False otherwise.
+        """
+        if not Manifest().is_deployed(target_type, target, self._file_name_out,
+                                      self._module_digest, deployed_path):
+            return False
+
+        Log().logger.info(LogMessage.DEPLOY_SKIPPED.value %
+                          (self._section_name, target_type, target))
+        self._file_context.add_deploy_result("DEPLOY_SKIPPED")
+
+        return True
+
+    def _stage_module(self):
+        """Copies the compiled object out of the working directory until the
+        deferred deploy commands are run.
+
+        The working directory may be removed by the clear option before the
+        end of the batch, so the compiled object is copied to the deploy
+        directory of the root working directory.
+
+        Returns:
+            string -- Absolute path of the copy of the compiled object, None if
+                the copy failed.
+        """
+        stage_directory = os.path.join(
+            Context().root_workdir, "deploy",
+            os.path.basename(self._file_context.current_workdir))
+
+        try:
+            os.makedirs(stage_directory, exist_ok=True)
+        except OSError as error:
+            Log().logger.critical(ErrorMessage.OS_DEPLOY_STAGE.value % error)
+            return None
+
+        module_path = os.path.join(stage_directory, self._file_name_out)
+        return_code = FileHandler().copy_file(
+            os.path.join(self._file_context.current_workdir,
+                         self._file_name_out), module_path)
+        if return_code < 0:
+            return None
+
+        return module_path
+
+    def _run_deploy_command(self, target_type, target, module_path,
+                            shell_command):
+        """Runs the deploy command, or defers it to the end of the batch.
+
+        With the batch deploy mode, the command is only recorded in the
+        FileContext, and run later together with the other commands of the
+        same target, which records its result. The manifest of the target is
+        updated once the command succeeds.
+
+        Arguments:
+            target_type {string} -- Type of the target, either dataset, region
+                or tdl.
+            target {string} -- Name of the dataset, region or TDL directory.
+            module_path {string} -- Absolute path of the deployed module.
+            shell_command {string} -- Shell command deploying the module.
+
+        Returns:
+            integer -- Return code of the deploy command, 0 if deferred.
+        """
+        if Context().deploy_mode == "batch":
+            Log().logger.info(LogMessage.DEPLOY_DEFERRED.value %
+                              (self._section_name, shell_command))
+            self._file_context.add_deploy_intent(self._section_name,
+                                                 target_type, target,
+                                                 module_path, shell_command,
+                                                 self._module_digest)
+            return 0
+
+        Log().logger.info(LogMessage.RUN_COMMAND.value %
+                          (self._section_name, shell_command))
+        _, _, return_code = ShellHandler().execute_command(
+            shell_command, "deploy", self._file_context.env,
+            self._file_context.current_workdir)
+
+        if return_code == 0:
+            Manifest().record(target_type, target, self._file_name_out,
+                              self._module_digest)
+            self._file_context.add_deploy_result("DEPLOYED")
+        else:
+            self._file_context.add_deploy_result("DEPLOY_FAILED")
 
         return return_code
 
-    def run(self, file_path_in):
+    def run(self, file_path_in, file_context):
         """Performs all the steps for the deploy section of the profile.
 
+        Arguments:
+            file_path_in {string} -- Path of the input file.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+
         Returns:
             integer -- Return code of the deploy section.
         """
+        self._file_context = file_context
         self._initialize_file_variables(file_path_in)
         self._update_context()
 
@@ -4,7 +4,7 @@
 
 Typical usage example:
   job = Job(profile, setup)
-  job.run()
+  job.run(file_path_in, file_context)
   file_name_out = job.file_name_out
 """
 
@@ -13,7 +13,6 @@ Typical usage example:
 # Third-party modules
 
 # Owned modules
-from ..Context import Context
 from ..enums.ErrorEnum import ErrorMessage
 from ..Log import Log
 
@@ -35,6 +34,8 @@ class Job():
             also be just the file name, depending on the type of job.
         _file_name_in {string} -- Job input file name.
         _file_name_out {string} -- Job output file name.
+        _file_context {FileContext} -- Variables and parameters of the
+            processing of the current source file.
 
     Methods:
         __init__(profile section_name) -- Initializes the class with all the
@@ -42,7 +43,7 @@ class Job():
         _initialize_file_variables(file_path_in) -- Detects if the source
             provided is a file or a directory, and properly retrieve the name
             of the file to initialize class attributes.
-        _update_context() -- Updates Context with name of files being
+        _update_context() -- Updates the FileContext with name of files being
             manipulated in this job execution.
         _process_option(key, value) -- Processes option like environment
             variable or filter function.
@@ -59,6 +60,7 @@ class Job():
         self._file_path_in = ""
         self._file_name_in = ""
         self._file_name_out = ""
+        self._file_context = None
 
     @property
     def file_name_out(self):
@@ -66,6 +68,12 @@ class Job():
         """
         return self._file_name_out
 
+    @property
+    def section_name(self):
+        """Getter method for the attribute _section_name.
+        """
+        return self._section_name
+
     def _initialize_file_variables(self, file_path_in):
         """Detects if the source provided is a file or a directory, and
         properly retrieve the name of the file to update class attributes.
@@ -99,16 +107,18 @@ class Job():
             self._file_name_out = "\\" + self._file_name_out
 
     def _update_context(self):
-        """Updates Context with the name of files being manipulated in this job
-        execution.
+        """Updates the FileContext with the name of files being manipulated in
+        this job execution.
         """
         base_file_name = self._file_name_out.rsplit(".", 1)[0]
 
-        Context().add_env_variable("$OF_COMPILE_IN", self._file_name_in)
-        Context().add_env_variable("$OF_COMPILE_OUT", self._file_name_out)
-        Context().add_env_variable("$OF_COMPILE_BASE", base_file_name)
+        self._file_context.add_env_variable("$OF_COMPILE_IN",
+                                            self._file_name_in)
+        self._file_context.add_env_variable("$OF_COMPILE_OUT",
+                                            self._file_name_out)
+        self._file_context.add_env_variable("$OF_COMPILE_BASE", base_file_name)
 
-        Context().last_section = self._section_name
+        self._file_context.last_section = self._section_name
 
     def _process_option(self, key, value):
         """Processes option like an environment variable or a filter function.
@@ -130,14 +140,15 @@ class Job():
         """
         try:
             if key.startswith("$"):
-                Context().add_env_variable(key, value)
+                self._file_context.add_env_variable(key, value)
                 if key == "$OF_COMPILE_IN":
-                    self._file_name_in = Context().env["OF_COMPILE_IN"]
+                    self._file_name_in = self._file_context.env["OF_COMPILE_IN"]
                 elif key == "$OF_COMPILE_OUT":
-                    self._file_name_out = Context().env["OF_COMPILE_OUT"]
+                    self._file_name_out = self._file_context.env[
+                        "OF_COMPILE_OUT"]
                 return_code = 0
             elif key.startswith("?"):
-                Context().add_filter(key, value)
+                self._file_context.add_filter(key, value)
                 return_code = 0
             else:
                 raise Warning()
@@ -8,13 +8,18 @@ Typical usage example:
 """
 
 # Generic/Built-in modules
+import sys
 
 # Third-party modules
 
 # Owned modules
 from ..Clear import Clear
 from .CompileJob import CompileJob
+from ..Context import Context
 from .DeployJob import DeployJob
+from ..enums.ErrorEnum import ErrorMessage
+from ..handlers.ShellHandler import ShellHandler
+from ..Log import Log
 from .SetupJob import SetupJob
 
 
@@ -26,6 +31,8 @@ class JobFactory():
 
     Methods:
         __init__(profile) -- Initializes the class with the _profile attribute.
+        _resolve_tool(section_name) -- Checks that the tool of the compile
+            section exists before processing any source file.
         create(job_name) -- Creates the job according to the input parameter.
     """
 
@@ -34,6 +41,58 @@ class JobFactory():
         """
         self._profile = profile
 
+    def _resolve_tool(self, section_name):
+        """Checks that the tool of the compile section exists before processing
+        any source file.
+
+        The PATH used for the resolution takes into account the environment
+        variable options of the profile sections up to the given one, expanded
+        in order as during the processing. The check is skipped if the PATH
+        depends on the output of a command or on a variable known only during
+        the processing of a source file. A missing tool only aborts the
+        program if the section is mandatory and has no filter, as the other
+        sections may not run or may fail without failing the file.
+
+        Arguments:
+            section_name {string} -- Name of the compile section.
+
+        Raises:
+            SystemError -- Exception raised if the tool of the section does not
+                exist.
+        """
+        section_no_filter = self._profile.sections_no_filter[section_name]
+        if Context().is_skip(section_no_filter):
+            return
+
+        env = dict(Context().env)
+        for section in self._profile.sections:
+            for key, value in self._profile.data[section].items():
+                if not key.startswith("$"):
+                    continue
+                if value.startswith(("$(", "`")):
+                    env.pop(key[1:], None)
+                else:
+                    env[key[1:]] = ShellHandler().expand_variables(value, env)
+            if section == section_name:
+                break
+
+        if "$" in env.get("PATH", "$"):
+            return
+
+        try:
+            if ShellHandler().resolve_command(section_no_filter, env) is None:
+                raise SystemError()
+        except SystemError:
+            if section_name != section_no_filter or \
+                    not self._profile.is_section_mandatory(section_name):
+                Log().logger.warning(ErrorMessage.SYSTEM_TOOL.value %
+                                     (section_name, section_no_filter))
+                return
+            Log().logger.critical(ErrorMessage.SYSTEM_TOOL.value %
+                                  (section_name, section_no_filter))
+            Log().logger.critical(ErrorMessage.ABORT.value)
+            sys.exit(-1)
+
     def create(self, job_name):
         """Creates the job according to the input parameter.
 
@@ -51,4 +110,5 @@ class JobFactory():
         elif job_name == "clear":
             return Clear()
         else:
+            self._resolve_tool(job_name)
             return CompileJob(self._profile, job_name)
@@ -4,11 +4,10 @@
 
 Typical usage example:
   job = SetupJob()
-  job.run(file_path_in)
+  job.run(file_path_in, file_context)
 """
 
 # Generic/Built-in modules
-import datetime
 import os
 
 # Third-party modules
@@ -21,6 +20,9 @@ from ..handlers.FileHandler import FileHandler
 from ..handlers.ShellHandler import ShellHandler
 from .Job import Job
 from ..Log import Log
+from ..Manifest import Manifest
+from ..Retention import Retention
+from ..WorkdirIndex import WorkdirIndex
 
 
 class SetupJob(Job):
@@ -39,12 +41,17 @@ class SetupJob(Job):
         _init_file() -- Copies the file to the working directory.
         _init_log_file() -- Initializes the log file for the file being
             currently processed.
-        _process_backup(value) -- Cleans the root working directory from old
-            compilation directories based on the number of backups to be kept.
-        _process_housekeeping(value) -- Cleans the root working directory from
-            compilation directories older than the input number of days.
-        run(file_path_in) -- Performs all the steps for the setup section of
-            the profile.
+        _process_backup(value) -- Validates the number of backups to be kept.
+        _process_housekeeping(value) -- Validates the number of days after
+            which compilation directories are deleted.
+        _process_quota(value) -- Validates the maximum total size of the
+            compilation directories of the source file.
+        _process_stage(value) -- Validates the method used to copy the files
+            to the working directory.
+        _process_layout(value) -- Validates the layout of the working
+            directories.
+        run(file_path_in, file_context) -- Performs all the steps for the
+            setup section of the profile.
     """
 
     def _analyze(self):
@@ -59,15 +66,17 @@ class SetupJob(Job):
         Returns:
             integer - Return code of the analysis.
         """
-        filter_function = Context().get_filter_function(self._filter)
+        filter_function = self._file_context.get_filter_function(self._filter)
 
-        if self._profile.is_section_complete(self._section_name):
+        if self._file_context.is_section_complete(self._section_name):
             return_code = 1
         elif self._profile.is_section_mandatory(self._section_name):
             return_code = 0
-        elif ShellHandler().evaluate_filter(filter_function, self._filter,
-                                            self._section_name,
-                                            Context().env) in (True, None):
+        elif ShellHandler().evaluate_filter(
+                filter_function, self._filter, self._section_name,
+                self._file_context.env,
+                self._file_context.current_workdir,
+                self._file_context.filter_results) in (True, None):
             return_code = 0
         else:
             return_code = 1
@@ -93,8 +102,14 @@ class SetupJob(Job):
                 self._init_current_workdir()
                 return_code = self._init_file()
                 self._init_log_file()
-            elif key == "mandatory":
+            elif key in ("mandatory", "cache_env", "cache_files"):
                 continue
+            elif key == "quota":
+                return_code = self._process_quota(value)
+            elif key == "stage":
+                return_code = self._process_stage(value)
+            elif key == "layout":
+                return_code = self._process_layout(value)
             elif key == "housekeeping":
                 return_code = self._process_housekeeping(value)
             elif key == "backup":
@@ -114,7 +129,7 @@ class SetupJob(Job):
         if return_code in (0,1):
             Log().logger.debug(LogMessage.END_SECTION.value %
                                (self._section_name, self._file_name_out))
-            self._profile.section_completed(self._section_no_filter)
+            self._file_context.section_completed(self._section_no_filter)
 
         return return_code
 
@@ -125,28 +140,41 @@ class SetupJob(Job):
         Log().logger.debug(LogMessage.START_WORKING_DIRECTORY.value %
                            self._section_name)
 
+        # Bucket directory shared by the working directories of the layout
+        parent_directory = Context().exec_working_dir
+        bucket = Context().get_bucket(self._file_name_in)
+        if bucket != "":
+            parent_directory = os.path.join(parent_directory, bucket)
+            FileHandler().create_directory(parent_directory)
+
         while True:
             current_workdir = os.path.join(
-                Context().exec_working_dir,
-                self._file_name_in + Context().tag + Context().time_stamp)
+                parent_directory,
+                self._file_name_in + Context().tag + Context().time_stamp +
+                Context().next_workdir_id())
 
             return_code = FileHandler().create_directory(current_workdir)
             if return_code == 1:
-                Log().logger.debug(LogMessage.ADD_TIME_TO_TIME_STAMP.value %
+                Log().logger.debug(LogMessage.WORKDIR_EXISTS.value %
                                    (self._section_name, current_workdir))
-                Context().time_stamp = 1
             else:
-                # Update Context and change directory to current working
-                # directory
-                Context().current_workdir = current_workdir
-                os.chdir(current_workdir)
+                # Update FileContext, the jobs run their commands in the
+                # current working directory without changing directory
+                self._file_context.current_workdir = current_workdir
+                if Context().tmpfs == "":
+                    WorkdirIndex().add(current_workdir)
                 break
 
         Log().logger.debug(LogMessage.END_WORKING_DIRECTORY.value %
                            self._section_name)
 
     def _init_file(self):
-        """Copies the file to the current working directory.
+        """Copies the file to the current working directory, using the method
+        of the stage option.
+
+        The hash of the source file is computed once it is staged if the
+        execution is recorded in the history, so that it matches the content
+        being processed.
 
         Returns:
             integer -- Return code of the method.
@@ -154,8 +182,14 @@ class SetupJob(Job):
         Log().logger.debug(LogMessage.START_SETUP_FILE.value %
                            self._section_name)
 
-        current_workdir = Context().current_workdir
-        return_code = FileHandler().copy_file(self._file_path_in, current_workdir)
+        current_workdir = self._file_context.current_workdir
+        return_code = FileHandler().stage_file(
+            self._file_path_in, current_workdir,
+            self._profile.data.get("setup", "stage", fallback="copy"))
+
+        if return_code == 0 and Context().history is True:
+            self._file_context.source_digest = Manifest().hash_file(
+                os.path.join(current_workdir, self._file_name_in))
 
         Log().logger.debug(LogMessage.END_SETUP_FILE.value % self._section_name)
 
@@ -169,7 +203,7 @@ class SetupJob(Job):
         """
         Log().logger.debug(LogMessage.START_LOG_FILE.value % self._section_name)
 
-        current_workdir = Context().current_workdir
+        current_workdir = self._file_context.current_workdir
         Log().open_file(os.path.join(current_workdir, "oftools_compile.log"))
         header = "================================================================================"
         header = header[0:8] + " " + self._file_name_in + " " + header[
@@ -187,8 +221,10 @@ class SetupJob(Job):
         Log().logger.debug(LogMessage.END_LOG_FILE.value % self._section_name)
 
     def _process_backup(self, value):
-        """Cleans the root working directory from old compilation directories
-        based on the number of backups to be kept.
+        """Validates the number of backups to be kept.
+
+        The old compilation directories are deleted by the retention pass,
+        run once for the whole execution.
 
         Arguments:
             value {string} -- Value of the backup option, this is an integer.
@@ -200,35 +236,10 @@ class SetupJob(Job):
             ValueError -- Exception raised if the input value cannot be
                 converted from string to integer.
         """
-        Log().logger.debug(LogMessage.START_CLEANING.value %
-                           (self._section_name, "backup"))
-
         try:
             if value != "":
-                value = int(value)
-                backup_paths = FileHandler().get_duplicates(
-                    Context().root_workdir, self._file_name_in)
-
-                if len(backup_paths) > value:
-                    creation_times = FileHandler().get_modified_times(
-                        backup_paths)
-                    # Sorting the backup_paths list based on a sorting of the
-                    # creation_times list
-                    backup_paths = [
-                        path
-                        for _, path in sorted(zip(creation_times, backup_paths))
-                    ]
-
-                    while len(backup_paths) > value:
-                        backup = backup_paths[0]
-                        backup_paths.pop(0)
-                        FileHandler().delete_directory(backup)
-                else:
-                    Log().logger.debug(LogMessage.VALUE_BELOW_THRESHOLD.value %
-                                       (self._section_name,
-                                        len(backup_paths) - 1, value, "backup"))
-
-                Log().logger.debug(LogMessage.END_CLEANING.value %
+                int(value)
+                Log().logger.debug(LogMessage.RETENTION_DEFERRED.value %
                                    (self._section_name, "backup"))
                 return_code = 0
             else:
@@ -242,8 +253,11 @@ class SetupJob(Job):
         return return_code
 
     def _process_housekeeping(self, value):
-        """Cleans the root working directory from compilation directories older
-        than the input number of days.
+        """Validates the number of days after which compilation directories
+        are deleted.
+
+        The old compilation directories are deleted by the retention pass,
+        run once for the whole execution.
 
         Arguments:
             value {string} -- Value of the housekeeping option, this must be a
@@ -256,57 +270,15 @@ class SetupJob(Job):
             ValueError -- Exception raised if part of the input value cannot be
                 converted from string to integer.
         """
-        Log().logger.debug(LogMessage.START_CLEANING.value %
-                           (self._section_name, "housekeeping"))
-
         try:
             if value != "":
                 if self._profile.data.has_option("setup", "backup"):
                     if value[-1] == "d":
-
-                        days = int(value[:-1])
-                        threshold = datetime.datetime.today(
-                        ) - datetime.timedelta(days=int(days))
-                        backup_paths = FileHandler().get_duplicates(
-                            Context().root_workdir, self._file_name_in)
-                        backup_value = int(
-                            self._profile.data.get("setup", "backup"))
-
-                        if len(backup_paths) > backup_value:
-                            creation_times = FileHandler().get_modified_times(
-                                backup_paths)
-                            creation_times.sort()
-                            # Sorting the backup_paths list based on a sorting on the creation_times list
-                            backup_paths = [
-                                path for _, path in sorted(
-                                    zip(creation_times, backup_paths))
-                            ]
-
-                            number_of_backups = len(backup_paths)
-                            for i, backup in enumerate(backup_paths):
-                                backup_modified_date = datetime.datetime.fromtimestamp(
-                                    creation_times[i])
-
-                                if backup_modified_date < threshold:
-                                    number_of_backups -= 1
-                                    FileHandler().delete_directory(backup)
-
-                                if number_of_backups == backup_value:
-                                    break
-
-                            if number_of_backups == len(backup_paths):
-                                Log().logger.info(
-                                    LogMessage.NOT_OLD_ENOUGH.value %
-                                    (self._section_name, "housekeeping"))
-                            else:
-                                Log().logger.debug(
-                                    LogMessage.END_CLEANING.value %
-                                    (self._section_name, "housekeeping"))
-                        else:
-                            Log().logger.debug(
-                                LogMessage.VALUE_BELOW_THRESHOLD.value %
-                                (self._section_name, len(backup_paths) - 1,
-                                 backup_value, "housekeeping"))
+                        int(value[:-1])
+                        int(self._profile.data.get("setup", "backup"))
+                        Log().logger.debug(
+                            LogMessage.RETENTION_DEFERRED.value %
+                            (self._section_name, "housekeeping"))
                         return_code = 0
                     else:
                         raise ValueError()
@@ -325,12 +297,102 @@ class SetupJob(Job):
 
         return return_code
 
-    def run(self, file_path_in):
+    def _process_quota(self, value):
+        """Validates the maximum total size of the compilation directories of
+        the source file.
+
+        The old compilation directories are deleted by the retention pass,
+        run once for the whole execution.
+
+        Arguments:
+            value {string} -- Value of the quota option, this is a size in
+                bytes, or followed by K, M, G or T.
+
+        Returns:
+            integer -- Return code of the method.
+
+        Raises:
+            ValueError -- Exception raised if the input value is not a size.
+        """
+        try:
+            if value != "":
+                Retention.parse_size(value)
+                Log().logger.debug(LogMessage.RETENTION_DEFERRED.value %
+                                   (self._section_name, "quota"))
+                return_code = 0
+            else:
+                Log().logger.warning(LogMessage.VALUE_EMPTY.value %
+                                     ("setup", "quota"))
+                return_code = 1
+        except ValueError:
+            Log().logger.error(ErrorMessage.VALUE_QUOTA.value % value)
+            return_code = -1
+
+        return return_code
+
+    def _process_stage(self, value):
+        """Validates the method used to copy the files to the working
+        directory.
+
+        The source file is staged by the workdir option, and the compiled
+        object by the file option of the deploy section.
+
+        Arguments:
+            value {string} -- Value of the stage option, either copy, link,
+                reflink, symlink or auto.
+
+        Returns:
+            integer -- Return code of the method.
+        """
+        if value in ("copy", "link", "reflink", "symlink", "auto"):
+            return_code = 0
+        elif value == "":
+            Log().logger.warning(LogMessage.VALUE_EMPTY.value %
+                                 ("setup", "stage"))
+            return_code = 1
+        else:
+            Log().logger.error(ErrorMessage.VALUE_STAGE.value % value)
+            return_code = -1
+
+        return return_code
+
+    def _process_layout(self, value):
+        """Validates the layout of the working directories.
+
+        The working directories are created by the workdir option, in bucket
+        directories for the hash and date layouts.
+
+        Arguments:
+            value {string} -- Value of the layout option, either flat, hash or
+                date.
+
+        Returns:
+            integer -- Return code of the method.
+        """
+        if value in ("flat", "hash", "date"):
+            return_code = 0
+        elif value == "":
+            Log().logger.warning(LogMessage.VALUE_EMPTY.value %
+                                 ("setup", "layout"))
+            return_code = 1
+        else:
+            Log().logger.error(ErrorMessage.VALUE_LAYOUT.value % value)
+            return_code = -1
+
+        return return_code
+
+    def run(self, file_path_in, file_context):
         """Performs all the steps for the setup section of the profile.
 
+        Arguments:
+            file_path_in {string} -- Path of the input file.
+            file_context {FileContext} -- Variables and parameters of the
+                processing of the current source file.
+
         Returns:
             integer -- Return code of the setup section.
         """
+        self._file_context = file_context
         self._initialize_file_variables(file_path_in)
         self._update_context()
 
@@ -4,6 +4,7 @@
 """
 
 # Generic/Built-in modules
+import csv
 import os
 import sys
 
@@ -22,12 +23,16 @@ class TestFilter(object):
         shared
 
     Tests:
+        test_filter_cache
         test_filter_false
+        test_filter_glob
         test_filter_missing_name
+        test_filter_re
         test_filter_true
         test_filter_true_false
         test_filter_true_false_same
         test_filter_true_middle
+        test_filter_workdir
 
     """
 
@@ -47,6 +52,20 @@ class TestFilter(object):
         pwd = os.getcwd() + '/tests/shared/'
         return pwd
 
+    @staticmethod
+    def test_filter_cache(init_pwd, shared):
+        """Test with a profile where the same filter variable on the source file is evaluated by several sections, and for the same source file processed twice.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/filter_cache.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/filter_cache.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+
     @staticmethod
     def test_filter_false(init_pwd, shared):
         """Test with a profile where this is a filter variable being False.
@@ -59,6 +78,18 @@ class TestFilter(object):
 
         assert Main().run() == 0
 
+    @staticmethod
+    def test_filter_glob(init_pwd, shared):
+        """Test with a profile where native glob filter variables are evaluated on the source file path.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/filter_glob.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+
     @staticmethod
     def test_filter_missing_name(init_pwd, shared):
         """Test with a profile where there is a filter variable being used but no name is given, only the question mark.
@@ -72,6 +103,18 @@ class TestFilter(object):
 
         assert Main().run() == 0
 
+    @staticmethod
+    def test_filter_re(init_pwd, shared):
+        """Test with a profile where native regular expression filter variables are evaluated on the source file.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/filter_re.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+
     @staticmethod
     def test_filter_true(init_pwd, shared):
         """Test with a profile where this is a filter variable being True.
@@ -121,4 +164,29 @@ class TestFilter(object):
             ['--profile', init_pwd + 'profiles/filter_true_middle.prof'])
         sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
 
-        assert Main().run() == 0
\ No newline at end of file
+        assert Main().run() == 0
+
+    @staticmethod
+    def test_filter_workdir(init_pwd, shared):
+        """Test with a profile where a shell filter variable tests a file of the working directory, created between two sections evaluating it.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/filter_workdir.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--tag', 'filter'])
+
+        assert Main().run() == 0
+
+        report_directory = '/opt/tmaxapp/compile/report'
+        report_file_path = max(
+            (os.path.join(report_directory, file_name)
+             for file_name in os.listdir(report_directory)
+             if file_name.startswith('oftools_compile_filter_')),
+            key=os.path.getmtime)
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.DictReader(fd))
+        with open(os.path.join(rows[-1]['working_directory'],
+                               'oftools_compile.log'), 'r') as fd:
+            assert '[ofcob?cob] ofcob SAMPLE1.cob' in fd.read()
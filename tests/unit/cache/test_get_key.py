@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the Cache module.
+"""
+
+# Generic/Built-in modules
+import csv
+import os
+import shutil
+import sys
+import time
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Context import Context
+from ....oftools_compile.Main import Main
+
+
+class TestGetKey(object):
+    """Test cases for the method get_key.
+
+    Fixtures:
+        init_pwd
+        shared
+        run_cache
+
+    Tests:
+        test_dependency_changed
+        test_environment_changed
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def init_pwd():
+        """Specify the absolute path of the current test directory.
+        """
+        pwd = os.getcwd() + '/tests/unit/cache/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def run_cache(init_pwd, shared):
+        """Run the compilation with the cache option and return the cache
+        status of the report.
+        """
+
+        def run():
+            sys.argv = [sys.argv[0]]
+            sys.argv.append('--cache')
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(
+                ['--profile', init_pwd + 'profiles/cache_files.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+            sys.argv.extend(['--tag', 'cache'])
+
+            assert Main().run() == 0
+
+            report_directory = '/opt/tmaxapp/compile/report'
+            report_file_path = max(
+                (os.path.join(report_directory, file_name)
+                 for file_name in os.listdir(report_directory)
+                 if file_name.startswith('oftools_compile_cache_')),
+                key=os.path.getmtime)
+            with open(report_file_path, 'r', encoding='utf-8') as fd:
+                return [row['cache'] for row in csv.DictReader(fd)]
+
+        return run
+
+    @staticmethod
+    def test_dependency_changed(run_cache):
+        """Test with a copybook listed in the cache_files option, modified
+        between two executions.
+        """
+        shutil.rmtree('/tmp/oftools_compile_copybooks', ignore_errors=True)
+        os.mkdir('/tmp/oftools_compile_copybooks')
+        with open('/tmp/oftools_compile_copybooks/COPY1.cpy', 'w') as fd:
+            fd.write('01 FIELD PIC X.\n')
+
+        run_cache()
+        assert run_cache() == ['HIT']
+
+        with open('/tmp/oftools_compile_copybooks/COPY1.cpy', 'w') as fd:
+            fd.write('01 FIELD PIC XX.\n')
+
+        assert run_cache() == ['MISS']
+        assert run_cache() == ['HIT']
+
+        shutil.rmtree('/tmp/oftools_compile_copybooks')
+
+    @staticmethod
+    def test_environment_changed(run_cache):
+        """Test with an environment variable read by the compiler, changed
+        between two executions.
+        """
+        run_cache()
+        assert run_cache() == ['HIT']
+
+        # A new value each time, as the cache outlives the execution
+        Context().env['COBCPY'] = \
+            '/tmp/oftools_compile_test_cache_%f' % time.time()
+        try:
+            assert run_cache() == ['MISS']
+        finally:
+            del Context().env['COBCPY']
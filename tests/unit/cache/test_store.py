@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the Cache module.
+"""
+
+# Generic/Built-in modules
+import os
+import shutil
+import threading
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Cache import Cache
+
+
+class TestStore(object):
+    """Test cases for the method store.
+
+    Fixtures:
+        cache_directory
+
+    Tests:
+        test_same_key_threads
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def cache_directory(tmp_path, monkeypatch):
+        """Use a temporary cache directory.
+        """
+        path = str(tmp_path / 'cache')
+        monkeypatch.setattr(Cache(), '_get_cache_directory', lambda: path)
+        return path
+
+    @staticmethod
+    def test_same_key_threads(cache_directory, tmp_path, monkeypatch):
+        """Test with two threads of the same process storing the same key at the same time, as with the async and pipeline engines.
+        """
+        working_directory = tmp_path / 'workdir'
+        working_directory.mkdir()
+        (working_directory / 'SAMPLE1.so').write_text('module')
+        key = 'ab' * 32
+
+        # Both threads copy the files at the same time
+        barrier = threading.Barrier(2, timeout=2)
+        copy2 = shutil.copy2
+
+        def copy(source, destination):
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            return copy2(source, destination)
+
+        monkeypatch.setattr(shutil, 'copy2', copy)
+        threads = [
+            threading.Thread(target=Cache().store,
+                             args=(key, str(working_directory), {}))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        entry_directory = os.path.join(cache_directory, key[:2], key)
+        assert os.listdir(entry_directory) == ['SAMPLE1.so']
+        assert os.listdir(os.path.dirname(entry_directory)) == [key]
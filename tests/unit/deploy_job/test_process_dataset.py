@@ -4,6 +4,7 @@
 """
 
 # Generic/Built-in modules
+import csv
 import os
 import sys
 
@@ -22,6 +23,9 @@ class TestProcessDataset(object):
         shared
 
     Tests:
+        test_batch
+        test_batch_order
+        test_batch_superseded
         test_empty
         test_invalid_list
         test_multiple
@@ -45,6 +49,82 @@ class TestProcessDataset(object):
         pwd = os.getcwd() + '/tests/shared/'
         return pwd
 
+    @staticmethod
+    def test_batch(init_pwd, shared):
+        """Test with multiple datasets specified and the batch deploy mode,
+        the deploy commands being run at the end for all the source files.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/dataset_multi.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--deploy-mode', 'batch'])
+
+        assert Main().run() == 0
+
+    @staticmethod
+    def test_batch_order(init_pwd, shared):
+        """Test with the batch deploy mode and a source file without deploy
+        command after a source file with one, the report keeping the order of
+        the source files.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--redeploy')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/dataset_filter.prof'])
+        sys.argv.extend([
+            '--source',
+            shared + 'sources/SAMPLE2.cbl:' + shared + 'sources/SAMPLE1.cbl'
+        ])
+        sys.argv.extend(['--deploy-mode', 'batch'])
+        sys.argv.extend(['--tag', 'order'])
+
+        assert Main().run() == 0
+
+        report_directory = '/opt/tmaxapp/compile/report'
+        report_file_path = max(
+            (os.path.join(report_directory, file_name)
+             for file_name in os.listdir(report_directory)
+             if file_name.startswith('oftools_compile_order_')),
+            key=os.path.getmtime)
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.DictReader(fd))
+
+        assert [(row['source'], row['deploy']) for row in rows] == [
+            ('SAMPLE2.cbl', 'DEPLOYED'), ('SAMPLE1.cbl', '')
+        ]
+
+    @staticmethod
+    def test_batch_superseded(init_pwd, shared):
+        """Test with the batch deploy mode and the same source file twice, the
+        module being only deployed from the last one.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--redeploy')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/dataset_multi.prof'])
+        sys.argv.extend([
+            '--source',
+            shared + 'sources/SAMPLE1.cbl:' + shared + 'sources/SAMPLE1.cbl'
+        ])
+        sys.argv.extend(['--deploy-mode', 'batch'])
+        sys.argv.extend(['--tag', 'superseded'])
+
+        assert Main().run() == 0
+
+        report_directory = '/opt/tmaxapp/compile/report'
+        report_file_path = max(
+            (os.path.join(report_directory, file_name)
+             for file_name in os.listdir(report_directory)
+             if file_name.startswith('oftools_compile_superseded_')),
+            key=os.path.getmtime)
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.DictReader(fd))
+
+        assert [row['deploy'] for row in rows] == ['SUPERSEDED', 'DEPLOYED']
+
     @staticmethod
     def test_empty(init_pwd, shared):
         """Test with the dataset option empty.
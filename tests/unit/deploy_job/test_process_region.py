@@ -27,6 +27,7 @@ class TestProcessRegion(object):
         test_multiple
         test_not_exist
         test_one
+        test_unchanged
     """
 
     @staticmethod
@@ -110,3 +111,20 @@ class TestProcessRegion(object):
         sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
 
         assert Main().run() == 0
+
+    @staticmethod
+    def test_unchanged(init_pwd, shared):
+        """Test with one region specified, the second execution skipping the
+        deployment of the unchanged module unless redeploy is enabled.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/region_one.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+        assert Main().run() == 0
+
+        sys.argv.append('--redeploy')
+        assert Main().run() == 0
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""Handle some of the test cases for the Context module.
+"""Handle some of the test cases for the FileContext module.
 """
 
 # Generic/Built-in modules
@@ -30,7 +30,7 @@ class TestGetFilterFunction(object):
     def init_pwd():
         """Specify the absolute path to the current test directory.
         """
-        pwd = os.getcwd() + '/tests/unit/context/'
+        pwd = os.getcwd() + '/tests/unit/file_context/'
         return pwd
 
     @staticmethod
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the JobFactory module.
+"""
+
+# Generic/Built-in modules
+import os
+import shutil
+import sys
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Main import Main
+
+
+class TestCreate(object):
+    """Test cases for the method create.
+
+    Fixtures:
+        init_pwd
+        shared
+
+    Tests:
+        test_tool_not_found
+        test_tool_not_mandatory
+        test_tool_path
+        test_tool_path_variable
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def init_pwd():
+        """Specify the absolute path to the current test directory.
+        """
+        pwd = os.getcwd() + '/tests/unit/job_factory/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    def test_tool_not_found(init_pwd, shared):
+        """Test with a profile where the tool of a mandatory compile section does not exist.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/tool_not_found.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        with pytest.raises(SystemExit):
+            Main().run()
+
+    @staticmethod
+    def test_tool_not_mandatory(init_pwd, shared):
+        """Test with a profile where the tool of a compile section with a filter and not mandatory does not exist, which does not abort the program.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/tool_not_mandatory.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        Main().run()
+
+    @staticmethod
+    def test_tool_path(init_pwd, shared):
+        """Test with a profile where the PATH is modified in the setup section.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/tool_path.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+
+    @staticmethod
+    def test_tool_path_variable(init_pwd, shared):
+        """Test with a profile where the PATH is modified in the setup section using another variable of the profile.
+        """
+        shutil.rmtree('/tmp/oftools_compile_bin', ignore_errors=True)
+        os.mkdir('/tmp/oftools_compile_bin')
+        tool_path = '/tmp/oftools_compile_bin/oftools_compile_tool'
+        with open(tool_path, 'w') as fd:
+            fd.write('#!/bin/sh\nexit 0\n')
+        os.chmod(tool_path, 0o755)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/tool_path_variable.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        try:
+            assert Main().run() == 0
+        finally:
+            shutil.rmtree('/tmp/oftools_compile_bin')
@@ -4,7 +4,11 @@
 """
 
 # Generic/Built-in modules
+import csv
+import hashlib
 import os
+import shutil
+import sqlite3
 import sys
 
 # Third-party modules
@@ -19,11 +23,27 @@ class TestOptions(object):
 
     Fixtures:
         shared
+        read_report
+        serial_results
 
     Tests:
+        test_cache
+        test_engine_async
+        test_engine_pipeline
         test_help
+        test_history
+        test_jobs
+        test_jobs_value_error
         test_no_option
+        test_resume
+        test_resume_full_path
+        test_resume_old_report
+        test_resume_value_error
+        test_schedule_lpt
         test_tag
+        test_tmpfs
+        test_tmpfs_grouping
+        test_tmpfs_missing_clear
         test_version
     """
 
@@ -35,6 +55,92 @@ class TestOptions(object):
         pwd = os.getcwd() + '/tests/shared/'
         return pwd
 
+    @staticmethod
+    @pytest.fixture
+    def read_report():
+        """Read the records of the last report file with the given tag.
+        """
+
+        def read(tag):
+            report_directory = '/opt/tmaxapp/compile/report'
+            report_file_path = max(
+                (os.path.join(report_directory, file_name)
+                 for file_name in os.listdir(report_directory)
+                 if file_name.startswith('oftools_compile_%s_' % tag)),
+                key=os.path.getmtime)
+            with open(report_file_path, 'r', encoding='utf-8') as fd:
+                return list(csv.DictReader(fd))
+
+        return read
+
+    @staticmethod
+    @pytest.fixture
+    def serial_results(shared, read_report):
+        """Process the shared source files one after the other and return the
+        sorted source files and results of the report.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--tag', 'serial'])
+
+        assert Main().run() == 0
+
+        return sorted(
+            (row['source'], row['result']) for row in read_report('serial'))
+
+    @staticmethod
+    def test_cache(shared, read_report):
+        """Test with the cache option, the second execution restoring the
+        outputs of the compile sections from the cache.
+        """
+        for _ in range(2):
+            sys.argv = [sys.argv[0]]
+            sys.argv.append('--cache')
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+            sys.argv.extend(['--tag', 'cache'])
+
+            assert Main().run() == 0
+
+        assert [row['cache'] for row in read_report('cache')] == ['HIT']
+
+    @staticmethod
+    def test_engine_async(shared, read_report, serial_results):
+        """Test with the async engine, the commands of the source files being
+        run by an asyncio event loop, with the same results as a serial
+        execution.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--engine', 'async'])
+        sys.argv.extend(['--jobs', '2'])
+        sys.argv.extend(['--tag', 'async'])
+
+        assert Main().run() == 0
+        assert sorted((row['source'], row['result'])
+                      for row in read_report('async')) == serial_results
+
+    @staticmethod
+    def test_engine_pipeline(shared, read_report, serial_results):
+        """Test with the pipeline engine, the setup, compile and deploy stages
+        overlapping across the source files, with the same results as a
+        serial execution.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--engine', 'pipeline'])
+        sys.argv.extend(['--tag', 'pipeline'])
+
+        assert Main().run() == 0
+        assert sorted((row['source'], row['result'])
+                      for row in read_report('pipeline')) == serial_results
+
     @staticmethod
     def test_help():
         """Test with the help option.
@@ -45,6 +151,65 @@ class TestOptions(object):
         with pytest.raises(SystemExit):
             Main().run()
 
+    @staticmethod
+    def test_history(shared):
+        """Test with the history option, to record the execution in the
+        history database with the hash of the source file.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.append('--history')
+        sys.argv.extend(['--tag', 'history'])
+
+        assert Main().run() == 0
+
+        with open(shared + 'sources/SAMPLE1.cbl', 'rb') as fd:
+            digest = hashlib.sha256(fd.read()).hexdigest()
+        connection = sqlite3.connect(
+            '/opt/tmaxapp/compile/report/history.db')
+        try:
+            run_id, tag = connection.execute(
+                'SELECT id, tag FROM runs ORDER BY id DESC LIMIT 1').fetchone()
+            rows = connection.execute(
+                'SELECT name, result, digest FROM files WHERE run_id = ?',
+                (run_id,)).fetchall()
+        finally:
+            connection.close()
+
+        assert tag == 'history'
+        assert rows == [('SAMPLE1.cbl', 'SUCCESSFUL', digest)]
+
+    @staticmethod
+    def test_jobs(shared, read_report, serial_results):
+        """Test with the jobs option, to process the source files in parallel
+        with the same results as a serial execution.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--jobs', '2'])
+        sys.argv.extend(['--tag', 'jobs'])
+
+        assert Main().run() == 0
+        assert sorted((row['source'], row['result'])
+                      for row in read_report('jobs')) == serial_results
+
+    @staticmethod
+    def test_jobs_value_error(shared):
+        """Test with a number of jobs which is not a positive integer.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--jobs', '0'])
+
+        with pytest.raises(SystemExit):
+            Main().run()
+
     @staticmethod
     def test_no_option():
         """Test with no option to see help message output.
@@ -54,6 +219,152 @@ class TestOptions(object):
         with pytest.raises(SystemExit):
             Main().run()
 
+    @staticmethod
+    def test_resume(shared, read_report):
+        """Test with the resume option, to only process the source files not
+        successful in the report of an earlier execution.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.append('--history')
+        sys.argv.extend(['--tag', 'resume'])
+
+        assert Main().run() == 0
+
+        report_directory = '/opt/tmaxapp/compile/report'
+        report_file_path = max(
+            (os.path.join(report_directory, file_name)
+             for file_name in os.listdir(report_directory)
+             if file_name.startswith('oftools_compile_resume_')),
+            key=os.path.getmtime)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--resume', report_file_path])
+        sys.argv.extend(['--tag', 'resume'])
+
+        assert Main().run() == 0
+
+        # The records of the resumed execution are added to the same report
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.DictReader(fd))
+        assert [row['source'] for row in rows] == [
+            'SAMPLE1.cbl', 'SAMPLE2.cbl'
+        ]
+
+    @staticmethod
+    def test_resume_full_path(shared, tmp_path):
+        """Test with the resume option, a source file with the same name as a
+        successful one in another directory being processed.
+        """
+        source_directory = str(tmp_path)
+        shutil.copy(shared + 'sources/SAMPLE1.cbl', source_directory)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', source_directory + '/SAMPLE1.cbl'])
+        sys.argv.extend(['--tag', 'resume_path'])
+
+        assert Main().run() == 0
+
+        report_directory = '/opt/tmaxapp/compile/report'
+        report_file_path = max(
+            (os.path.join(report_directory, file_name)
+             for file_name in os.listdir(report_directory)
+             if file_name.startswith('oftools_compile_resume_path_')),
+            key=os.path.getmtime)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--resume', report_file_path])
+        sys.argv.extend(['--tag', 'resume_path'])
+
+        assert Main().run() == 0
+
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.DictReader(fd))
+        assert [row['source_path'] for row in rows] == [
+            source_directory + '/SAMPLE1.cbl', shared + 'sources/SAMPLE1.cbl'
+        ]
+
+    @staticmethod
+    def test_resume_old_report(shared, tmp_path):
+        """Test with the resume option, using a report file written without
+        the latest columns, which is rewritten with them.
+        """
+        report_file_path = str(
+            tmp_path / 'oftools_compile_old_20991231_000000.csv')
+        with open(report_file_path, 'w', encoding='utf-8') as fd:
+            fd.write('count,source,working_directory,result,return_code,'
+                     'section,time(s)\n')
+            fd.write('1,SAMPLE1.cbl,/opt/tmaxapp/compile/SAMPLE1.cbl,'
+                     'SUCCESSFUL,0,ofcob,0.1\n')
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--resume', report_file_path])
+
+        assert Main().run() == 0
+
+        with open(report_file_path, 'r', encoding='utf-8') as fd:
+            reader = csv.DictReader(fd)
+            rows = list(reader)
+        assert reader.fieldnames == [
+            'count', 'source', 'working_directory', 'result', 'return_code',
+            'section', 'time(s)', 'cache', 'deploy', 'source_path'
+        ]
+        assert [(row['source'], row['deploy'], row['source_path'])
+                for row in rows] == [
+                    ('SAMPLE1.cbl', '', ''),
+                    ('SAMPLE2.cbl', '', shared + 'sources/SAMPLE2.cbl')
+                ]
+
+    @staticmethod
+    def test_resume_value_error(shared):
+        """Test with the resume option, using a report file that does not
+        exist.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--resume', '/tmp/oftools_compile_missing.csv'])
+
+        with pytest.raises(SystemExit):
+            Main().run()
+
+    @staticmethod
+    def test_schedule_lpt(shared, read_report, tmp_path):
+        """Test with the schedule option, to process the longest source files
+        first, the largest one without elapsed time in the history.
+        """
+        source_directory = str(tmp_path)
+        shutil.copy(shared + 'sources/SAMPLE1.cbl',
+                    source_directory + '/LPT_SMALL.cbl')
+        with open(shared + 'sources/SAMPLE1.cbl', 'r') as fd:
+            content = fd.read()
+        with open(source_directory + '/LPT_LARGE.cbl', 'w') as fd:
+            fd.write(content + '      *\n' * 100)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', source_directory])
+        sys.argv.extend(['--jobs', '1'])
+        sys.argv.extend(['--schedule', 'lpt'])
+        sys.argv.extend(['--tag', 'lpt'])
+
+        assert Main().run() == 0
+        assert [row['source'] for row in read_report('lpt')] == [
+            'LPT_LARGE.cbl', 'LPT_SMALL.cbl'
+        ]
+
     @staticmethod
     def test_tag(shared):
         """Test with the tag option.
@@ -67,6 +378,49 @@ class TestOptions(object):
 
         assert Main().run() == 0
 
+    @staticmethod
+    def test_tmpfs(shared):
+        """Test with the tmpfs option, to create the working directories in
+        memory with the clear option.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--tmpfs', '/dev/shm'])
+
+        assert Main().run() == 0
+        assert not os.path.exists('/dev/shm/oftools_compile_%d' % os.getpid())
+
+    @staticmethod
+    def test_tmpfs_grouping(shared):
+        """Test with the tmpfs option used with the clear and grouping options,
+        which both remove the directory of the execution.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.append('--grouping')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources'])
+        sys.argv.extend(['--tmpfs', '/dev/shm'])
+
+        assert Main().run() == 0
+        assert not os.path.exists('/dev/shm/oftools_compile_%d' % os.getpid())
+
+    @staticmethod
+    def test_tmpfs_missing_clear(shared):
+        """Test with the tmpfs option used without the clear option.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.append('--tmpfs')
+
+        with pytest.raises(SystemExit):
+            Main().run()
+
     @staticmethod
     def test_version():
         """Test with the version option.
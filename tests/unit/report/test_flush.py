@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the Report module.
+"""
+
+# Generic/Built-in modules
+import csv
+import os
+import time
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Context import Context
+from ....oftools_compile.FileContext import FileContext
+from ....oftools_compile.Profile import Profile
+from ....oftools_compile.Report import Report
+
+
+class TestFlush(object):
+    """Test cases for the method flush.
+
+    Fixtures:
+        shared
+        profile
+        report
+
+    Tests:
+        test_interval
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def profile(shared):
+        """Read the default profile, before the root working directory is
+        replaced.
+        """
+        return Profile(shared + 'profiles/default_1.prof')
+
+    @staticmethod
+    @pytest.fixture
+    def report(profile, tmp_path, monkeypatch):
+        """Create a report in a temporary root working directory.
+        """
+        (tmp_path / 'report').mkdir()
+        monkeypatch.setattr(Context(), '_root_workdir', str(tmp_path))
+        monkeypatch.setattr(Context(), '_history', False)
+        report = Report(False)
+        yield report
+        report.close()
+
+    @staticmethod
+    def test_interval(shared, profile, report):
+        """Test with a record added and no other one after it, the record being written once the flush interval is over.
+        """
+        report._flush_interval = 0.1
+        file_path = shared + 'sources/SAMPLE1.cbl'
+
+        report.add_entry(file_path, 0, 1.0, FileContext(profile, file_path))
+
+        with open(Context().report_file_path, 'r', encoding='utf-8') as fd:
+            assert len(list(csv.reader(fd))) == 1
+
+        time.sleep(0.5)
+
+        with open(Context().report_file_path, 'r', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd))
+        assert len(rows) == 2
+        assert rows[1][1] == 'SAMPLE1.cbl'
@@ -7,6 +7,7 @@
 import glob
 import os
 import shutil
+import sqlite3
 import sys
 
 # Third-party modules
@@ -14,6 +15,7 @@ import pytest
 
 # Owned modules
 from ....oftools_compile.Main import Main
+from ....oftools_compile.WorkdirIndex import WorkdirIndex
 
 
 class TestProcessBackup(object):
@@ -27,6 +29,9 @@ class TestProcessBackup(object):
         test_2_duplicates
         test_5_duplicates
         test_empty
+        test_index
+        test_jobs
+        test_other_source
         test_value_error
     """
 
@@ -110,6 +115,106 @@ class TestProcessBackup(object):
         # ValueError
         assert Main().run() == 0
 
+    @staticmethod
+    def test_index(init_pwd, shared):
+        """Test with the backup value set to 4, and 5 compilation being executed,
+        the index of the working directories keeping track of the deleted ones.
+        """
+        pattern = '/opt/tmaxapp/compile/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        for _ in range(5):
+            sys.argv = [sys.argv[0]]
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(['--profile', init_pwd + 'profiles/backup.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+            sys.argv.extend(['--tag', 'index'])
+
+            assert Main().run() == 0
+
+        workdirs = glob.glob('/opt/tmaxapp/compile/SAMPLE1.cbl_index_*')
+        assert len(workdirs) == 4
+
+        connection = sqlite3.connect('/opt/tmaxapp/compile/report/workdirs.db')
+        try:
+            rows = connection.execute(
+                "SELECT path FROM workdirs WHERE name LIKE ?",
+                ('SAMPLE1.cbl_index_%',)).fetchall()
+        finally:
+            connection.close()
+
+        assert sorted(row[0] for row in rows) == sorted(workdirs)
+
+    @staticmethod
+    def test_jobs(init_pwd, shared):
+        """Test with the backup value set to 4, and 5 compilation being executed
+        by worker processes, the deletions starting once the workers are forked.
+        """
+        pattern = '/opt/tmaxapp/compile/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        for _ in range(5):
+            sys.argv = [sys.argv[0]]
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(['--profile', init_pwd + 'profiles/backup.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+            sys.argv.extend(['--tag', 'jobs'])
+            sys.argv.extend(['--jobs', '2'])
+
+            assert Main().run() == 0
+
+        assert len(glob.glob('/opt/tmaxapp/compile/SAMPLE1.cbl_jobs_*')) == 4
+
+    @staticmethod
+    def test_other_source(init_pwd, shared):
+        """Test with the backup value set to 4, the working directory of the
+        compiled source file with another tag being counted, and the one of a
+        source file whose name starts with the name of the compiled one being
+        kept.
+        """
+        pattern = '/opt/tmaxapp/compile/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/backup.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+        sys.argv.extend(['--tag', 'other'])
+
+        assert Main().run() == 0
+
+        other_tag_workdir = glob.glob('/opt/tmaxapp/compile/SAMPLE1.cbl_other_*')[0]
+        os.utime(other_tag_workdir, (0, 0))
+
+        other_workdir = '/opt/tmaxapp/compile/SAMPLE1.cbl.bak_test_20200101_000000'
+        os.mkdir(other_workdir)
+        os.utime(other_workdir, (0, 0))
+        WorkdirIndex().add(other_workdir)
+
+        for _ in range(5):
+            sys.argv = [sys.argv[0]]
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(['--profile', init_pwd + 'profiles/backup.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+            sys.argv.extend(['--tag', 'test'])
+
+            assert Main().run() == 0
+
+        assert os.path.isdir(other_workdir)
+        assert not os.path.isdir(other_tag_workdir)
+        assert len(glob.glob('/opt/tmaxapp/compile/SAMPLE1.cbl_test_*')) == 4
+
+        shutil.rmtree(other_workdir)
+
     @staticmethod
     @pytest.mark.xfail
     def test_value_error(init_pwd, shared):
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the SetupJob module.
+"""
+
+# Generic/Built-in modules
+import glob
+import os
+import shutil
+import sys
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Main import Main
+
+
+class TestProcessLayout(object):
+    """Test cases for the method _process_layout.
+
+    Fixtures:
+        init_pwd
+        shared
+
+    Tests:
+        test_hash
+        test_value_error
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def init_pwd():
+        """Specify the absolute path of the current test directory.
+        """
+        pwd = os.getcwd() + '/tests/unit/setup_job/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    def test_hash(init_pwd, shared):
+        """Test with the working directory created in a bucket directory of the root working directory.
+        """
+        pattern = '/opt/tmaxapp/compile/??/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/layout_hash.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+        assert len(glob.glob(pattern)) == 1
+
+    @staticmethod
+    def test_value_error(init_pwd, shared):
+        """Test with the layout value in the profile not being a supported layout.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/layout_value_error.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == -1
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the SetupJob module.
+"""
+
+# Generic/Built-in modules
+import glob
+import os
+import shutil
+import sys
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Main import Main
+
+
+class TestProcessQuota(object):
+    """Test cases for the method _process_quota.
+
+    Fixtures:
+        init_pwd
+        shared
+
+    Tests:
+        test_quota
+        test_value_error
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def init_pwd():
+        """Specify the absolute path of the current test directory.
+        """
+        pwd = os.getcwd() + '/tests/unit/setup_job/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    def test_quota(init_pwd, shared):
+        """Test with a quota exceeded by the previous working directories.
+        """
+        pattern = '/opt/tmaxapp/compile/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        for _ in range(2):
+            sys.argv = [sys.argv[0]]
+            sys.argv.extend(['--log-level', 'DEBUG'])
+            sys.argv.extend(['--profile', shared + 'profiles/default_1.prof'])
+            sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+            Main().run()
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/quota.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+        assert len([
+            item for item in glob.glob(pattern) if os.path.isdir(item)
+        ]) == 1
+
+    @staticmethod
+    def test_value_error(init_pwd, shared):
+        """Test with the quota value in the profile not being a size, raising the ValueError exception.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/quota_value_error.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == -1
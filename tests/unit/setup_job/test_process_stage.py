@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the SetupJob module.
+"""
+
+# Generic/Built-in modules
+import glob
+import os
+import shutil
+import sys
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.Main import Main
+
+
+class TestProcessStage(object):
+    """Test cases for the method _process_stage.
+
+    Fixtures:
+        init_pwd
+        shared
+
+    Tests:
+        test_link
+        test_value_error
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def init_pwd():
+        """Specify the absolute path of the current test directory.
+        """
+        pwd = os.getcwd() + '/tests/unit/setup_job/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    def test_link(init_pwd, shared):
+        """Test with the source file staged as a hard link in the working directory.
+        """
+        pattern = '/opt/tmaxapp/compile/SAMPLE1*'
+        for item in glob.glob(pattern):
+            if not os.path.isdir(item):
+                continue
+            shutil.rmtree(item)
+
+        sys.argv = [sys.argv[0]]
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(['--profile', init_pwd + 'profiles/stage_link.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == 0
+
+        # Hard links fall back to a copy across file systems
+        source_device = os.stat(shared + 'sources/SAMPLE1.cbl').st_dev
+        if source_device == os.stat('/opt/tmaxapp/compile').st_dev:
+            working_directory = glob.glob(pattern)[0]
+            assert os.path.samefile(shared + 'sources/SAMPLE1.cbl',
+                                    working_directory + '/SAMPLE1.cbl')
+
+    @staticmethod
+    def test_value_error(init_pwd, shared):
+        """Test with the stage value in the profile not being a supported method.
+        """
+        sys.argv = [sys.argv[0]]
+        sys.argv.append('--clear')
+        sys.argv.extend(['--log-level', 'DEBUG'])
+        sys.argv.extend(
+            ['--profile', init_pwd + 'profiles/stage_value_error.prof'])
+        sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
+
+        assert Main().run() == -1
@@ -34,7 +34,7 @@ class TestWorkingDirectory(object):
 
     @staticmethod
     def test_already_exist(shared):
-        """Test where the working directory for the given program already exists, so a new timestamp needs to be assigned.
+        """Test where the same program is processed twice in the same second, so the second working directory gets the next sequence number.
             """
         sys.argv = [sys.argv[0]]
         sys.argv.append('--clear')
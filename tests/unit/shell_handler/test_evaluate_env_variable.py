@@ -11,7 +11,10 @@ import sys
 import pytest
 
 # Owned modules
+from ....oftools_compile.FileContext import FileContext
+from ....oftools_compile.handlers.ShellHandler import ShellHandler
 from ....oftools_compile.Main import Main
+from ....oftools_compile.Profile import Profile
 
 
 class TestEvaluateEnvVariable(object):
@@ -21,6 +24,7 @@ class TestEvaluateEnvVariable(object):
         shared
 
     Tests:
+        test_file_context
         test_key_error
     """
 
@@ -32,6 +36,18 @@ class TestEvaluateEnvVariable(object):
         pwd = os.getcwd() + '/tests/shared/'
         return pwd
 
+    @staticmethod
+    def test_file_context(shared):
+        """Test with a variable of the profile, only defined in the environment of the file processing.
+        """
+        profile = Profile(shared + 'profiles/default_1.prof')
+        file_context = FileContext(profile, shared + 'sources/SAMPLE1.cbl')
+        file_context.add_env_variable('$OF_COMPILE_TEST_VARIABLE', 'value')
+
+        assert 'OF_COMPILE_TEST_VARIABLE' not in os.environ
+        assert ShellHandler().evaluate_env_variable(
+            'OF_COMPILE_TEST_VARIABLE', file_context.env) == 'value'
+
     @staticmethod
     @pytest.mark.xfail
     @pytest.mark.skip(reason='Test not currently supported')
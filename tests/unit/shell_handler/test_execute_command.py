@@ -11,6 +11,7 @@ import sys
 import pytest
 
 # Owned modules
+from ....oftools_compile.handlers.ShellHandler import ShellHandler
 from ....oftools_compile.Main import Main
 
 
@@ -23,6 +24,7 @@ class TestExecuteCommand(object):
     Tests:
         test_system_error
         test_called_process_error
+        test_relative_command
     """
 
     @staticmethod
@@ -58,3 +60,17 @@ class TestExecuteCommand(object):
         sys.argv.extend(['--source', shared + 'sources/SAMPLE1.cbl'])
 
         assert Main().run() == -1
+
+    @staticmethod
+    def test_relative_command(tmp_path):
+        """Test with a relative command, resolved in the directory where it is executed and not in the current directory of the process.
+        """
+        script_path = tmp_path / 'tool.sh'
+        script_path.write_text('#!/bin/sh\necho "$PWD"\n')
+        script_path.chmod(0o755)
+
+        stdout, _, return_code = ShellHandler().execute_command(
+            './tool.sh', 'test', cwd=str(tmp_path))
+
+        assert return_code == 0
+        assert stdout.strip() == str(tmp_path)
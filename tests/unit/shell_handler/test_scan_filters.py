@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Handle some of the test cases for the ShellHandler module.
+"""
+
+# Generic/Built-in modules
+import os
+import shutil
+
+# Third-party modules
+import pytest
+
+# Owned modules
+from ....oftools_compile.handlers.ShellHandler import ShellHandler
+
+
+class TestScanFilters(object):
+    """Test cases for the method scan_filters.
+
+    Fixtures:
+        shared
+        source
+
+    Tests:
+        test_line_break
+        test_line_break_group
+        test_line_break_mmap
+    """
+
+    @staticmethod
+    @pytest.fixture
+    def shared():
+        """Specify the absolute path of the shared directory.
+        """
+        pwd = os.getcwd() + '/tests/shared/'
+        return pwd
+
+    @staticmethod
+    @pytest.fixture
+    def source(shared, tmp_path):
+        """Copy the source file to a temporary directory, so that the results
+        of the filter cache are not reused between the tests.
+        """
+        path = str(tmp_path / 'SAMPLE1.cbl')
+        shutil.copy(shared + 'sources/SAMPLE1.cbl', path)
+        return path
+
+    @staticmethod
+    def test_line_break(source):
+        """Test with "re:" filter functions which would only match across a line break of the source file, combined with filter functions matching a single line.
+        """
+        functions = [
+            r're:DIVISION\.[^X]*PROGRAM-ID',
+            r're:EXEC\s+SQL',
+            r're:(?i)^\s+identification\s+division',
+            r're:PROGRAM-ID\.\s+SAMPLE\.$',
+        ]
+
+        results = ShellHandler().scan_filters(functions, source)
+
+        assert results == {
+            functions[0]: False,
+            functions[1]: False,
+            functions[2]: True,
+            functions[3]: True,
+        }
+
+    @staticmethod
+    def test_line_break_group(source):
+        """Test with a "re:" filter function with its own group, which would only match across a line break of the source file.
+        """
+        functions = [r're:DIVISION\.\s+(PROGRAM-ID)', r're:(DISPLAY)\s+"']
+
+        results = ShellHandler().scan_filters(functions, source)
+
+        assert results == {functions[0]: False, functions[1]: True}
+
+    @staticmethod
+    def test_line_break_mmap(source):
+        """Test with a source file large enough to be memory-mapped, where an expression only matches across a line break and another one only matches at the end of the file.
+        """
+        with open(source, 'a') as fd:
+            fd.write('      *' * (1024 * 1024 // 7) + '\n')
+            fd.write('       STOP RUN.\n')
+        functions = [r're:DIVISION\.\s+PROGRAM-ID', r're:STOP\s+RUN\.$']
+
+        results = ShellHandler().scan_filters(functions, source)
+
+        assert results == {functions[0]: False, functions[1]: True}